@@ -0,0 +1,4 @@
+"""
+Замеры производительности функций системы компьютерной алгебры (см.
+`python -m benchmarks --help`).
+"""
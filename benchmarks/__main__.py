@@ -0,0 +1,101 @@
+"""
+Запуск замеров: `python -m benchmarks [--scales ...] [--only ...]
+[--output FILE] [--compare FILE --threshold 0.25]`.
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.cases import CASES, SCALES
+from benchmarks.harness import DEFAULT_MIN_TIME, DEFAULT_THRESHOLD, compare, run
+from hestia.common.types import Identifier
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Замеры времени и памяти функций системы компьютерной алгебры",
+    )
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        choices=SCALES,
+        help="Масштабы операндов (по умолчанию — все)",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        metavar="NAME",
+        help="Замерять только указанные функции (названия или номера)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Начальное значение генератора аргументов"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=DEFAULT_MIN_TIME,
+        help=f"Минимальное время замера одной функции, с (по умолчанию {DEFAULT_MIN_TIME})",
+    )
+    parser.add_argument("-o", "--output", metavar="FILE", help="Сохранить результаты в JSON")
+    parser.add_argument(
+        "--compare",
+        metavar="FILE",
+        help="Сравнить с результатами из файла и завершиться с ошибкой при замедлении",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Допустимое относительное замедление (по умолчанию {DEFAULT_THRESHOLD})",
+    )
+    args = parser.parse_args(argv)
+    if args.only:
+        try:
+            args.only = [Identifier.from_str(name) for name in args.only]
+        except ValueError as e:
+            parser.error(f"неверный идентификатор функции: {e}")
+    return args
+
+
+def _report(record: dict) -> None:
+    line = (
+        f"{record['identifier']:<12} {record['scale']:<7} "
+        f"{record['time'] * 1e3:12.3f} мс {record['peak_memory'] / 1024:10.1f} КиБ"
+    )
+    if record.get("baseline_ratio") is not None:
+        line += f"  x{record['baseline_ratio']:.1f} к int/Fraction"
+    print(line, file=sys.stderr, flush=True)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    missing = set(Identifier) - set(CASES)
+    if missing:
+        names = ", ".join(sorted(i.name for i in missing))
+        print(f"Нет замеров для функций: {names}", file=sys.stderr)
+        return 2
+
+    results = run(args.only, args.scales, args.seed, args.min_time, _report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    else:
+        json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        regressions = compare(results, previous, args.threshold)
+        for regression in regressions:
+            print(f"Замедление: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,346 @@
+"""
+Описание замеров: для каждого идентификатора функции — генератор аргументов
+заданного масштаба и (если есть) эталонная реализация на `int` и
+`fractions.Fraction`.
+"""
+
+import math
+import random
+from fractions import Fraction
+from typing import Any, Callable, NamedTuple
+
+from hestia.common.types import Identifier
+from hestia.integer import Integer
+from hestia.natural import NaturalNumber
+from hestia.polynomial import Polynomial
+from hestia.rational import RationalNumber
+
+
+class Scale(NamedTuple):
+    """
+    Масштаб операндов.
+
+    :param digits: число десятичных цифр чисел
+    :param degree: степень многочленов
+    :param height: число цифр коэффициентов многочленов
+    """
+
+    digits: int
+    degree: int
+    height: int
+
+
+SCALES: dict[str, Scale] = {
+    "small": Scale(digits=20, degree=4, height=3),
+    "medium": Scale(digits=100, degree=8, height=8),
+    "large": Scale(digits=400, degree=16, height=20),
+}
+
+
+class Case(NamedTuple):
+    """
+    Замер одной функции.
+
+    `make` по генератору случайных чисел и масштабу возвращает аргументы
+    функции, `baseline` — та же операция над `int`/`Fraction` (аргументы
+    преобразуются функцией `to_baseline`).
+    """
+
+    make: Callable[[random.Random, Scale], tuple]
+    baseline: Callable[..., Any] | None = None
+
+
+def natural(rng: random.Random, digits: int) -> NaturalNumber:
+    """Случайное натуральное число из digits цифр"""
+    digits = max(1, digits)
+    return NaturalNumber(rng.randrange(10 ** (digits - 1), 10**digits))
+
+
+def integer(rng: random.Random, digits: int) -> Integer:
+    """Случайное целое число из digits цифр со случайным знаком"""
+    return Integer(sign=rng.randrange(2), natural=natural(rng, digits))
+
+
+def rational(rng: random.Random, digits: int) -> RationalNumber:
+    """Случайная дробь с числителем и знаменателем из digits цифр"""
+    return RationalNumber(integer(rng, digits), natural(rng, digits))
+
+
+def polynomial(rng: random.Random, degree: int, height: int) -> Polynomial:
+    """
+    Случайный многочлен степени degree: коэффициенты — дроби с числителем из
+    height цифр и однозначным знаменателем.
+    """
+    return Polynomial(
+        [
+            RationalNumber(integer(rng, height), NaturalNumber(rng.randrange(1, 10)))
+            for _ in range(degree + 1)
+        ]
+    )
+
+
+def integer_polynomial(rng: random.Random, degree: int, height: int) -> Polynomial:
+    """Случайный многочлен степени degree с целыми коэффициентами"""
+    return Polynomial([integer(rng, height) for _ in range(degree + 1)])
+
+
+def to_baseline(value: Any) -> Any:
+    """
+    Представление аргумента для эталонной реализации: натуральные и целые
+    числа — `int`, дроби — `Fraction`, многочлены — список `Fraction`.
+    """
+    if isinstance(value, (NaturalNumber, Integer)):
+        return int(value)
+    if isinstance(value, RationalNumber):
+        return Fraction(int(value.numerator), int(value.denominator))
+    if isinstance(value, Polynomial):
+        return [to_baseline(coef) for coef in value.coefficients]
+    return value
+
+
+def _poly_add(a: list, b: list) -> list:
+    n = max(len(a), len(b))
+    a, b = a + [0] * (n - len(a)), b + [0] * (n - len(b))
+    return [x + y for x, y in zip(a, b)]
+
+
+def _poly_mul(a: list, b: list) -> list:
+    result = [Fraction(0)] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            result[i + j] += x * y
+    return result
+
+
+def _poly_divmod(a: list, b: list) -> tuple[list, list]:
+    a = list(a)
+    q = [Fraction(0)] * max(1, len(a) - len(b) + 1)
+    while len(a) >= len(b):
+        c = a[-1] / b[-1]
+        shift = len(a) - len(b)
+        q[shift] = c
+        for i, y in enumerate(b):
+            a[shift + i] -= c * y
+        a.pop()
+    return q, a
+
+
+def _poly_gcd(a: list, b: list) -> list:
+    while any(b):
+        _, r = _poly_divmod(a, b)
+        while r and r[-1] == 0:
+            r.pop()
+        a, b = b, r or [0]
+    return a
+
+
+CASES: dict[Identifier, Case] = {
+    Identifier.COM_NN_D: Case(
+        lambda r, s: (natural(r, s.digits), natural(r, s.digits)),
+        lambda a, b: (a > b) - (a < b),
+    ),
+    Identifier.NZER_N_B: Case(lambda r, s: (natural(r, s.digits),), lambda a: a != 0),
+    Identifier.ADD_1N_N: Case(lambda r, s: (natural(r, s.digits),), lambda a: a + 1),
+    Identifier.ADD_NN_N: Case(
+        lambda r, s: (natural(r, s.digits), natural(r, s.digits)), lambda a, b: a + b
+    ),
+    Identifier.SUB_NN_N: Case(
+        lambda r, s: (natural(r, s.digits + 1), natural(r, s.digits)), lambda a, b: a - b
+    ),
+    Identifier.MUL_ND_N: Case(lambda r, s: (natural(r, s.digits), 7), lambda a, d: a * d),
+    Identifier.MUL_Nk_N: Case(
+        lambda r, s: (natural(r, s.digits), s.digits), lambda a, k: a * 10**k
+    ),
+    Identifier.MUL_NN_N: Case(
+        lambda r, s: (natural(r, s.digits), natural(r, s.digits)), lambda a, b: a * b
+    ),
+    Identifier.SUB_NDN_N: Case(
+        lambda r, s: (natural(r, s.digits + 1), natural(r, s.digits), 3),
+        lambda a, b, d: a - b * d,
+    ),
+    Identifier.DIV_NN_Dk: Case(
+        lambda r, s: (natural(r, 2 * s.digits), natural(r, s.digits)),
+    ),
+    Identifier.DIV_NN_N: Case(
+        lambda r, s: (natural(r, 2 * s.digits), natural(r, s.digits)), lambda a, b: a // b
+    ),
+    Identifier.MOD_NN_N: Case(
+        lambda r, s: (natural(r, 2 * s.digits), natural(r, s.digits)), lambda a, b: a % b
+    ),
+    Identifier.GCF_NN_N: Case(
+        lambda r, s: (natural(r, s.digits), natural(r, s.digits)), math.gcd
+    ),
+    Identifier.LCM_NN_N: Case(
+        lambda r, s: (natural(r, s.digits), natural(r, s.digits)), math.lcm
+    ),
+    Identifier.POW_Nk_N: Case(
+        lambda r, s: (natural(r, max(1, s.digits // 10)), 10), lambda a, k: a**k
+    ),
+    Identifier.POWM_NNN_N: Case(
+        lambda r, s: (
+            natural(r, min(s.digits, 50)),
+            natural(r, min(s.digits, 20)),
+            natural(r, min(s.digits, 50)),
+        ),
+        pow,
+    ),
+    Identifier.SQRT_N_N: Case(
+        lambda r, s: (natural(r, s.digits),), math.isqrt
+    ),
+    Identifier.ROOT_Nk_N: Case(lambda r, s: (natural(r, s.digits), 3)),
+    Identifier.PRIME_N_B: Case(lambda r, s: (natural(r, s.digits),)),
+    Identifier.PRIMES_N_N: Case(lambda r, s: (NaturalNumber(50 * s.digits),)),
+    Identifier.FACT_N_N: Case(
+        lambda r, s: (NaturalNumber(5 * s.digits),), math.factorial
+    ),
+    Identifier.BINOM_NN_N: Case(
+        lambda r, s: (NaturalNumber(10 * s.digits), NaturalNumber(5 * s.digits)),
+        math.comb,
+    ),
+    Identifier.ABS_Z_N: Case(lambda r, s: (integer(r, s.digits),), abs),
+    Identifier.POZ_Z_D: Case(
+        lambda r, s: (integer(r, s.digits),), lambda a: (a > 0) - (a < 0)
+    ),
+    Identifier.MUL_ZM_Z: Case(lambda r, s: (integer(r, s.digits),), lambda a: -a),
+    Identifier.TRANS_N_Z: Case(lambda r, s: (natural(r, s.digits),), lambda a: a),
+    Identifier.TRANS_Z_N: Case(
+        lambda r, s: (Integer(sign=0, natural=natural(r, s.digits)),), lambda a: a
+    ),
+    Identifier.ADD_ZZ_Z: Case(
+        lambda r, s: (integer(r, s.digits), integer(r, s.digits)), lambda a, b: a + b
+    ),
+    Identifier.SUB_ZZ_Z: Case(
+        lambda r, s: (integer(r, s.digits), integer(r, s.digits)), lambda a, b: a - b
+    ),
+    Identifier.MUL_ZZ_Z: Case(
+        lambda r, s: (integer(r, s.digits), integer(r, s.digits)), lambda a, b: a * b
+    ),
+    Identifier.DIV_ZZ_Z: Case(
+        lambda r, s: (integer(r, 2 * s.digits), integer(r, s.digits)), lambda a, b: a // b
+    ),
+    Identifier.MOD_ZZ_Z: Case(
+        lambda r, s: (integer(r, 2 * s.digits), integer(r, s.digits)), lambda a, b: a % b
+    ),
+    Identifier.POW_Zk_Z: Case(
+        lambda r, s: (integer(r, max(1, s.digits // 10)), 10), lambda a, k: a**k
+    ),
+    Identifier.RED_Q_Q: Case(lambda r, s: (rational(r, s.digits),), Fraction),
+    Identifier.INT_Q_B: Case(
+        lambda r, s: (rational(r, s.digits),), lambda a: a.denominator == 1
+    ),
+    Identifier.TRANS_Z_Q: Case(lambda r, s: (integer(r, s.digits),), Fraction),
+    Identifier.TRANS_Q_Z: Case(
+        lambda r, s: (RationalNumber(integer(r, s.digits), NaturalNumber(1)),), int
+    ),
+    Identifier.ADD_QQ_Q: Case(
+        lambda r, s: (rational(r, s.digits), rational(r, s.digits)), lambda a, b: a + b
+    ),
+    Identifier.SUB_QQ_Q: Case(
+        lambda r, s: (rational(r, s.digits), rational(r, s.digits)), lambda a, b: a - b
+    ),
+    Identifier.MUL_QQ_Q: Case(
+        lambda r, s: (rational(r, s.digits), rational(r, s.digits)), lambda a, b: a * b
+    ),
+    Identifier.DIV_QQ_Q: Case(
+        lambda r, s: (rational(r, s.digits), rational(r, s.digits)), lambda a, b: a / b
+    ),
+    Identifier.POW_Qk_Q: Case(
+        lambda r, s: (rational(r, max(1, s.digits // 10)), 10), lambda a, k: a**k
+    ),
+    Identifier.ADD_PP_P: Case(
+        lambda r, s: (
+            polynomial(r, s.degree, s.height),
+            polynomial(r, s.degree, s.height),
+        ),
+        _poly_add,
+    ),
+    Identifier.SUB_PP_P: Case(
+        lambda r, s: (
+            polynomial(r, s.degree, s.height),
+            polynomial(r, s.degree, s.height),
+        ),
+        lambda a, b: _poly_add(a, [-y for y in b]),
+    ),
+    Identifier.MUL_PQ_P: Case(
+        lambda r, s: (polynomial(r, s.degree, s.height), rational(r, s.height)),
+        lambda a, q: [x * q for x in a],
+    ),
+    Identifier.MUL_Pxk_P: Case(
+        lambda r, s: (polynomial(r, s.degree, s.height), s.degree),
+        lambda a, k: [Fraction(0)] * k + a,
+    ),
+    Identifier.LED_P_Q: Case(
+        lambda r, s: (polynomial(r, s.degree, s.height),), lambda a: a[-1]
+    ),
+    Identifier.DEG_P_N: Case(
+        lambda r, s: (polynomial(r, s.degree, s.height),), lambda a: len(a) - 1
+    ),
+    Identifier.FAC_P_Q: Case(lambda r, s: (polynomial(r, s.degree, s.height),)),
+    Identifier.MUL_PP_P: Case(
+        lambda r, s: (
+            polynomial(r, s.degree, s.height),
+            polynomial(r, s.degree, s.height),
+        ),
+        _poly_mul,
+    ),
+    Identifier.DIV_PP_P: Case(
+        lambda r, s: (
+            polynomial(r, 2 * s.degree, s.height),
+            polynomial(r, s.degree, s.height),
+        ),
+        lambda a, b: _poly_divmod(a, b)[0],
+    ),
+    Identifier.MOD_PP_P: Case(
+        lambda r, s: (
+            polynomial(r, 2 * s.degree, s.height),
+            polynomial(r, s.degree, s.height),
+        ),
+        lambda a, b: _poly_divmod(a, b)[1],
+    ),
+    Identifier.GCF_PP_P: Case(
+        lambda r, s: (
+            polynomial(r, s.degree, s.height),
+            polynomial(r, s.degree, s.height),
+        ),
+        _poly_gcd,
+    ),
+    Identifier.DER_P_P: Case(
+        lambda r, s: (polynomial(r, s.degree, s.height),),
+        lambda a: [i * x for i, x in enumerate(a)][1:],
+    ),
+    Identifier.NMR_P_P: Case(lambda r, s: (polynomial(r, s.degree, s.height),)),
+    Identifier.FCT_P_P: Case(
+        lambda r, s: (integer_polynomial(r, s.degree, s.height),)
+    ),
+    Identifier.RRT_P_Q: Case(
+        lambda r, s: (integer_polynomial(r, s.degree, s.height),)
+    ),
+    Identifier.ISO_P_I: Case(
+        lambda r, s: (integer_polynomial(r, s.degree, s.height),)
+    ),
+    Identifier.RES_PP_Q: Case(
+        lambda r, s: (
+            polynomial(r, s.degree, s.height),
+            polynomial(r, s.degree, s.height),
+        )
+    ),
+    Identifier.DSC_P_Q: Case(lambda r, s: (polynomial(r, s.degree, s.height),)),
+    Identifier.SRS_PP_P: Case(
+        lambda r, s: (
+            polynomial(r, s.degree, s.height),
+            polynomial(r, s.degree, s.height),
+        )
+    ),
+    Identifier.CMP_PP_P: Case(
+        lambda r, s: (
+            polynomial(r, s.degree, s.height),
+            polynomial(r, max(1, s.degree // 4), s.height),
+        )
+    ),
+    Identifier.SHF_PQ_P: Case(
+        lambda r, s: (polynomial(r, s.degree, s.height), rational(r, s.height))
+    ),
+    Identifier.POW_Pk_P: Case(
+        lambda r, s: (polynomial(r, max(1, s.degree // 4), s.height), 4)
+    ),
+}
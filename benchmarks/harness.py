@@ -0,0 +1,172 @@
+"""
+Выполнение замеров, сохранение результатов в JSON и сравнение с
+сохранёнными ранее результатами.
+"""
+
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Iterable
+
+from benchmarks.cases import CASES, SCALES, Case, Scale, to_baseline
+from hestia.app.runner import build_module_group
+from hestia.common.module_group import ModuleGroup
+from hestia.common.types import Identifier
+
+RESULTS_VERSION = 1
+DEFAULT_MIN_TIME = 0.2
+DEFAULT_MAX_REPEATS = 1000
+DEFAULT_THRESHOLD = 0.25
+
+
+def measure_time(
+    call: Callable[[], Any],
+    min_time: float = DEFAULT_MIN_TIME,
+    max_repeats: int = DEFAULT_MAX_REPEATS,
+) -> float:
+    """
+    Медианное время одного вызова. Вызов повторяется, пока суммарное время
+    не превысит min_time (но не более max_repeats раз и не менее 3 раз).
+
+    :param call: замеряемая функция
+    :param min_time: минимальное суммарное время замера в секундах
+    :param max_repeats: максимальное число повторений
+    :returns: время в секундах
+    """
+    times = []
+    total = 0.0
+    while len(times) < 3 or (total < min_time and len(times) < max_repeats):
+        start = time.perf_counter()
+        call()
+        elapsed = time.perf_counter() - start
+        times.append(elapsed)
+        total += elapsed
+    return statistics.median(times)
+
+
+def measure_peak_memory(call: Callable[[], Any]) -> int:
+    """
+    Пиковый объём памяти, выделенной за один вызов (по данным tracemalloc).
+
+    :param call: замеряемая функция
+    :returns: объём в байтах
+    """
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_case(
+    group: ModuleGroup,
+    identifier: Identifier,
+    case: Case,
+    scale_name: str,
+    scale: Scale,
+    seed: int = 0,
+    min_time: float = DEFAULT_MIN_TIME,
+) -> dict[str, Any]:
+    """
+    Замеряет одну функцию на одном масштабе.
+
+    :returns: запись результата (время, пиковая память, время эталона)
+    """
+    args = case.make(random.Random(seed), scale)
+    result: dict[str, Any] = {
+        "identifier": identifier.name,
+        "number": identifier.value,
+        "scale": scale_name,
+        "size": scale._asdict(),
+    }
+
+    # Аргументы используются повторно, поэтому кэши характеристик многочленов
+    # (`Polynomial.cached`) сбрасываются, чтобы замерялось вычисление
+    invalidators = [arg.invalidate for arg in args if hasattr(arg, "invalidate")]
+
+    def call() -> Any:
+        for invalidate in invalidators:
+            invalidate()
+        return group.invoke(identifier, *args)
+
+    result["time"] = measure_time(call, min_time)
+    result["peak_memory"] = measure_peak_memory(call)
+
+    if case.baseline is not None:
+        baseline_args = [to_baseline(arg) for arg in args]
+        baseline_time = measure_time(lambda: case.baseline(*baseline_args), min_time)
+        result["baseline_time"] = baseline_time
+        result["baseline_ratio"] = result["time"] / baseline_time if baseline_time else None
+    return result
+
+
+def run(
+    identifiers: Iterable[Identifier] | None = None,
+    scales: Iterable[str] | None = None,
+    seed: int = 0,
+    min_time: float = DEFAULT_MIN_TIME,
+    progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Выполняет замеры.
+
+    :param identifiers: замеряемые функции (по умолчанию — все)
+    :param scales: названия масштабов из `SCALES` (по умолчанию — все)
+    :param seed: начальное значение генератора случайных аргументов
+    :param min_time: минимальное суммарное время замера одной функции
+    :param progress: функция, вызываемая после каждого замера
+    :returns: результаты в виде, пригодном для сохранения в JSON
+    """
+    group = build_module_group()
+    results = []
+    for scale_name in scales or SCALES:
+        for identifier in identifiers or CASES:
+            record = run_case(
+                group,
+                identifier,
+                CASES[identifier],
+                scale_name,
+                SCALES[scale_name],
+                seed,
+                min_time,
+            )
+            results.append(record)
+            if progress is not None:
+                progress(record)
+    return {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": seed,
+        "results": results,
+    }
+
+
+def compare(
+    current: dict[str, Any], previous: dict[str, Any], threshold: float
+) -> list[str]:
+    """
+    Сравнивает результаты с сохранёнными ранее.
+
+    :param current: текущие результаты
+    :param previous: сохранённые результаты
+    :param threshold: допустимое относительное замедление (0.25 — 25%)
+    :returns: описания замедлений, превысивших порог
+    """
+    old = {(r["identifier"], r["scale"]): r for r in previous["results"]}
+    regressions = []
+    for record in current["results"]:
+        before = old.get((record["identifier"], record["scale"]))
+        if before is None or not before["time"]:
+            continue
+        ratio = record["time"] / before["time"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{record['identifier']} [{record['scale']}]: "
+                f"{before['time']:.3g} с -> {record['time']:.3g} с (x{ratio:.2f})"
+            )
+    return regressions
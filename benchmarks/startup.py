@@ -0,0 +1,111 @@
+"""
+Замер времени запуска: `python -m benchmarks.startup [--runs N] [--budget MS]`.
+
+Команда `hestia -f N-1 --args 1 2` запускается несколько раз в отдельных
+процессах; медианное время сравнивается с временем запуска пустого
+интерпретатора. Запуск считается неудачным (код возврата 1), если разница
+больше бюджета или если простой вызов импортировал модули, которые ему не
+нужны (модули рациональных чисел и многочленов, пакетный режим, argparse).
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+COMMAND = ["-m", "hestia.main", "-f", "N-1", "--args", "1", "2"]
+DEFAULT_RUNS = 15
+DEFAULT_BUDGET_MS = 100.0
+
+# Модули, которые не должны загружаться при вызове функции натуральных чисел
+FORBIDDEN_MODULES = (
+    "hestia.rational",
+    "hestia.polynomial",
+    "hestia.app.batch",
+    "hestia.app.cache",
+    "concurrent.futures",
+    "multiprocessing",
+    "argparse",
+    "decimal",
+    "fractions",
+    "json",
+    "numpy",
+)
+
+
+def measure(args: list[str], runs: int) -> float:
+    """
+    Медианное время запуска интерпретатора с аргументами args.
+
+    :param args: аргументы интерпретатора
+    :param runs: число запусков
+    :returns: время в секундах
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def imported_modules(args: list[str]) -> list[str]:
+    """
+    Модули, импортированные при запуске (по выводу `-X importtime`).
+
+    :param args: аргументы интерпретатора
+    :returns: имена модулей в порядке импорта
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return [
+        line.rpartition("|")[2].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    ]
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="Замер времени запуска hestia для простого вызова",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=DEFAULT_RUNS, help="Число запусков"
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="Допустимое время сверх запуска пустого интерпретатора, мс "
+        f"(по умолчанию {DEFAULT_BUDGET_MS:g})",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = measure(["-c", "pass"], args.runs)
+    startup = measure(COMMAND, args.runs)
+    overhead = (startup - baseline) * 1e3
+    print(f"python -c pass:      {baseline * 1e3:8.1f} мс")
+    print(f"hestia -f N-1 ...:   {startup * 1e3:8.1f} мс (+{overhead:.1f} мс)")
+
+    status = 0
+    if overhead > args.budget:
+        print(f"Превышен бюджет запуска: {args.budget:g} мс", file=sys.stderr)
+        status = 1
+
+    modules = set(imported_modules(COMMAND))
+    extra = [m for m in FORBIDDEN_MODULES if m in modules]
+    if extra:
+        print(f"Лишние импорты при запуске: {', '.join(extra)}", file=sys.stderr)
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,3 @@
+"""
+Логика приложения: запуск функций модулей, пакетный режим и т.п.
+"""
@@ -0,0 +1,278 @@
+"""
+Пакетный режим: вызов многих функций в одном процессе.
+
+Каждая строка входа имеет вид `IDENT arg1 arg2 ...`; аргументы разделяются
+пробелами, аргументы с пробелами заключаются в кавычки (как в командной
+оболочке). Пустые строки и строки, начинающиеся с `#`, пропускаются.
+Результаты выводятся построчно по мере вычисления, по одной строке на
+каждый вызов.
+
+Вызовы можно распределить между несколькими процессами (`run_batch_parallel`):
+вход делится на блоки по несколько строк, блоки выполняются пулом процессов,
+а результаты выводятся в порядке входных строк.
+"""
+
+import shlex
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Any, Iterable, Iterator, TextIO
+
+from hestia.app import worker
+from hestia.app.runner import CallError, ExitCode, execute, write_result
+from hestia.common.limits import Limits
+from hestia.common.types import Module
+
+CHUNK_SIZE = 16
+
+# Результат обработки строки: (номер строки, результат, ошибка). Результат
+# хранится в виде значения модуля и форматируется только при выводе; для
+# пропущенных строк он равен None.
+LineResult = tuple[int, Any, CallError | None]
+
+
+def parse_line(line: str) -> list[str] | None:
+    """
+    Разбирает строку пакетного входа.
+
+    :param line: строка
+    :returns: список из идентификатора и аргументов или None, если строку
+        следует пропустить
+    :raises CallError: если строку не удалось разобрать
+    """
+    stripped = line.strip()
+    if not stripped or stripped.startswith("#"):
+        return None
+    try:
+        return shlex.split(stripped)
+    except ValueError as e:
+        raise CallError(f"Не удалось разобрать строку: {e}", ExitCode.INVALID_ARGS)
+
+
+def process_line(
+    module_group: Module,
+    number: int,
+    line: str,
+    radix: int = 10,
+    limits: Limits | None = None,
+) -> LineResult:
+    """
+    Выполняет вызов из одной строки пакетного входа. Любая ошибка вызова
+    возвращается как значение и не прерывает обработку остальных строк.
+
+    :param module_group: группа модулей
+    :param number: номер строки
+    :param line: строка
+    :param radix: система счисления натуральных и целых аргументов
+    :param limits: ограничения времени и размера операндов вызова
+    :returns: тройка (номер строки, результат, ошибка)
+    """
+    try:
+        tokens = parse_line(line)
+        if tokens is None:
+            return number, None, None
+        result = execute(module_group, tokens[0], tokens[1:], radix, limits)
+        return number, result, None
+    except CallError as e:
+        return number, "", e
+    except Exception as e:
+        return number, "", CallError(
+            f"Внутренняя ошибка: {type(e).__name__}: {e}", ExitCode.INTERNAL_ERROR
+        )
+
+
+def _write(
+    result: LineResult, out: TextIO, err: TextIO, status: int, radix: int = 10
+) -> int:
+    """
+    Выводит результат обработки строки (большие значения — по частям).
+
+    :returns: обновлённый код возврата
+    """
+    number, output, error = result
+    if output is None:
+        return status
+    if error is not None:
+        print(f"{number}: {error.message}", file=err, flush=True)
+        status = status or error.code
+    write_result(out, output, radix)
+    out.write("\n")
+    out.flush()
+    return status
+
+
+def run_batch(
+    module_group: Module,
+    lines: Iterable[str],
+    out: TextIO,
+    err: TextIO,
+    radix: int = 10,
+    limits: Limits | None = None,
+) -> int:
+    """
+    Выполняет вызовы из строк lines и выводит результаты в out.
+
+    Ошибка в одной строке не прерывает обработку: сообщение с номером строки
+    выводится в err, а в out выводится пустая строка, чтобы i-я строка
+    вывода соответствовала i-му вызову.
+
+    :param module_group: группа модулей (создаётся один раз на весь пакет)
+    :param lines: строки входа
+    :param out: поток для результатов
+    :param err: поток для сообщений об ошибках
+    :param radix: система счисления натуральных и целых чисел
+    :param limits: ограничения времени и размера операндов каждого вызова
+    :returns: код возврата — 0 или код первой возникшей ошибки
+    """
+    status = 0
+    for number, line in enumerate(lines, start=1):
+        result = process_line(module_group, number, line, radix, limits)
+        status = _write(result, out, err, status, radix)
+    return status
+
+
+def _run_chunk(
+    chunk: list[tuple[int, str]], radix: int = 10, limits: Limits | None = None
+) -> list[LineResult]:
+    """Выполняет блок строк в процессе пула"""
+    group = worker.module_group()
+    return [
+        process_line(group, number, line, radix, limits) for number, line in chunk
+    ]
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[list[tuple[int, str]]]:
+    """Делит пронумерованные строки на блоки по size строк"""
+    numbered = enumerate(lines, start=1)
+    while chunk := list(islice(numbered, size)):
+        yield chunk
+
+
+def _run_alone(
+    chunk: list[tuple[int, str]],
+    cache_size: int,
+    radix: int,
+    limits: Limits | None,
+) -> list[LineResult]:
+    """
+    Выполняет блок строк в отдельном процессе.
+
+    :raises BrokenProcessPool: если процесс аварийно завершился
+    """
+    with ProcessPoolExecutor(
+        1, initializer=worker.init_worker, initargs=(cache_size,)
+    ) as executor:
+        return executor.submit(_run_chunk, chunk, radix, limits).result()
+
+
+def _run_isolated(
+    chunk: list[tuple[int, str]],
+    cache_size: int = 0,
+    radix: int = 10,
+    limits: Limits | None = None,
+) -> list[LineResult]:
+    """
+    Повторяет блок строк, выполнение которого прервал сбой пула. Блок
+    выполняется в отдельном процессе; если процесс снова аварийно
+    завершается, каждая строка блока выполняется в собственном процессе, и
+    ошибкой считаются только строки, аварийно завершающие процесс сами.
+
+    :returns: результаты строк блока
+    """
+    try:
+        return _run_alone(chunk, cache_size, radix, limits)
+    except BrokenProcessPool:
+        pass
+    results = []
+    for number, line in chunk:
+        try:
+            results += _run_alone([(number, line)], cache_size, radix, limits)
+        except BrokenProcessPool:
+            error = CallError(
+                "Процесс-обработчик аварийно завершился", ExitCode.INTERNAL_ERROR
+            )
+            results.append((number, "", error))
+    return results
+
+
+def run_batch_parallel(
+    lines: Iterable[str],
+    jobs: int,
+    out: TextIO,
+    err: TextIO,
+    chunk_size: int = CHUNK_SIZE,
+    cache_size: int = 0,
+    radix: int = 10,
+    limits: Limits | None = None,
+) -> int:
+    """
+    Выполняет вызовы из строк lines в пуле из jobs процессов.
+
+    Блоки строк отправляются в пул по мере чтения входа, но в обработке
+    одновременно находится не более 2 * jobs блоков, поэтому вход не
+    читается целиком в память. Результаты выводятся в порядке входных строк
+    в том же формате, что и в `run_batch`. Если процесс пула аварийно
+    завершился, пул создаётся заново, а блоки, не успевшие выполниться,
+    повторяются по отдельности: ошибкой считаются только строки, которые
+    аварийно завершают процесс сами.
+
+    :param lines: строки входа
+    :param jobs: число процессов
+    :param out: поток для результатов
+    :param err: поток для сообщений об ошибках
+    :param chunk_size: число строк в блоке
+    :param cache_size: размер кэша результатов каждого процесса (0 — без кэша)
+    :param radix: система счисления натуральных и целых чисел
+    :param limits: ограничения времени и размера операндов каждого вызова
+    :returns: код возврата — 0 или код первой возникшей ошибки
+    """
+    status = 0
+    # Future равен None у блоков, выполнение которых прервал сбой пула: такие
+    # блоки повторяются по отдельности (`_run_isolated`)
+    pending: deque[tuple[list[tuple[int, str]], Future | None]] = deque()
+    executor = ProcessPoolExecutor(
+        jobs, initializer=worker.init_worker, initargs=(cache_size,)
+    )
+
+    def recycle() -> None:
+        nonlocal executor
+        # После ожидания завершения сломанного пула исходы всех его задач
+        # уже известны: блоки, успевшие выполниться, сохраняют результаты
+        executor.shutdown(cancel_futures=True)
+        executor = ProcessPoolExecutor(
+            jobs, initializer=worker.init_worker, initargs=(cache_size,)
+        )
+        for i, (rest, future) in enumerate(pending):
+            if future is not None and (
+                future.cancelled() or future.exception() is not None
+            ):
+                pending[i] = (rest, None)
+
+    def flush_head() -> None:
+        nonlocal status
+        chunk, future = pending.popleft()
+        if future is None:
+            results = _run_isolated(chunk, cache_size, radix, limits)
+        else:
+            try:
+                results = future.result()
+            except BrokenProcessPool:
+                # Пул ломается целиком, поэтому сбой не указывает на блок,
+                # в котором он произошёл
+                recycle()
+                results = _run_isolated(chunk, cache_size, radix, limits)
+        for result in results:
+            status = _write(result, out, err, status, radix)
+
+    try:
+        for chunk in _chunks(lines, chunk_size):
+            future = executor.submit(_run_chunk, chunk, radix, limits)
+            pending.append((chunk, future))
+            while len(pending) > 2 * jobs:
+                flush_head()
+        while pending:
+            flush_head()
+    finally:
+        executor.shutdown(cancel_futures=True)
+    return status
@@ -0,0 +1,215 @@
+"""
+Кэш результатов вызовов функций.
+
+`CachedModuleGroup` оборачивает модуль (обычно `ModuleGroup`) и запоминает
+результаты вызовов по ключу (идентификатор, канонические аргументы). Кэш
+ограничен числом записей и суммарным размером; при переполнении вытесняются
+записи, к которым дольше всего не обращались (LRU). Содержимое кэша можно
+сохранить в файл и загрузить при следующем запуске.
+"""
+
+import os
+import pickle
+import re
+from collections import OrderedDict
+from typing import Any
+
+from hestia.common.registry import Function
+from hestia.common.types import Identifier, Module
+from hestia.polynomial import Polynomial
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+CACHE_FORMAT_VERSION = 1
+
+_INTEGER = re.compile(r"(-?)0*(\d+)")
+_FRACTION = re.compile(r"(-?\d+)/(\d+)")
+
+
+def canonical_arg(s: str) -> str:
+    """
+    Каноническая запись аргумента для ключа кэша.
+
+    Приводятся только записи, которые однозначно разбираются одинаково для
+    всех функций: у целых чисел и у числителя и знаменателя дробей убираются
+    ведущие нули и знак нуля, многочлены записываются в виде
+    `str(Polynomial)`. Дроби не сокращаются: многочлены хранят коэффициенты
+    несокращёнными, поэтому `1/2` и `2/4` могут дать разные результаты.
+    Остальные строки (в том числе некорректные) остаются без изменений,
+    поэтому две строки с одинаковым ключом всегда дают одинаковый результат.
+
+    :param s: аргумент
+    :returns: каноническая запись
+    """
+    if m := _INTEGER.fullmatch(s):
+        return _canonical_integer(m)
+
+    if m := _FRACTION.fullmatch(s):
+        numerator = _INTEGER.fullmatch(m[1])
+        denominator = _INTEGER.fullmatch(m[2])
+        return f"{_canonical_integer(numerator)}/{_canonical_integer(denominator)}"
+
+    if "x" in s:
+        try:
+            return str(Polynomial.from_str(s))
+        except ValueError:
+            return s
+
+    return s
+
+
+def _canonical_integer(m: re.Match) -> str:
+    """Запись целого числа без ведущих нулей и без знака у нуля"""
+    return m[2] if m[2] == "0" else m[1] + m[2]
+
+
+class CacheStats:
+    """
+    Счётчики кэша.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __str__(self) -> str:
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0.0
+        return (
+            f"попаданий: {self.hits}, промахов: {self.misses}, "
+            f"вытеснений: {self.evictions}, доля попаданий: {ratio:.1%}"
+        )
+
+
+class CachedModuleGroup(Module):
+    """
+    Модуль-обёртка, кэширующая результаты вызовов другого модуля.
+
+    Результаты хранятся в сериализованном виде (pickle): размер записи
+    известен точно, а при каждом попадании возвращается новый объект, поэтому
+    изменение результата вызывающим кодом не портит кэш. Ошибки не
+    кэшируются.
+    """
+
+    def __init__(
+        self,
+        module: Module,
+        max_entries: int,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """
+        :param module: модуль, вызовы которого кэшируются
+        :param max_entries: максимальное число записей
+        :param max_bytes: максимальный суммарный размер записей в байтах
+        """
+        self.module = module
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.__entries: OrderedDict[tuple[str, ...], bytes] = OrderedDict()
+        self.__size = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def size(self) -> int:
+        """Суммарный размер записей в байтах"""
+        return self.__size
+
+    def call(self, identifier: Identifier, args: list[str]) -> Any:
+        """
+        Возвращает результат из кэша или вызывает метод обёрнутого модуля и
+        запоминает результат.
+
+        :param identifier: идентификатор метода
+        :param args: аргументы метода
+        :returns: результат вызова метода
+        """
+        key = (identifier.value, *(canonical_arg(arg) for arg in args))
+        data = self.__entries.get(key)
+        if data is not None:
+            self.__entries.move_to_end(key)
+            self.stats.hits += 1
+            return pickle.loads(data)
+
+        self.stats.misses += 1
+        result = self.module.call(identifier, args)
+        self._store(key, pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+        return result
+
+    @property
+    def registry(self) -> dict[Identifier, Function]:
+        """Реестр функций обёрнутого модуля"""
+        return self.module.registry
+
+    def function(self, identifier: Identifier) -> Function | None:
+        """Описание функции обёрнутого модуля"""
+        return self.module.function(identifier)
+
+    def invoke(self, identifier: Identifier, *args: Any) -> Any:
+        """
+        Вызывает метод обёрнутого модуля с готовыми значениями аргументов.
+        Такие вызовы не кэшируются: ключ кэша строится по строковой записи
+        аргументов.
+
+        :param identifier: идентификатор метода
+        :param args: значения аргументов
+        :returns: результат вызова метода
+        """
+        return self.module.invoke(identifier, *args)
+
+    def methods(self) -> set[Identifier]:
+        return self.module.methods()
+
+    def _store(self, key: tuple[str, ...], data: bytes) -> None:
+        """Добавляет запись и вытесняет старые записи при переполнении"""
+        if len(data) > self.max_bytes or self.max_entries <= 0:
+            return
+        old = self.__entries.pop(key, None)
+        if old is not None:
+            self.__size -= len(old)
+        self.__entries[key] = data
+        self.__size += len(data)
+
+        while len(self.__entries) > self.max_entries or self.__size > self.max_bytes:
+            _, evicted = self.__entries.popitem(last=False)
+            self.__size -= len(evicted)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Очищает кэш (счётчики сохраняются)"""
+        self.__entries.clear()
+        self.__size = 0
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет записи кэша в файл (атомарно, через временный файл).
+
+        :param path: путь к файлу
+        """
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(
+                (CACHE_FORMAT_VERSION, list(self.__entries.items())),
+                f,
+                pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, path)
+
+    def load(self, path: str) -> None:
+        """
+        Загружает записи кэша из файла, сохранённого методом `save`.
+        Отсутствующий, повреждённый файл или файл другой версии игнорируется.
+
+        :param path: путь к файлу
+        """
+        try:
+            with open(path, "rb") as f:
+                version, entries = pickle.load(f)
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            return
+        if version != CACHE_FORMAT_VERSION:
+            return
+        for key, data in entries:
+            self._store(key, data)
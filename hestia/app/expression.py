@@ -0,0 +1,633 @@
+"""
+Язык выражений над функциями модулей (`hestia eval`).
+
+Выражение вида `gcd(p*q + r, der(p))` разбирается в ориентированный
+ациклический граф (DAG): одинаковые подвыражения представлены одной вершиной
+(устранение общих подвыражений), поэтому каждое из них вычисляется один раз.
+Промежуточные значения хранятся в виде объектов модулей (`NaturalNumber`,
+`Integer`, `RationalNumber`, `Polynomial`) и не преобразуются в строки.
+Функция модуля для каждой операции выбирается по типам вычисленных
+аргументов, при необходимости аргументы приводятся к более общему типу
+(N → Z → Q → P). Независимые ветви графа могут вычисляться параллельно в
+пуле процессов.
+
+Синтаксис:
+
+- числа (`12`), переменная многочлена `x`, скобки;
+- операции `+`, `-`, `*`, `/`, `^` (степень), унарный минус; знак умножения
+  перед числом, `x`, именем или скобкой можно опустить (`3x^2`, `2(x+1)`);
+- вызовы функций `name(a, b, ...)`: короткие имена из `FUNCTIONS` или
+  названия идентификаторов (`GCF_PP_P(a, b)`);
+- присваивания `name = выражение`, разделённые `;`; значение программы —
+  значение последнего выражения.
+
+Пример: `p = x^2 - 1; q = x + 1; gcd(p*q + 1, der(p)) + p*q`.
+"""
+
+import argparse
+import re
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, NamedTuple
+
+from hestia.app.runner import (
+    CallError,
+    ExitCode,
+    build_module_group,
+    format_result,
+    write_result,
+)
+from hestia.common.exceptions import InvalidArgumentsError, UnknownIdentifierError
+from hestia.common.profiling import Profile
+from hestia.common.registry import RegistryModule
+from hestia.common.tracing import TRACE_FORMATS, Tracer, write_trace
+from hestia.common.types import Identifier
+from hestia.integer import Integer
+from hestia.natural import NaturalNumber
+from hestia.polynomial import Polynomial
+from hestia.rational import RationalNumber
+
+I = Identifier
+
+# Короткие имена функций. Для каждого имени перечислены идентификаторы в
+# порядке предпочтения: выбирается первый, к типам аргументов которого можно
+# привести переданные значения.
+FUNCTIONS: dict[str, tuple[Identifier, ...]] = {
+    "cmp": (I.COM_NN_D,),
+    "gcd": (I.GCF_NN_N, I.GCF_PP_P),
+    "lcm": (I.LCM_NN_N,),
+    "div": (I.DIV_NN_N, I.DIV_ZZ_Z, I.DIV_PP_P),
+    "mod": (I.MOD_NN_N, I.MOD_ZZ_Z, I.MOD_PP_P),
+    "powmod": (I.POWM_NNN_N,),
+    "sqrt": (I.SQRT_N_N,),
+    "root": (I.ROOT_Nk_N,),
+    "isprime": (I.PRIME_N_B,),
+    "primes": (I.PRIMES_N_N,),
+    "fact": (I.FACT_N_N,),
+    "binom": (I.BINOM_NN_N,),
+    "abs": (I.ABS_Z_N,),
+    "sign": (I.SGN_Z_D,),
+    "reduce": (I.RED_Q_Q,),
+    "isint": (I.INT_Q_B,),
+    "lead": (I.LED_P_Q,),
+    "deg": (I.DEG_P_N,),
+    "content": (I.FAC_P_Q,),
+    "der": (I.DER_P_P,),
+    "nmr": (I.NMR_P_P,),
+    "factor": (I.FCT_P_P,),
+    "roots": (I.RRT_P_Q,),
+    "isolate": (I.ISO_P_I,),
+    "res": (I.RES_PP_Q,),
+    "disc": (I.DSC_P_Q,),
+    "compose": (I.CMP_PP_P,),
+    "shift": (I.SHF_PQ_P,),
+}
+
+# Операции, результат которых не зависит от порядка аргументов: их аргументы
+# упорядочиваются, чтобы `a*b` и `b*a` были одной вершиной графа.
+COMMUTATIVE = frozenset({"+", "*", "gcd", "lcm"})
+
+_KINDS: dict[type, int] = {
+    NaturalNumber: 0,
+    Integer: 1,
+    RationalNumber: 2,
+    Polynomial: 3,
+}
+
+_ADD = (I.ADD_NN_N, I.ADD_ZZ_Z, I.ADD_QQ_Q, I.ADD_PP_P)
+_SUB = (I.SUB_ZZ_Z, I.SUB_ZZ_Z, I.SUB_QQ_Q, I.SUB_PP_P)
+_MUL = (I.MUL_NN_N, I.MUL_ZZ_Z, I.MUL_QQ_Q, I.MUL_PP_P)
+_POW = (I.POW_Nk_N, I.POW_Zk_Z, I.POW_Qk_Q, I.POW_Pk_P)
+
+_TOKEN = re.compile(r"\s*(?:(\d+)|([A-Za-z_]\w*)|(.))")
+
+
+def _error(message: str) -> CallError:
+    return CallError(message, ExitCode.INVALID_ARGS)
+
+
+class Node(NamedTuple):
+    """
+    Вершина графа выражения.
+
+    `op` — операция (`num`, `x`, знак операции или имя функции), `args` —
+    номера вершин-аргументов, `text` — запись числа для вершины `num`.
+    """
+
+    op: str
+    args: tuple[int, ...] = ()
+    text: str = ""
+
+
+class Graph:
+    """
+    Граф выражения. Вершины хранятся в списке в порядке создания, поэтому
+    аргументы всегда предшествуют использующим их вершинам; одинаковые
+    вершины не создаются повторно.
+    """
+
+    def __init__(self) -> None:
+        self.nodes: list[Node] = []
+        self.__index: dict[Node, int] = {}
+
+    def add(self, op: str, args: tuple[int, ...] = (), text: str = "") -> int:
+        """
+        Добавляет вершину или находит уже существующую такую же.
+
+        :param op: операция
+        :param args: номера вершин-аргументов
+        :param text: запись числа (для `num`)
+        :returns: номер вершины
+        """
+        if op in COMMUTATIVE:
+            args = tuple(sorted(args))
+        node = Node(op, args, text)
+        index = self.__index.get(node)
+        if index is None:
+            index = len(self.nodes)
+            self.nodes.append(node)
+            self.__index[node] = index
+        return index
+
+    def reachable(self, root: int) -> list[int]:
+        """
+        Номера вершин, от которых зависит значение вершины root (включая её),
+        в порядке возрастания.
+
+        :param root: номер вершины
+        :returns: номера вершин
+        """
+        seen = {root}
+        stack = [root]
+        while stack:
+            for arg in self.nodes[stack.pop()].args:
+                if arg not in seen:
+                    seen.add(arg)
+                    stack.append(arg)
+        return sorted(seen)
+
+
+class Parser:
+    """
+    Разбор выражения методом рекурсивного спуска с построением графа.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.tokens = self._tokenize(source)
+        self.pos = 0
+        self.graph = Graph()
+        self.names: dict[str, int] = {}
+
+    @staticmethod
+    def _tokenize(source: str) -> list[str]:
+        tokens = []
+        for m in _TOKEN.finditer(source.rstrip()):
+            token = m[1] or m[2] or m[3]
+            if m[3] is not None and token not in "+-*/^(),;=":
+                raise _error(f"Недопустимый символ: '{token}'")
+            tokens.append(token)
+        return tokens
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise _error("Неожиданный конец выражения")
+        self.pos += 1
+        return token
+
+    def _expect(self, token: str) -> None:
+        actual = self._next()
+        if actual != token:
+            raise _error(f"Ожидалось '{token}', получено '{actual}'")
+
+    def parse(self) -> int:
+        """
+        Разбирает программу (последовательность присваиваний и выражений).
+
+        :returns: номер вершины значения программы
+        :raises CallError: если выражение записано неверно
+        """
+        root = None
+        while True:
+            token = self._peek()
+            if token is None:
+                break
+            if token == ";":
+                self.pos += 1
+                continue
+            if (
+                self.pos + 1 < len(self.tokens)
+                and self.tokens[self.pos + 1] == "="
+                and _is_name(token)
+            ):
+                if _is_function(token) or token == "x":
+                    raise _error(f"Имя '{token}' зарезервировано")
+                self.pos += 2
+                self.names[token] = root = self._expression()
+            else:
+                root = self._expression()
+            if self._peek() not in (None, ";"):
+                raise _error(f"Неожиданный символ: '{self._peek()}'")
+        if root is None:
+            raise _error("Пустое выражение")
+        return root
+
+    def _expression(self) -> int:
+        node = self._term()
+        while self._peek() in ("+", "-"):
+            op = self._next()
+            node = self.graph.add(op, (node, self._term()))
+        return node
+
+    def _term(self) -> int:
+        node = self._unary()
+        while True:
+            token = self._peek()
+            if token in ("*", "/"):
+                self.pos += 1
+                node = self.graph.add(token, (node, self._unary()))
+            elif token is not None and (token == "(" or token[0].isalnum()):
+                # Неявное умножение: 3x, 2(x + 1), x y
+                node = self.graph.add("*", (node, self._power()))
+            else:
+                return node
+
+    def _unary(self) -> int:
+        if self._peek() == "-":
+            self.pos += 1
+            return self.graph.add("neg", (self._unary(),))
+        if self._peek() == "+":
+            self.pos += 1
+            return self._unary()
+        return self._power()
+
+    def _power(self) -> int:
+        node = self._primary()
+        if self._peek() == "^":
+            self.pos += 1
+            node = self.graph.add("^", (node, self._unary()))
+        return node
+
+    def _primary(self) -> int:
+        token = self._next()
+        if token.isdigit():
+            return self.graph.add("num", text=token.lstrip("0") or "0")
+        if token == "(":
+            node = self._expression()
+            self._expect(")")
+            return node
+        if token == "x":
+            return self.graph.add("x")
+        if _is_name(token):
+            if self._peek() == "(" and _is_function(token):
+                return self._call(token)
+            if token in self.names:
+                return self.names[token]
+            raise _error(f"Неизвестное имя: '{token}'")
+        raise _error(f"Неожиданный символ: '{token}'")
+
+    def _call(self, name: str) -> int:
+        self._expect("(")
+        args = []
+        if self._peek() != ")":
+            args.append(self._expression())
+            while self._peek() == ",":
+                self.pos += 1
+                args.append(self._expression())
+        self._expect(")")
+        return self.graph.add(name, tuple(args))
+
+
+def _is_name(token: str) -> bool:
+    return token[0].isalpha() or token[0] == "_"
+
+
+def _is_function(name: str) -> bool:
+    return name in FUNCTIONS or name in Identifier.__members__
+
+
+def parse(source: str) -> tuple[Graph, int]:
+    """
+    Разбирает выражение.
+
+    :param source: текст выражения
+    :returns: граф выражения и номер вершины его значения
+    :raises CallError: если выражение записано неверно
+    """
+    parser = Parser(source)
+    root = parser.parse()
+    return parser.graph, root
+
+
+def _native(value: Any) -> Any:
+    """Приводит целые числа Python (степень, знак) к типам модулей"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return NaturalNumber(value) if value >= 0 else Integer(value)
+    return value
+
+
+def _kind(value: Any) -> int:
+    kind = _KINDS.get(type(value))
+    if kind is None:
+        raise _error(
+            f"Значение '{format_result(value)}' нельзя использовать в выражении"
+        )
+    return kind
+
+
+def _invoke(group: RegistryModule, identifier: Identifier, *args: Any) -> Any:
+    try:
+        return group.invoke(identifier, *args)
+    except (InvalidArgumentsError, UnknownIdentifierError, TypeError) as e:
+        raise _error(f"{identifier.name}: {e}")
+    except (ValueError, ArithmeticError) as e:
+        raise _error(str(e))
+
+
+def _promote(group: RegistryModule, value: Any, kind: int) -> Any:
+    """Приводит значение к типу с номером kind (N → Z → Q → P)"""
+    current = _kind(value)
+    if current > kind:
+        raise _error(f"Значение '{value}' нельзя привести к нужному типу")
+    if current == 0 < kind:
+        value = _invoke(group, I.TRANS_N_Z, value)
+    if current <= 1 < kind:
+        value = _invoke(group, I.TRANS_Z_Q, value)
+    if current <= 2 < kind:
+        value = Polynomial([value])
+    return value
+
+
+def _exponent(value: Any) -> int:
+    if _kind(value) > 1:
+        raise _error(f"Показатель степени должен быть целым: '{value}'")
+    return int(value)
+
+
+def _call_function(group: RegistryModule, name: str, args: list[Any]) -> Any:
+    candidates = FUNCTIONS.get(name) or (Identifier[name],)
+    for identifier in candidates:
+        types = group.function(identifier).types
+        if len(types) != len(args):
+            continue
+        converted = []
+        for arg, t in zip(args, types):
+            if t is int:
+                if _kind(arg) > 1:
+                    break
+                converted.append(int(arg))
+            elif _kind(arg) <= _KINDS[t]:
+                converted.append(_promote(group, arg, _KINDS[t]))
+            else:
+                break
+        else:
+            return _invoke(group, identifier, *converted)
+
+    arity = len(group.function(candidates[0]).types)
+    if all(len(group.function(c).types) != len(args) for c in candidates):
+        raise _error(f"{name}: ожидалось аргументов: {arity}, получено {len(args)}")
+    raise _error(f"{name}: неподходящие типы аргументов")
+
+
+def apply(group: RegistryModule, op: str, args: list[Any], text: str = "") -> Any:
+    """
+    Вычисляет значение одной вершины графа по значениям её аргументов.
+
+    :param group: группа модулей
+    :param op: операция вершины
+    :param args: значения аргументов
+    :param text: запись числа (для `num`)
+    :returns: значение вершины
+    :raises CallError: если операцию нельзя применить к аргументам
+    """
+    if op == "num":
+        return NaturalNumber.from_str(text)
+    if op == "x":
+        return Polynomial([0, 1])
+
+    args = [_native(arg) for arg in args]
+
+    if _is_function(op):
+        return _call_function(group, op, args)
+
+    if op == "neg":
+        (a,) = args
+        kind = max(_kind(a), 1)
+        a = _promote(group, a, kind)
+        if kind == 1:
+            return _invoke(group, I.MUL_ZM_Z, a)
+        minus_one = RationalNumber(Integer(-1), NaturalNumber(1))
+        if kind == 2:
+            return _invoke(group, I.MUL_QQ_Q, a, minus_one)
+        return _invoke(group, I.MUL_PQ_P, a, minus_one)
+
+    if op == "^":
+        a, k = args
+        k = _exponent(k)
+        kind = _kind(a)
+        if k < 0 and kind < 2:
+            kind = 2
+        return _invoke(group, _POW[kind], _promote(group, a, kind), k)
+
+    a, b = args
+    ka, kb = _kind(a), _kind(b)
+    kind = max(ka, kb)
+
+    if op in ("+", "-"):
+        table = _ADD if op == "+" else _SUB
+        if op == "-":
+            # Разность натуральных чисел может быть отрицательной
+            kind = max(kind, 1)
+        a, b = _promote(group, a, kind), _promote(group, b, kind)
+        return _invoke(group, table[kind], a, b)
+
+    if op == "*":
+        if kind == 3 and min(ka, kb) < 3:
+            # Умножение многочлена на число не требует умножения многочленов
+            p, q = (a, b) if ka == 3 else (b, a)
+            return _invoke(group, I.MUL_PQ_P, p, _promote(group, q, 2))
+        a, b = _promote(group, a, kind), _promote(group, b, kind)
+        return _invoke(group, _MUL[kind], a, b)
+
+    if op == "/":
+        if kb == 3:
+            return _invoke(group, I.DIV_PP_P, _promote(group, a, 3), b)
+        one = RationalNumber(Integer(1), NaturalNumber(1))
+        inverse = _invoke(group, I.DIV_QQ_Q, one, _promote(group, b, 2))
+        if ka == 3:
+            return _invoke(group, I.MUL_PQ_P, a, inverse)
+        return _invoke(group, I.MUL_QQ_Q, _promote(group, a, 2), inverse)
+
+    raise _error(f"Неизвестная операция: '{op}'")
+
+
+def _consumers(graph: Graph, order: list[int]) -> dict[int, int]:
+    """Число вершин, использующих значение каждой вершины"""
+    count = dict.fromkeys(order, 0)
+    for index in order:
+        for arg in set(graph.nodes[index].args):
+            count[arg] += 1
+    return count
+
+
+def evaluate(graph: Graph, root: int, group: RegistryModule) -> Any:
+    """
+    Вычисляет значение вершины root в текущем процессе. Значение
+    промежуточной вершины освобождается, как только вычислены все
+    использующие его вершины.
+
+    :param graph: граф выражения
+    :param root: номер вершины
+    :param group: группа модулей
+    :returns: значение вершины
+    :raises CallError: если вычисление невозможно
+    """
+    order = graph.reachable(root)
+    consumers = _consumers(graph, order)
+    values: dict[int, Any] = {}
+    for index in order:
+        node = graph.nodes[index]
+        args = [values[arg] for arg in node.args]
+        values[index] = apply(group, node.op, args, node.text)
+        for arg in set(node.args):
+            consumers[arg] -= 1
+            if consumers[arg] == 0:
+                del values[arg]
+    return values[root]
+
+
+def evaluate_parallel(graph: Graph, root: int, jobs: int) -> Any:
+    """
+    Вычисляет значение вершины root в пуле процессов: каждая вершина
+    отправляется на вычисление, как только готовы значения её аргументов,
+    поэтому независимые ветви графа вычисляются одновременно.
+
+    :param graph: граф выражения
+    :param root: номер вершины
+    :param jobs: число процессов
+    :returns: значение вершины
+    :raises CallError: если вычисление невозможно
+    """
+    from hestia.app import worker
+
+    order = graph.reachable(root)
+    consumers = _consumers(graph, order)
+    waiting = {index: len(set(graph.nodes[index].args)) for index in order}
+    users: dict[int, list[int]] = {index: [] for index in order}
+    for index in order:
+        for arg in set(graph.nodes[index].args):
+            users[arg].append(index)
+
+    values: dict[int, Any] = {}
+    with ProcessPoolExecutor(jobs, initializer=worker.init_worker) as pool:
+        pending = {}
+
+        def submit(index: int) -> None:
+            node = graph.nodes[index]
+            args = [values[arg] for arg in node.args]
+            future = pool.submit(worker.apply, node.op, args, node.text)
+            pending[future] = index
+
+        for index in order:
+            if waiting[index] == 0:
+                submit(index)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                values[index] = future.result()
+                for arg in set(graph.nodes[index].args):
+                    consumers[arg] -= 1
+                    if consumers[arg] == 0:
+                        del values[arg]
+                for user in users[index]:
+                    waiting[user] -= 1
+                    if waiting[user] == 0:
+                        submit(user)
+
+    return values[root]
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="hestia eval",
+        description="Вычисление выражения над функциями системы компьютерной алгебры",
+        epilog="Пример: hestia eval 'p = x^2 - 1; gcd(p*(x+1) + 1, der(p))'",
+    )
+    parser.add_argument("expression", help="Выражение")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Число процессов для параллельного вычисления независимых ветвей "
+        "(по умолчанию 1)",
+    )
+    parser.add_argument(
+        "--dag",
+        action="store_true",
+        help="Вывести граф выражения (после устранения общих подвыражений) в stderr",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Вывести в stderr число вызовов, время и размеры операндов каждого "
+        "метода модулей",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Записать в файл дерево вызовов методов модулей",
+    )
+    parser.add_argument(
+        "--trace-format",
+        choices=TRACE_FORMATS,
+        default="chrome",
+        help="Формат трассы: chrome или folded (по умолчанию chrome)",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("число процессов должно быть положительным")
+    if (args.profile or args.trace is not None) and args.jobs > 1:
+        parser.error(
+            "профилирование и трассировка недоступны при параллельном вычислении"
+        )
+    return args
+
+
+def _print_graph(graph: Graph, root: int) -> None:
+    for index in graph.reachable(root):
+        node = graph.nodes[index]
+        label = node.text if node.op == "num" else node.op
+        args = ", ".join(f"%{arg}" for arg in node.args)
+        line = f"%{index} = {label}({args})" if args else f"%{index} = {label}"
+        print(line, file=sys.stderr)
+
+
+def main(argv: list[str]) -> None:
+    args = parse_args(argv)
+    profile = Profile() if args.profile else None
+    tracer = Tracer() if args.trace is not None else None
+    try:
+        graph, root = parse(args.expression)
+        if args.dag:
+            _print_graph(graph, root)
+        if args.jobs == 1:
+            result = evaluate(graph, root, build_module_group(profile, tracer))
+        else:
+            result = evaluate_parallel(graph, root, args.jobs)
+    except CallError as e:
+        print(f"Ошибка: {e.message}", file=sys.stderr)
+        exit(e.code)
+    finally:
+        if profile is not None:
+            print(profile.report(), file=sys.stderr)
+        if tracer is not None:
+            write_trace(tracer, args.trace, args.trace_format)
+    write_result(sys.stdout, result)
+    sys.stdout.write("\n")
@@ -0,0 +1,248 @@
+"""
+Общая логика запуска функций: построение группы модулей, вызов функции по
+строковому идентификатору, форматирование и вывод результатов и ошибок.
+"""
+
+import io
+from enum import Enum
+from functools import cache
+from typing import TYPE_CHECKING, Any, Callable, TextIO
+
+from hestia.common.exceptions import (
+    InvalidArgumentsError,
+    LimitExceededError,
+    UnknownIdentifierError,
+)
+from hestia.common.limits import Limits, limited
+from hestia.common.module_group import LazyModuleGroup
+from hestia.common.output import (
+    write_integer,
+    write_natural,
+    write_polynomial,
+    write_rational,
+)
+from hestia.common.registry import RegistryModule
+from hestia.common.types import Identifier, Module
+from hestia.common.utils import ensure_args
+from hestia.natural import NaturalModule, NaturalNumber
+from hestia.integer import Integer, IntegerModule
+
+if TYPE_CHECKING:
+    from hestia.common.profiling import Profile
+    from hestia.common.tracing import Tracer
+
+
+class ExitCode(int, Enum):
+    INVALID_IDENTIFIER = 1
+    NOT_IMPLEMENTED = 2
+    INVALID_ARGS = 3
+    INTERNAL_ERROR = 4
+    TIMEOUT = 5
+    LIMIT_EXCEEDED = 6
+
+
+class CallError(Exception):
+    """
+    Ошибка вызова функции, которую нужно сообщить пользователю.
+    """
+
+    def __init__(self, message: str, code: ExitCode) -> None:
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+    def __reduce__(self):
+        """Поддержка pickle для передачи ошибки из процесса-обработчика"""
+        return type(self), (self.message, self.code)
+
+
+def build_module_group(
+    profile: "Profile | None" = None, tracer: "Tracer | None" = None
+) -> LazyModuleGroup:
+    """
+    Создаёт группу из всех модулей системы. Модули создаются при первом
+    вызове функции своего семейства (см. `LazyModuleGroup`): модули
+    рациональных чисел и многочленов, самые тяжёлые при импорте, загружаются,
+    только если они нужны.
+
+    :param profile: профиль, в котором учитываются вызовы методов модулей
+        (по умолчанию профилирование выключено)
+    :param tracer: трассировщик, в который записываются деревья вызовов
+        методов модулей (по умолчанию трассировка выключена)
+    :returns: группа модулей
+    """
+    instrumentations = [i for i in (profile, tracer) if i is not None]
+
+    def loader(create: Callable[[], RegistryModule]) -> Callable[[], RegistryModule]:
+        @cache
+        def load() -> RegistryModule:
+            module = create()
+            for instrumentation in instrumentations:
+                instrumentation.instrument(module)
+            return module
+
+        return load
+
+    @loader
+    def natural_module() -> NaturalModule:
+        return NaturalModule()
+
+    @loader
+    def integer_module() -> IntegerModule:
+        return IntegerModule(natural_module())
+
+    @loader
+    def rational_module() -> RegistryModule:
+        from hestia.rational import RationalModule
+
+        return RationalModule(natural_module(), integer_module())
+
+    @loader
+    def polynomial_module() -> RegistryModule:
+        from hestia.polynomial import PolynomialModule
+
+        return PolynomialModule(natural_module(), integer_module(), rational_module())
+
+    return LazyModuleGroup(
+        {
+            "N": natural_module,
+            "Z": integer_module,
+            "Q": rational_module,
+            "P": polynomial_module,
+        }
+    )
+
+
+def write_result(f: TextIO, v: Any, radix: int = 10) -> None:
+    """
+    Записывает результат функции в поток в виде для вывода пользователю.
+    Числа и многочлены выводятся по частям (см. `hestia.common.output`), без
+    построения полной строки в памяти.
+
+    :param f: текстовый поток
+    :param v: результат функции
+    :param radix: система счисления для натуральных и целых чисел
+    """
+    if radix != 10 and isinstance(v, (NaturalNumber, Integer)):
+        f.write(v.to_radix(radix))
+    elif isinstance(v, bool):
+        f.write("Да" if v else "Нет")
+    elif isinstance(v, list):
+        if not v:
+            f.write("∅")
+        for i, item in enumerate(v):
+            if i:
+                f.write(", ")
+            write_result(f, item, radix)
+    elif isinstance(v, NaturalNumber):
+        write_natural(f, v)
+    elif isinstance(v, Integer):
+        write_integer(f, v)
+    elif isinstance(v, (int, str)):
+        f.write(str(v))
+    else:
+        # Результат другого типа мог вернуть только уже загруженный модуль
+        from hestia.polynomial import Polynomial
+        from hestia.rational import RationalNumber
+
+        if isinstance(v, RationalNumber):
+            write_rational(f, v)
+        elif isinstance(v, Polynomial):
+            write_polynomial(f, v)
+        else:
+            f.write(str(v))
+
+
+def format_result(v: Any) -> str:
+    """
+    Строковое представление результата функции для вывода пользователю.
+
+    :param v: результат функции
+    :returns: строка
+    """
+    buffer = io.StringIO()
+    write_result(buffer, v)
+    return buffer.getvalue()
+
+
+def _call_radix(
+    module_group: Module, identifier: Identifier, args: list[str], radix: int
+) -> Any:
+    """
+    Вызывает функцию, разбирая натуральные и целые аргументы в системе
+    счисления radix, а остальные — как обычно.
+    """
+    function = module_group.function(identifier)
+    if function is None:
+        raise UnknownIdentifierError(identifier)
+    ensure_args(identifier, args, function.arity)
+    values = tuple(
+        t.from_radix(arg, radix) if t in (NaturalNumber, Integer) else parse(arg)
+        for t, parse, arg in zip(function.types, function.parsers, args)
+    )
+    return function.invoke(identifier, values)
+
+
+def limit_error(e: LimitExceededError) -> CallError:
+    """
+    Ошибка вызова для превышенного ограничения: превышение времени
+    сообщается с кодом `TIMEOUT`, превышение размера — `LIMIT_EXCEEDED`.
+
+    :param e: исключение из контрольной точки
+    :returns: ошибка вызова
+    """
+    code = ExitCode.TIMEOUT if e.kind == "time" else ExitCode.LIMIT_EXCEEDED
+    return CallError(e.message, code)
+
+
+def execute(
+    module_group: Module,
+    function: str,
+    args: list[str],
+    radix: int = 10,
+    limits: Limits | None = None,
+) -> Any:
+    """
+    Вызывает функцию по строковому идентификатору.
+
+    :param module_group: группа модулей
+    :param function: название или номер функции
+    :param args: аргументы функции
+    :param radix: система счисления натуральных и целых аргументов
+    :param limits: ограничения времени и размера операндов вызова (см.
+        `hestia.common.limits`)
+    :returns: результат функции
+    :raises CallError: если идентификатор или аргументы неверны или
+        ограничение превышено
+    """
+    try:
+        identifier = Identifier.from_str(function)
+    except ValueError:
+        raise CallError(
+            f"Неверный идентификатор функции: '{function}'",
+            ExitCode.INVALID_IDENTIFIER,
+        )
+
+    try:
+        with limited(limits):
+            if radix != 10:
+                return _call_radix(module_group, identifier, args, radix)
+            return module_group.call(identifier, args)
+    except LimitExceededError as e:
+        raise limit_error(e)
+    except InvalidArgumentsError as e:
+        message = (
+            "Слишком много аргументов"
+            if e.actual > e.expected
+            else "Недостаточно аргументов"
+        )
+        raise CallError(
+            f"{message} (ожидалось {e.expected}, получено {e.actual})",
+            ExitCode.INVALID_ARGS,
+        )
+    except UnknownIdentifierError:
+        raise CallError(
+            f"Функция '{function}' не реализована", ExitCode.NOT_IMPLEMENTED
+        )
+    except (ValueError, ArithmeticError) as e:
+        raise CallError(str(e), ExitCode.INVALID_ARGS)
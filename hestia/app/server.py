@@ -0,0 +1,393 @@
+"""
+Серверный режим (`hestia serve`).
+
+Сервер принимает соединения через Unix-сокет или TCP (по умолчанию только на
+localhost) и обменивается с клиентами сообщениями в формате JSON Lines: по
+одному JSON-объекту на строку.
+
+Запрос::
+
+    {"id": 1, "function": "ADD_NN_N", "args": ["2", "3"]}
+
+Ответ (успешный и с ошибкой)::
+
+    {"id": 1, "result": "5"}
+    {"id": 2, "error": {"code": 3, "message": "Деление на ноль"}}
+
+Вызовы выполняются в пуле процессов, поэтому ответы приходят по мере
+готовности и могут идти не в порядке запросов; клиент сопоставляет их по
+`id`. Число одновременно выполняемых запросов одного соединения
+ограничено: пока лимит исчерпан, сервер не читает новые запросы, и
+клиент упирается в заполненный буфер сокета (обратное давление).
+
+Время выполнения запроса ограничено (`--timeout`) и отсчитывается с начала
+вычисления: ожидание свободного процесса в него не входит. Деление и НОД
+натуральных чисел и многочленов сами прерываются по истечении времени (см.
+`hestia.common.limits`). Остальные вычисления (факториал, разложение на
+множители, поиск корней, результант и др.) прервать изнутри нельзя: пул, в
+котором такой вызов не уложился во время, заменяется новым, а процессы
+старого пула завершаются (см. `Server._retire`).
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from hestia.app import worker
+from hestia.app.runner import CallError, ExitCode
+from hestia.common.limits import Limits
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_MAX_PENDING = 64
+# Запас времени сверх `--timeout`, за который вызов с контрольными точками
+# успевает сам сообщить о превышении времени, а запуск процесса пула — пройти
+TIMEOUT_MARGIN = 1.0
+LINE_LIMIT = 64 * 1024 * 1024
+
+
+class Server:
+    """
+    JSON Lines сервер, выполняющий вызовы функций в пуле процессов.
+    """
+
+    def __init__(
+        self,
+        jobs: int,
+        timeout: float | None,
+        max_pending: int,
+        cache_size: int = 0,
+    ) -> None:
+        """
+        :param jobs: число процессов пула
+        :param timeout: ограничение времени на один запрос в секундах (None —
+            без ограничения)
+        :param max_pending: максимальное число одновременно выполняемых
+            запросов одного соединения
+        :param cache_size: размер кэша результатов каждого процесса пула (0 —
+            без кэша)
+        """
+        self.jobs = jobs
+        self.timeout = timeout
+        self.max_pending = max_pending
+        self.cache_size = cache_size
+        self.executor: ProcessPoolExecutor | None = None
+        # Выполняемые вызовы каждого пула и пулы, которые заменены новыми
+        self._running: dict[ProcessPoolExecutor, set[asyncio.Future]] = {}
+        self._retiring: set[asyncio.Task] = set()
+        # Вызов передаётся пулу, только когда в нём есть свободный процесс,
+        # поэтому время ожидания в очереди не входит в срок вызова
+        self._idle = asyncio.Semaphore(jobs)
+        self._deadline = None if timeout is None else timeout + TIMEOUT_MARGIN
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """Создаёт пул процессов"""
+        # Процессы пула создаются по мере надобности, уже после открытия
+        # соединений. При запуске через fork они унаследовали бы сокеты
+        # клиентов, и закрытие соединения сервером не доходило бы до клиента.
+        context = None
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+        executor = ProcessPoolExecutor(
+            self.jobs,
+            mp_context=context,
+            initializer=worker.init_worker,
+            initargs=(self.cache_size,),
+        )
+        self._running[executor] = set()
+        return executor
+
+    def _recycle(self, executor: ProcessPoolExecutor) -> None:
+        """
+        Заменяет пул, в котором вызов не уложился во время, новым пулом, а
+        старый пул выводит из работы (см. `_retire`).
+
+        :param executor: пул с просроченным вызовом
+        """
+        if executor is not self.executor:
+            return  # пул уже заменён из-за другого просроченного вызова
+        self.executor = self._create_executor()
+        task = asyncio.create_task(self._retire(executor))
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+
+    async def _retire(self, executor: ProcessPoolExecutor) -> None:
+        """
+        Выводит пул из работы: остальные вызовы пула получают на завершение
+        не больше срока одного вызова (дольше им выполняться и так не дадут),
+        после чего процессы пула, в том числе занятые просроченными вызовами,
+        завершаются.
+
+        :param executor: заменённый пул
+        """
+        running = self._running.get(executor, set())
+        if running:
+            await asyncio.wait(running, timeout=self._deadline)
+        _terminate(executor)
+        del self._running[executor]
+
+    def _parse_request(self, line: bytes) -> dict[str, Any]:
+        """
+        Декодирует строку запроса.
+
+        :returns: объект запроса
+        :raises CallError: если строка не является JSON-объектом
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            raise CallError(f"Некорректный JSON: {e}", ExitCode.INVALID_ARGS)
+
+        if not isinstance(request, dict):
+            raise CallError("Запрос должен быть JSON-объектом", ExitCode.INVALID_ARGS)
+        return request
+
+    def _parse_call(self, request: dict[str, Any]) -> tuple[str, list[str]]:
+        """
+        Извлекает вызов из объекта запроса.
+
+        :returns: пара (функция, аргументы)
+        :raises CallError: если поля вызова некорректны
+        """
+        function = request.get("function")
+        args = request.get("args", [])
+        if not isinstance(function, str):
+            raise CallError(
+                "Поле 'function' должно быть строкой", ExitCode.INVALID_IDENTIFIER
+            )
+        if not isinstance(args, list) or not all(isinstance(a, str) for a in args):
+            raise CallError(
+                "Поле 'args' должно быть списком строк", ExitCode.INVALID_ARGS
+            )
+        return function, args
+
+    async def _execute(self, function: str, args: list[str]) -> str:
+        """
+        Выполняет вызов в пуле процессов с ограничением времени.
+
+        Запрос ждёт свободного процесса без ограничения времени, а срок
+        вызова отсчитывается с передачи пулу. Деление и НОД натуральных чисел
+        и многочленов сами прерывают вычисление по истечении времени (см.
+        `hestia.common.limits`), и процесс пула сразу освобождается.
+        Остальные вычисления прервать изнутри нельзя, поэтому если вызов не
+        завершился и через `TIMEOUT_MARGIN` секунд после истечения времени,
+        клиенту отправляется ошибка, а пул заменяется новым (см. `_recycle`).
+        """
+        loop = asyncio.get_running_loop()
+        limits = Limits(time=self.timeout)
+        async with self._idle:
+            executor = self.executor
+            future = loop.run_in_executor(
+                executor, worker.call, function, args, limits
+            )
+            running = self._running[executor]
+            running.add(future)
+            future.add_done_callback(running.discard)
+            try:
+                return await asyncio.wait_for(future, self._deadline)
+            except asyncio.TimeoutError:
+                self._recycle(executor)
+                raise CallError(
+                    f"Превышено время выполнения ({self.timeout:g} с)",
+                    ExitCode.TIMEOUT,
+                )
+
+    async def _respond(
+        self,
+        line: bytes,
+        writer: asyncio.StreamWriter,
+        lock: asyncio.Lock,
+        slots: asyncio.Semaphore,
+    ) -> None:
+        """Обрабатывает один запрос и отправляет ответ"""
+        request_id = None
+        try:
+            request = self._parse_request(line)
+            # id возвращается и в ответе об ошибке, если строка — JSON-объект
+            request_id = request.get("id")
+            function, args = self._parse_call(request)
+            response = {"id": request_id, "result": await self._execute(function, args)}
+        except CallError as e:
+            response = {"id": request_id, "error": {"code": e.code, "message": e.message}}
+        except Exception as e:
+            response = {
+                "id": request_id,
+                "error": {
+                    "code": ExitCode.INTERNAL_ERROR,
+                    "message": f"Внутренняя ошибка: {type(e).__name__}: {e}",
+                },
+            }
+        finally:
+            slots.release()
+
+        data = json.dumps(response, ensure_ascii=False).encode() + b"\n"
+        async with lock:
+            try:
+                writer.write(data)
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Обслуживает одно соединение.
+
+        :param reader: поток чтения
+        :param writer: поток записи
+        """
+        lock = asyncio.Lock()
+        slots = asyncio.Semaphore(self.max_pending)
+        tasks: set[asyncio.Task] = set()
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    slots.release()
+                    break
+                if not line:
+                    slots.release()
+                    break
+                if not line.strip():
+                    slots.release()
+                    continue
+
+                task = asyncio.create_task(self._respond(line, writer, lock, slots))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(
+        self, host: str | None, port: int | None, socket_path: str | None
+    ) -> None:
+        """
+        Запускает сервер и обслуживает соединения до остановки процесса.
+
+        :param host: адрес TCP
+        :param port: порт TCP
+        :param socket_path: путь к Unix-сокету (если задан, TCP не используется)
+        """
+        self.executor = self._create_executor()
+        try:
+            if socket_path is not None:
+                server = await asyncio.start_unix_server(
+                    self.handle, path=socket_path, limit=LINE_LIMIT
+                )
+            else:
+                server = await asyncio.start_server(
+                    self.handle, host=host, port=port, limit=LINE_LIMIT
+                )
+            if os.name == "posix":
+                asyncio.get_running_loop().add_signal_handler(
+                    signal.SIGTERM, server.close
+                )
+            async with server:
+                try:
+                    await server.serve_forever()
+                except asyncio.CancelledError:
+                    pass
+        finally:
+            for task in list(self._retiring):
+                task.cancel()
+            for executor in list(self._running):
+                if executor is not self.executor:
+                    _terminate(executor)
+            self.executor.shutdown(cancel_futures=True)
+
+
+def _terminate(executor: ProcessPoolExecutor) -> None:
+    """
+    Завершает процессы пула, не дожидаясь выполняемых в них вызовов.
+
+    :param executor: пул процессов
+    """
+    # Публичного способа прервать занятый процесс у ProcessPoolExecutor нет
+    processes = list((executor._processes or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="hestia serve",
+        description="Сервер системы компьютерной алгебры (протокол JSON Lines)",
+    )
+
+    address = parser.add_mutually_exclusive_group()
+    address.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Путь к Unix-сокету",
+    )
+    address.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"TCP-порт (по умолчанию {DEFAULT_PORT})",
+    )
+    parser.add_argument(
+        "--host",
+        default=DEFAULT_HOST,
+        help=f"Адрес TCP (по умолчанию {DEFAULT_HOST})",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Число процессов для выполнения вызовов",
+    )
+    parser.add_argument(
+        "--timeout",
+        metavar="SECONDS",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f"Ограничение времени на запрос (по умолчанию {DEFAULT_TIMEOUT:g} с, 0 — без ограничения)",
+    )
+    parser.add_argument(
+        "--max-pending",
+        metavar="N",
+        type=int,
+        default=DEFAULT_MAX_PENDING,
+        help="Максимальное число одновременно выполняемых запросов одного соединения",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="N",
+        type=int,
+        default=0,
+        help="Кэшировать в каждом процессе результаты последних N различных вызовов",
+    )
+
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("argument -j/--jobs: must be a positive integer")
+    if args.max_pending < 1:
+        parser.error("argument --max-pending: must be a positive integer")
+    return args
+
+
+def main(argv: list[str]) -> None:
+    args = parse_args(argv)
+    server = Server(args.jobs, args.timeout or None, args.max_pending, args.cache)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.socket))
+    except KeyboardInterrupt:
+        pass
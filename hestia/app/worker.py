@@ -0,0 +1,67 @@
+"""
+Функции, выполняемые в процессах пула (пакетный режим, сервер, `hestia eval`).
+
+Группа модулей создаётся один раз при запуске процесса (`init_worker`) и
+используется всеми последующими вызовами в этом процессе.
+"""
+
+from typing import Any
+
+from hestia.app.cache import CachedModuleGroup
+from hestia.app.runner import build_module_group, execute, format_result
+from hestia.common.limits import Limits
+from hestia.common.types import Module
+
+_module_group: Module | None = None
+
+
+def init_worker(cache_size: int = 0) -> None:
+    """
+    Инициализатор процесса пула: создаёт группу модулей.
+
+    :param cache_size: размер кэша результатов процесса (0 — без кэша)
+    """
+    global _module_group
+    _module_group = build_module_group()
+    if cache_size > 0:
+        _module_group = CachedModuleGroup(_module_group, cache_size)
+
+
+def module_group() -> Module:
+    """
+    Группа модулей текущего процесса (создаётся при первом обращении).
+
+    :returns: группа модулей
+    """
+    if _module_group is None:
+        init_worker()
+    return _module_group
+
+
+def call(function: str, args: list[str], limits: Limits | None = None) -> str:
+    """
+    Вызывает функцию и возвращает отформатированный результат.
+
+    :param function: название или номер функции
+    :param args: аргументы функции
+    :param limits: ограничения времени и размера операндов вызова
+    :returns: строковое представление результата
+    :raises CallError: если идентификатор или аргументы неверны или
+        ограничение превышено
+    """
+    return format_result(execute(module_group(), function, args, limits=limits))
+
+
+def apply(op: str, args: list[Any], text: str = "") -> Any:
+    """
+    Вычисляет вершину графа выражения (см. `hestia.app.expression.apply`).
+
+    :param op: операция вершины
+    :param args: значения аргументов
+    :param text: запись числа (для `num`)
+    :returns: значение вершины
+    :raises CallError: если операцию нельзя применить к аргументам
+    """
+    from hestia.app import expression
+
+    return expression.apply(module_group(), op, args, text)
@@ -24,3 +24,29 @@ class UnknownIdentifierError(Exception):
     def __init__(self, identifier: Identifier) -> None:
         super().__init__(f"unknown identifier: {identifier.name}")
         self.identifier = identifier
+
+
+class LimitExceededError(Exception):
+    """
+    Вызывается в контрольной точке долгого вычисления, если превышено
+    ограничение времени или размера операндов вызова (см.
+    `hestia.common.limits`).
+    """
+
+    def __init__(self, kind: str, limit: float) -> None:
+        """
+        :param kind: вид ограничения — "time" (секунды) или "size" (цифры)
+        :param limit: значение ограничения
+        """
+        if kind == "time":
+            message = f"Превышено время выполнения ({limit:g} с)"
+        else:
+            message = f"Превышен размер операндов ({limit:g} цифр)"
+        super().__init__(message)
+        self.kind = kind
+        self.limit = limit
+        self.message = message
+
+    def __reduce__(self):
+        """Поддержка pickle для передачи ошибки из процесса-обработчика"""
+        return type(self), (self.kind, self.limit)
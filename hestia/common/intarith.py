@@ -0,0 +1,463 @@
+"""
+Теоретико-числовые алгоритмы над целыми числами Python.
+
+Функции этого файла служат вычислительным ядром для модуля натуральных чисел
+(корни, проверка простоты, факториалы и биномиальные коэффициенты, НОД и НОК
+многих чисел): преобразование в `int` выполняется один раз на входе и на
+выходе. Здесь же реализовано само преобразование между `int` и списком
+десятичных цифр.
+"""
+
+from functools import lru_cache
+from math import gcd, isqrt, lcm
+from operator import mul
+from typing import Callable
+
+SIEVE_LIMIT = 1 << 16
+TRIAL_DIVISION_LIMIT = 1000
+MILLER_RABIN_BOUND = 3317044064679887385961981
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+PRODUCT_LEAF_SIZE = 16
+# Число цифр, которые преобразуются напрямую через str/int (меньше
+# ограничения sys.get_int_max_str_digits() по умолчанию)
+DIGITS_LEAF_SIZE = 1024
+DECIMAL_LEAF_BITS = 3000
+
+_sieve = bytearray()
+_primes: list[int] = []
+
+
+def iroot(n: int, k: int) -> int:
+    """
+    Целая часть корня k-й степени из n (метод Ньютона).
+
+    Начальное приближение 2^ceil(b/k), где b — битовая длина n, не меньше
+    корня, поэтому итерации x <- ((k - 1) x + n // x^(k-1)) // k монотонно
+    убывают и останавливаются на точном значении. При k = 2 используется
+    `math.isqrt`, реализующий ту же итерацию на уровне машинных слов.
+
+    :param n: неотрицательное число
+    :param k: натуральная степень корня
+    :returns: наибольшее x, для которого x^k <= n
+    """
+    if k < 1:
+        raise ValueError("Степень корня должна быть натуральной")
+    if n < 0:
+        raise ValueError("Корень из отрицательного числа не определён")
+    if k == 1 or n < 2:
+        return n
+    if k == 2:
+        return isqrt(n)
+    if k >= n.bit_length():
+        return 1
+
+    x = 1 << -(-n.bit_length() // k)
+    while True:
+        y = ((k - 1) * x + n // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
+
+
+def sieve(limit: int) -> bytearray:
+    """
+    Решето Эратосфена: таблица флагов простоты чисел 0..limit.
+
+    Таблица кэшируется и при запросе большего предела строится заново.
+
+    :param limit: верхняя граница
+    :returns: bytearray, где элемент i равен 1 тогда и только тогда, когда i
+        простое (длина таблицы может превышать limit + 1)
+    """
+    global _sieve, _primes
+    if len(_sieve) > limit:
+        return _sieve
+
+    size = max(limit + 1, SIEVE_LIMIT + 1, 2 * len(_sieve))
+    table = bytearray([1]) * size
+    table[0] = table[1] = 0
+    for p in range(2, isqrt(size - 1) + 1):
+        if table[p]:
+            table[p * p :: p] = bytes(len(range(p * p, size, p)))
+    _sieve = table
+    _primes = [p for p in range(size) if table[p]]
+    return _sieve
+
+
+def primes_up_to(limit: int) -> list[int]:
+    """
+    Простые числа, не превосходящие limit, по возрастанию (по таблице
+    решета).
+
+    :param limit: верхняя граница
+    :returns: список простых чисел
+    """
+    sieve(limit)
+    if _primes and _primes[-1] <= limit:
+        return _primes[:]
+    lo, hi = 0, len(_primes)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _primes[mid] <= limit:
+            lo = mid + 1
+        else:
+            hi = mid
+    return _primes[:lo]
+
+
+def _strong_probable_prime(n: int, a: int) -> bool:
+    """Сильный тест Ферма (один раунд Миллера — Рабина) по основанию a"""
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def _jacobi(a: int, n: int) -> int:
+    """Символ Якоби (a/n) для нечётного n > 0"""
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _strong_lucas_probable_prime(n: int) -> bool:
+    """
+    Сильный тест Люка с параметрами Селфриджа: D — первое из 5, -7, 9,
+    -11, ..., для которого (D/n) = -1, P = 1, Q = (1 - D) / 4.
+    """
+    if isqrt(n) ** 2 == n:
+        return False
+    d = 5
+    while True:
+        j = _jacobi(d, n)
+        if j == -1:
+            break
+        if j == 0 and abs(d) != n:
+            return False
+        d = -d - 2 if d > 0 else -d + 2
+    q = (1 - d) // 4
+
+    m = n + 1
+    s = (m & -m).bit_length() - 1
+    m >>= s
+
+    # Вычисление U_m, V_m, Q^m по двоичной записи m (слева направо)
+    u, v, qk = 1, 1, q % n
+    inverse_two = (n + 1) // 2
+    for bit in bin(m)[3:]:
+        u, v = u * v % n, (v * v - 2 * qk) % n
+        qk = qk * qk % n
+        if bit == "1":
+            u, v = (u + v) * inverse_two % n, (d * u + v) * inverse_two % n
+            qk = qk * q % n
+
+    if u == 0 or v == 0:
+        return True
+    for _ in range(s - 1):
+        v = (v * v - 2 * qk) % n
+        if v == 0:
+            return True
+        qk = qk * qk % n
+    return False
+
+
+def is_prime(n: int) -> bool:
+    """
+    Проверка числа на простоту.
+
+    Малые числа проверяются по таблице решета, у остальных сначала
+    отсеиваются малые делители. Для n < 3.3 * 10^24 тест Миллера — Рабина по
+    первым 13 простым основаниям детерминирован; для больших n используется
+    тест Бейли — PSW (Миллер — Рабин по основанию 2 и сильный тест Люка), для
+    которого не известно ни одного составного числа, его проходящего.
+
+    :param n: целое число
+    :returns: True, если n простое
+    """
+    if n < 2:
+        return False
+    table = sieve(SIEVE_LIMIT)
+    if n < len(table):
+        return bool(table[n])
+    for p in _primes:
+        if p > TRIAL_DIVISION_LIMIT:
+            break
+        if n % p == 0:
+            return False
+
+    if n < MILLER_RABIN_BOUND:
+        return all(_strong_probable_prime(n, a) for a in MILLER_RABIN_BASES)
+    return _strong_probable_prime(n, 2) and _strong_lucas_probable_prime(n)
+
+
+def product(values: list[int]) -> int:
+    """
+    Произведение чисел деревом произведений: перемножаются соседние пары,
+    поэтому множители на каждом уровне имеют близкие размеры и умножение
+    Карацубы работает эффективно.
+
+    :param values: множители
+    :returns: произведение
+    """
+    if not values:
+        return 1
+    level = values
+    if len(level) > PRODUCT_LEAF_SIZE:
+        level = []
+        for i in range(0, len(values), PRODUCT_LEAF_SIZE):
+            chunk = 1
+            for v in values[i : i + PRODUCT_LEAF_SIZE]:
+                chunk *= v
+            level.append(chunk)
+    while len(level) > 1:
+        level = _pair_up(level, mul)
+    return level[0]
+
+
+def _pair_up(level: list[int], op: Callable[[int, int], int]) -> list[int]:
+    """Следующий уровень дерева: op от соседних пар, нечётный остаток — как есть"""
+    paired = [op(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2:
+        paired.append(level[-1])
+    return paired
+
+
+def product_tree(values: list[int]) -> list[list[int]]:
+    """
+    Дерево произведений: нулевой уровень — сами числа, каждый следующий —
+    произведения соседних пар предыдущего, последний уровень — произведение
+    всех чисел.
+
+    :param values: непустой список чисел
+    :returns: уровни дерева от листьев к корню
+    """
+    tree = [list(values)]
+    while len(tree[-1]) > 1:
+        tree.append(_pair_up(tree[-1], mul))
+    return tree
+
+
+def remainder_tree(n: int, tree: list[list[int]], power: int = 1) -> list[int]:
+    """
+    Остатки от деления n на степени всех листьев дерева произведений.
+
+    Остаток спускается от корня к листьям: в каждом узле берётся остаток
+    от деления остатка родителя на степень значения узла. Делимые на каждом
+    шаге не длиннее делителя родителя, поэтому это быстрее, чем делить n на
+    каждый лист отдельно.
+
+    :param n: делимое
+    :param tree: дерево произведений (`product_tree`) из ненулевых чисел
+    :param power: степень, в которую возводятся делители
+    :returns: n mod v^power для каждого листа v
+    """
+    remainders = [n]
+    for level in reversed(tree):
+        remainders = [remainders[i // 2] % v**power for i, v in enumerate(level)]
+    return remainders
+
+
+def batch_gcd(values: list[int]) -> list[int]:
+    """
+    НОД каждого числа с произведением всех остальных (алгоритм Бернштейна).
+
+    Вместо n(n - 1) / 2 попарных НОД строится дерево произведений P всех
+    чисел и дерево остатков P mod v^2; тогда НОД(v, P / v) =
+    НОД(v, (P mod v^2) / v). Это позволяет, например, найти среди многих
+    чисел те, у которых есть общие делители с другими.
+
+    :param values: неотрицательные числа
+    :returns: НОД(values[i], произведение остальных) для каждого i
+    """
+    nonzero = [v for v in values if v]
+    zeros = len(values) - len(nonzero)
+    if zeros:
+        # Произведение остальных равно нулю, если среди них есть ноль
+        rest = product(nonzero) if zeros == 1 else 0
+        return [v if v else rest for v in values]
+    if not values:
+        return []
+
+    tree = product_tree(values)
+    remainders = remainder_tree(tree[-1][0], tree, power=2)
+    return [gcd(v, r // v) for v, r in zip(values, remainders)]
+
+
+def gcd_tree(values: list[int]) -> int:
+    """
+    НОД всех чисел, вычисляемый деревом: НОД соседних пар, затем соседних
+    результатов и т. д. Числа на каждом уровне имеют близкие размеры, а
+    вычисление прекращается, как только НОД становится равным 1.
+
+    :param values: непустой список неотрицательных чисел
+    :returns: НОД
+    """
+    level = list(values)
+    while len(level) > 1:
+        level = _pair_up(level, gcd)
+        if 1 in level:
+            return 1
+    return level[0]
+
+
+def lcm_tree(values: list[int]) -> int:
+    """
+    НОК всех чисел, вычисляемый деревом, как `gcd_tree`: множители в
+    НОК(a, b) = a * b / НОД(a, b) на каждом уровне имеют близкие размеры.
+
+    :param values: непустой список неотрицательных чисел
+    :returns: НОК (0, если среди чисел есть 0)
+    """
+    level = list(values)
+    while len(level) > 1:
+        level = _pair_up(level, lcm)
+    return level[0]
+
+
+def factorial(n: int) -> int:
+    """
+    Факториал n! деревом произведений.
+
+    :param n: неотрицательное число
+    :returns: n!
+    """
+    if n < 0:
+        raise ValueError("Факториал отрицательного числа не определён")
+    return product(list(range(2, n + 1)))
+
+
+def binomial(n: int, k: int) -> int:
+    """
+    Биномиальный коэффициент C(n, k).
+
+    Показатель вхождения каждого простого p <= n в C(n, k) равен числу
+    переносов при сложении k и n - k в системе счисления с основанием p
+    (теорема Куммера). Простые берутся из таблицы решета, а степени
+    перемножаются деревом произведений, поэтому делений длинных чисел нет.
+
+    :param n: неотрицательное число
+    :param k: неотрицательное число
+    :returns: C(n, k), равный нулю при k > n
+    """
+    if n < 0 or k < 0:
+        raise ValueError("Биномиальный коэффициент определён для неотрицательных n и k")
+    if k > n:
+        return 0
+    k = min(k, n - k)
+    if k == 0:
+        return 1
+
+    factors = []
+    for p in primes_up_to(n):
+        if p > n - k:
+            factors.append(p)
+            continue
+        if 2 * p > n:
+            continue
+        e = 0
+        a, b, carry = k, n - k, 0
+        while a or b or carry:
+            carry = 1 if a % p + b % p + carry >= p else 0
+            e += carry
+            a //= p
+            b //= p
+        if e:
+            factors.append(p**e)
+    return product(factors)
+
+
+@lru_cache(maxsize=None)
+def _power_of_ten(k: int) -> int:
+    return 10**k
+
+
+def _split_width(n: int) -> int:
+    """Наименьшая ширина вида DIGITS_LEAF_SIZE * 2^m, не меньшая n"""
+    width = DIGITS_LEAF_SIZE
+    while width < n:
+        width *= 2
+    return width
+
+
+def from_digits(digits: list[int]) -> int:
+    """
+    Число по списку десятичных цифр от младших к старшим.
+
+    Список делится пополам, половины преобразуются рекурсивно и
+    объединяются как low + high * 10^k; степени десяти вида
+    DIGITS_LEAF_SIZE * 2^m вычисляются один раз. Время — O(M(n) log n), где
+    M(n) — время умножения, вместо O(n^2) при схеме Горнера.
+
+    :param digits: цифры от младших к старшим
+    :returns: число
+    """
+    if len(digits) <= DIGITS_LEAF_SIZE:
+        return int("".join(map(str, reversed(digits))) or "0")
+    half = _split_width(len(digits)) // 2
+    low = from_digits(digits[:half])
+    high = from_digits(digits[half:])
+    return low + high * _power_of_ten(half)
+
+
+def _to_decimal(n: int) -> "decimal.Decimal":
+    """
+    Точное представление числа в виде `decimal.Decimal`.
+
+    Число делится на старшую и младшую половины битов, которые
+    преобразуются рекурсивно и объединяются как low + high * 2^k уже в
+    десятичной арифметике (умножение в `decimal` выполняется за
+    субквадратичное время). Модуль `decimal` импортируется только здесь:
+    небольшие числа в нём не нуждаются.
+    """
+    import decimal
+
+    powers: dict[int, decimal.Decimal] = {}
+
+    def convert(n: int, bits: int) -> decimal.Decimal:
+        if bits <= DECIMAL_LEAF_BITS:
+            return decimal.Decimal(n)
+        half = bits >> 1
+        high = n >> half
+        low = n - (high << half)
+        if half not in powers:
+            powers[half] = decimal.Decimal(2) ** half
+        return convert(low, half) + convert(high, bits - half) * powers[half]
+
+    with decimal.localcontext() as ctx:
+        ctx.prec = decimal.MAX_PREC
+        ctx.Emax = decimal.MAX_EMAX
+        ctx.Emin = decimal.MIN_EMIN
+        ctx.traps[decimal.Inexact] = True
+        return convert(n, n.bit_length())
+
+
+def to_digits(n: int) -> list[int]:
+    """
+    Список десятичных цифр неотрицательного числа от младших к старшим.
+
+    Небольшие числа преобразуются через `str`, большие — через точное
+    десятичное представление (`_to_decimal`), что для чисел из миллионов цифр
+    в десятки раз быстрее квадратичного `str(int)`.
+
+    :param n: неотрицательное число
+    :returns: цифры от младших к старшим (без ведущих нулей)
+    """
+    if n < _power_of_ten(DIGITS_LEAF_SIZE):
+        return list(map(int, reversed(str(n))))
+    return list(map(int, reversed(str(_to_decimal(n)))))
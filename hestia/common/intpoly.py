@@ -0,0 +1,1331 @@
+"""
+Плотные многочлены с целыми коэффициентами и коэффициентами из Z/pZ.
+
+Многочлен хранится в виде списка `int` от свободного члена к старшему
+коэффициенту, нулевой многочлен — пустой список. Функции этого файла служат
+вычислительным ядром для алгоритмов модуля многочленов (разложение на
+множители и т.п.), которым требуется большое количество операций над
+коэффициентами.
+"""
+
+import random
+from fractions import Fraction
+from math import floor, gcd as _gcd, isqrt
+
+from hestia.common.intarith import is_prime
+from hestia.common.utils import sliding_window_power
+
+KRONECKER_THRESHOLD = 32
+MODULAR_RESULTANT_THRESHOLD = 4000
+COMPOSE_THRESHOLD = 1000
+POWER_SPARSE_TERMS = 8
+
+
+def strip(f: list[int]) -> list[int]:
+    """
+    Удаляет нулевые старшие коэффициенты (на месте).
+
+    :param f: многочлен
+    :returns: тот же список без ведущих нулей
+    """
+    while f and f[-1] == 0:
+        f.pop()
+    return f
+
+
+def degree(f: list[int]) -> int:
+    """
+    Степень многочлена, для нулевого многочлена — -1.
+
+    :param f: многочлен
+    :returns: степень
+    """
+    return len(f) - 1
+
+
+def add(f: list[int], g: list[int]) -> list[int]:
+    """
+    Сумма многочленов.
+
+    :param f: первое слагаемое
+    :param g: второе слагаемое
+    :returns: сумма
+    """
+    if len(f) < len(g):
+        f, g = g, f
+    result = f[:]
+    for i, c in enumerate(g):
+        result[i] += c
+    return strip(result)
+
+
+def sub(f: list[int], g: list[int]) -> list[int]:
+    """
+    Разность многочленов.
+
+    :param f: уменьшаемое
+    :param g: вычитаемое
+    :returns: разность
+    """
+    result = f[:] + [0] * (len(g) - len(f))
+    for i, c in enumerate(g):
+        result[i] -= c
+    return strip(result)
+
+
+def scale(f: list[int], c: int) -> list[int]:
+    """
+    Умножение многочлена на целое число.
+
+    :param f: многочлен
+    :param c: множитель
+    :returns: произведение
+    """
+    if c == 0:
+        return []
+    return [a * c for a in f]
+
+
+def _pack(f: list[int], size: int) -> int:
+    """
+    Значение многочлена в точке 2^(8*size) (подстановка Кронекера). Каждый
+    коэффициент занимает size байт; знаковые коэффициенты сдвигаются на
+    половину диапазона, чтобы упаковка сводилась к конкатенации байтов.
+    """
+    bits = 8 * size
+    half = 1 << (bits - 1)
+    data = b"".join((c + half).to_bytes(size, "little") for c in f)
+    return int.from_bytes(data, "little") - _bias(half, bits, len(f))
+
+
+def _unpack(v: int, size: int, n: int) -> list[int]:
+    """Восстановление n знаковых коэффициентов, упакованных функцией _pack"""
+    bits = 8 * size
+    half = 1 << (bits - 1)
+    data = (v + _bias(half, bits, n)).to_bytes(size * n, "little")
+    return [
+        int.from_bytes(data[i : i + size], "little") - half
+        for i in range(0, size * n, size)
+    ]
+
+
+def _bias(half: int, bits: int, n: int) -> int:
+    """Сумма half * 2^(bits*i) по i = 0..n-1"""
+    return half * (((1 << (bits * n)) - 1) // ((1 << bits) - 1))
+
+
+def mul(f: list[int], g: list[int]) -> list[int]:
+    """
+    Произведение многочленов.
+
+    Для больших степеней используется подстановка Кронекера: многочлены
+    упаковываются в длинные целые числа, умножение которых выполняется
+    интерпретатором за субквадратичное время.
+
+    :param f: первый множитель
+    :param g: второй множитель
+    :returns: произведение
+    """
+    if not f or not g:
+        return []
+
+    if min(len(f), len(g)) < KRONECKER_THRESHOLD:
+        result = [0] * (len(f) + len(g) - 1)
+        for i, a in enumerate(f):
+            if a:
+                for j, b in enumerate(g):
+                    result[i + j] += a * b
+        return strip(result)
+
+    bound = max(abs(c) for c in f) * max(abs(c) for c in g) * min(len(f), len(g))
+    size = (bound.bit_length() + 9) // 8
+    if f is g:
+        v = _pack(f, size) ** 2
+    else:
+        v = _pack(f, size) * _pack(g, size)
+    return strip(_unpack(v, size, len(f) + len(g) - 1))
+
+
+def power(f: list[int], k: int) -> list[int]:
+    """
+    Натуральная степень многочлена f^k.
+
+    Для одночленов степень вычисляется сразу. Для разреженных многочленов
+    (двучлены, трёхчлены и т.п.) используется рекуррентная формула
+    Миллера: при g = f^k коэффициенты удовлетворяют соотношению
+    m f_0 g_m = sum(((k + 1) i - m) f_i g_(m-i)), где суммирование идёт
+    только по ненулевым f_i, поэтому каждый коэффициент результата
+    вычисляется за число операций, равное числу членов f (для двучлена
+    получаются биномиальные коэффициенты, для многочлена общего вида —
+    мультиномиальные). Для плотных многочленов используется возведение в
+    степень скользящим окном с умножением подстановкой Кронекера.
+
+    :param f: многочлен
+    :param k: неотрицательный показатель
+    :returns: многочлен f^k
+    """
+    if k < 0:
+        raise ValueError("Показатель степени не может быть отрицательным")
+    if k == 0:
+        return [1]
+    if not f:
+        return []
+
+    shift = 0
+    while f[shift] == 0:
+        shift += 1
+    g = f[shift:]
+    terms = [(i, c) for i, c in enumerate(g) if c][1:]
+
+    if not terms:
+        return [0] * (shift * k) + [g[0] ** k]
+
+    if len(terms) < POWER_SPARSE_TERMS:
+        n = len(g) - 1
+        f0 = g[0]
+        result = [0] * (n * k + 1)
+        result[0] = f0**k
+        for m in range(1, n * k + 1):
+            total = 0
+            for i, c in terms:
+                if i > m:
+                    break
+                previous = result[m - i]
+                if previous:
+                    total += ((k + 1) * i - m) * c * previous
+            result[m] = total // (m * f0)
+    else:
+        result = sliding_window_power(g, k, mul, [1])
+
+    return [0] * (shift * k) + result
+
+
+def derivative(f: list[int]) -> list[int]:
+    """
+    Производная многочлена.
+
+    :param f: многочлен
+    :returns: производная
+    """
+    return strip([i * f[i] for i in range(1, len(f))])
+
+
+def evaluate(f: list[int], x: int) -> int:
+    """
+    Значение многочлена в целой точке (схема Горнера).
+
+    :param f: многочлен
+    :param x: точка
+    :returns: значение
+    """
+    result = 0
+    for c in reversed(f):
+        result = result * x + c
+    return result
+
+
+def content(f: list[int]) -> int:
+    """
+    Содержание многочлена — НОД его коэффициентов (неотрицательное).
+
+    :param f: многочлен
+    :returns: содержание
+    """
+    result = 0
+    for c in f:
+        result = _gcd(result, c)
+        if result == 1:
+            break
+    return result
+
+
+def primitive(f: list[int]) -> tuple[int, list[int]]:
+    """
+    Разложение многочлена на содержание и примитивную часть со старшим
+    коэффициентом больше нуля.
+
+    :param f: многочлен
+    :returns: пара (содержание со знаком, примитивная часть)
+    """
+    if not f:
+        return 0, []
+    c = content(f)
+    if f[-1] < 0:
+        c = -c
+    if c == 1:
+        return 1, f[:]
+    return c, [a // c for a in f]
+
+
+def trunc(f: list[int], m: int) -> list[int]:
+    """
+    Приведение коэффициентов по модулю m в симметричное представление
+    (-m/2, m/2].
+
+    :param f: многочлен
+    :param m: модуль
+    :returns: многочлен с приведёнными коэффициентами
+    """
+    half = m // 2
+    result = []
+    for c in f:
+        c %= m
+        if c > half:
+            c -= m
+        result.append(c)
+    return strip(result)
+
+
+def divmod_monic(f: list[int], g: list[int]) -> tuple[list[int], list[int]]:
+    """
+    Деление с остатком на многочлен со старшим коэффициентом 1.
+
+    :param f: делимое
+    :param g: делитель (приведённый)
+    :returns: пара (частное, остаток)
+    """
+    dg = degree(g)
+    if degree(f) < dg:
+        return [], f[:]
+    r = f[:]
+    q = [0] * (len(f) - dg)
+    for i in range(len(f) - 1 - dg, -1, -1):
+        c = r[i + dg]
+        q[i] = c
+        if c:
+            for j in range(dg):
+                r[i + j] -= c * g[j]
+    return strip(q), strip(r[:dg])
+
+
+def exquo(f: list[int], g: list[int]) -> list[int] | None:
+    """
+    Точное деление в Z[x].
+
+    :param f: делимое
+    :param g: ненулевой делитель
+    :returns: частное или None, если g не делит f в Z[x]
+    """
+    if not f:
+        return []
+    dg = degree(g)
+    if degree(f) < dg:
+        return None
+    lc = g[-1]
+    r = f[:]
+    q = [0] * (len(f) - dg)
+    for i in range(len(f) - 1 - dg, -1, -1):
+        c, rem = divmod(r[i + dg], lc)
+        if rem:
+            return None
+        q[i] = c
+        if c:
+            for j in range(dg):
+                r[i + j] -= c * g[j]
+    if any(r[:dg]):
+        return None
+    return strip(q)
+
+
+def pseudo_remainder(f: list[int], g: list[int]) -> list[int]:
+    """
+    Псевдоостаток от деления f на g: остаток от деления lc(g)^(deg f - deg g + 1) f
+    на g.
+
+    :param f: делимое
+    :param g: ненулевой делитель
+    :returns: псевдоостаток
+    """
+    dg = degree(g)
+    r = f[:]
+    e = degree(f) - dg + 1
+    if e <= 0:
+        return r
+    lc = g[-1]
+    while degree(r) >= dg:
+        c = r[-1]
+        shift = degree(r) - dg
+        r = [lc * a for a in r]
+        for j in range(dg + 1):
+            r[shift + j] -= c * g[j]
+        strip(r)
+        e -= 1
+    if e:
+        r = scale(r, lc**e)
+    return r
+
+
+def gcd(f: list[int], g: list[int]) -> list[int]:
+    """
+    НОД многочленов в Z[x] (примитивная последовательность полиномиальных
+    остатков). Результат имеет положительный старший коэффициент.
+
+    :param f: первый многочлен
+    :param g: второй многочлен
+    :returns: НОД
+    """
+    if not f:
+        return scale(primitive(g)[1], content(g))
+    if not g:
+        return scale(primitive(f)[1], content(f))
+
+    cf, f = primitive(f)
+    cg, g = primitive(g)
+    c = _gcd(cf, cg)
+    if degree(f) < degree(g):
+        f, g = g, f
+
+    while g:
+        if degree(g) == 0:
+            return [c]
+        r = pseudo_remainder(f, g)
+        f, g = g, primitive(r)[1]
+
+    return scale(f, c)
+
+
+def squarefree_decomposition(f: list[int]) -> list[tuple[list[int], int]]:
+    """
+    Бесквадратное разложение примитивного многочлена (алгоритм Юна).
+
+    :param f: примитивный многочлен положительной степени со старшим
+        коэффициентом больше нуля
+    :returns: список пар (бесквадратный множитель, кратность)
+    """
+    df = derivative(f)
+    g = gcd(f, df)
+    if degree(g) == 0:
+        return [(f, 1)]
+
+    b = exquo(f, g)
+    d = sub(exquo(df, g), derivative(b))
+    result = []
+    i = 1
+    while degree(b) > 0:
+        a = gcd(b, d)
+        b = exquo(b, a)
+        d = sub(exquo(d, a), derivative(b))
+        if degree(a) > 0:
+            result.append((a, i))
+        i += 1
+    return result
+
+
+def is_squarefree(f: list[int]) -> bool:
+    """
+    Проверка примитивного многочлена на отсутствие кратных множителей.
+
+    Сначала проверяется бесквадратность по нескольким малым простым модулям:
+    если многочлен бесквадратен хотя бы по одному модулю, не делящему старший
+    коэффициент, то он бесквадратен и над Z. Иначе вычисляется НОД с
+    производной.
+
+    :param f: примитивный многочлен
+    :returns: True, если многочлен бесквадратный
+    """
+    for p in (3, 5, 7, 11, 13):
+        if f[-1] % p and gf_is_squarefree(gf_from_int(f, p), p):
+            return True
+    return degree(gcd(f, derivative(f))) <= 0
+
+
+def squarefree_part(f: list[int]) -> list[int]:
+    """
+    Бесквадратная часть примитивного многочлена — произведение всех его
+    неприводимых множителей в первой степени.
+
+    :param f: примитивный многочлен с положительным старшим коэффициентом
+    :returns: бесквадратная примитивная часть
+    """
+    if degree(f) <= 0 or is_squarefree(f):
+        return f[:]
+    return primitive(exquo(f, gcd(f, derivative(f))))[1]
+
+
+def large_primes(bits: int = 62):
+    """
+    Генератор простых чисел, меньших 2^bits, по убыванию. Используется в
+    модульных алгоритмах с восстановлением по китайской теореме об остатках.
+
+    :param bits: разрядность простых чисел
+    :returns: итератор простых чисел
+    """
+    n = (1 << bits) - 1
+    while n > 2:
+        if is_prime(n):
+            yield n
+        n -= 2
+
+
+def odd_primes():
+    """
+    Генератор нечётных простых чисел по возрастанию.
+
+    :returns: итератор простых чисел 3, 5, 7, ...
+    """
+    found = []
+    n = 3
+    while True:
+        if all(n % q for q in found if q * q <= n):
+            found.append(n)
+            yield n
+        n += 2
+
+
+# Арифметика в (Z/pZ)[x]. Коэффициенты лежат в [0, p).
+
+
+def gf_from_int(f: list[int], p: int) -> list[int]:
+    """
+    Редукция многочлена из Z[x] по простому модулю p.
+
+    :param f: многочлен
+    :param p: простой модуль
+    :returns: многочлен над Z/pZ
+    """
+    return strip([c % p for c in f])
+
+
+def gf_sub(f: list[int], g: list[int], p: int) -> list[int]:
+    """
+    Разность многочленов над Z/pZ.
+
+    :param f: уменьшаемое
+    :param g: вычитаемое
+    :param p: модуль
+    :returns: разность
+    """
+    return gf_from_int(sub(f, g), p)
+
+
+def gf_mul(f: list[int], g: list[int], p: int) -> list[int]:
+    """
+    Произведение многочленов над Z/pZ.
+
+    :param f: первый множитель
+    :param g: второй множитель
+    :param p: модуль
+    :returns: произведение
+    """
+    return gf_from_int(mul(f, g), p)
+
+
+def gf_monic(f: list[int], p: int) -> list[int]:
+    """
+    Приведение многочлена над Z/pZ к старшему коэффициенту 1.
+
+    :param f: ненулевой многочлен
+    :param p: модуль
+    :returns: приведённый многочлен
+    """
+    if f[-1] == 1:
+        return f[:]
+    inv = pow(f[-1], -1, p)
+    return [c * inv % p for c in f]
+
+
+def gf_divmod(f: list[int], g: list[int], p: int) -> tuple[list[int], list[int]]:
+    """
+    Деление с остатком над Z/pZ.
+
+    :param f: делимое
+    :param g: ненулевой делитель
+    :param p: модуль
+    :returns: пара (частное, остаток)
+    """
+    dg = degree(g)
+    if degree(f) < dg:
+        return [], f[:]
+    inv = pow(g[-1], -1, p)
+    r = f[:]
+    q = [0] * (len(f) - dg)
+    for i in range(len(f) - 1 - dg, -1, -1):
+        c = r[i + dg] % p * inv % p
+        q[i] = c
+        if c:
+            for j in range(dg):
+                r[i + j] -= c * g[j]
+    return strip(q), gf_from_int(r[:dg], p)
+
+
+def gf_rem(f: list[int], g: list[int], p: int) -> list[int]:
+    """
+    Остаток от деления над Z/pZ.
+
+    :param f: делимое
+    :param g: ненулевой делитель
+    :param p: модуль
+    :returns: остаток
+    """
+    return gf_divmod(f, g, p)[1]
+
+
+def gf_gcd(f: list[int], g: list[int], p: int) -> list[int]:
+    """
+    Приведённый НОД многочленов над Z/pZ.
+
+    :param f: первый многочлен
+    :param g: второй многочлен
+    :param p: модуль
+    :returns: НОД со старшим коэффициентом 1 (или нулевой многочлен)
+    """
+    while g:
+        f, g = g, gf_rem(f, g, p)
+    return gf_monic(f, p) if f else []
+
+
+def gf_gcdex(
+    f: list[int], g: list[int], p: int
+) -> tuple[list[int], list[int], list[int]]:
+    """
+    Расширенный алгоритм Евклида над Z/pZ.
+
+    :param f: первый многочлен
+    :param g: второй многочлен
+    :param p: модуль
+    :returns: тройка (s, t, h), где s*f + t*g = h — приведённый НОД
+    """
+    r0, r1 = f, g
+    s0, s1 = [1], []
+    t0, t1 = [], [1]
+    while r1:
+        q, r = gf_divmod(r0, r1, p)
+        r0, r1 = r1, r
+        s0, s1 = s1, gf_sub(s0, gf_mul(q, s1, p), p)
+        t0, t1 = t1, gf_sub(t0, gf_mul(q, t1, p), p)
+    inv = pow(r0[-1], -1, p)
+    return (
+        [c * inv % p for c in s0],
+        [c * inv % p for c in t0],
+        [c * inv % p for c in r0],
+    )
+
+
+def gf_powmod(f: list[int], e: int, m: list[int], p: int) -> list[int]:
+    """
+    Возведение в степень по модулю многочлена над Z/pZ.
+
+    :param f: основание
+    :param e: неотрицательный показатель
+    :param m: модуль-многочлен
+    :param p: модуль коэффициентов
+    :returns: f^e mod m
+    """
+    result = [1]
+    base = gf_rem(f, m, p)
+    while e:
+        if e & 1:
+            result = gf_rem(gf_mul(result, base, p), m, p)
+        e >>= 1
+        if e:
+            base = gf_rem(gf_mul(base, base, p), m, p)
+    return gf_rem(result, m, p)
+
+
+def gf_is_squarefree(f: list[int], p: int) -> bool:
+    """
+    Проверка многочлена над Z/pZ на отсутствие кратных множителей.
+
+    :param f: многочлен
+    :param p: модуль
+    :returns: True, если многочлен бесквадратный
+    """
+    df = gf_from_int(derivative(f), p)
+    if not df:
+        return degree(f) <= 0
+    return degree(gf_gcd(f, df, p)) == 0
+
+
+def _gf_frobenius_base(f: list[int], p: int) -> list[list[int]]:
+    """Вычеты x^(i*p) mod f, i = 0..deg f - 1, для приведённого f"""
+    n = degree(f)
+    base = [[1]]
+    if n == 1:
+        return base
+
+    if p < n:
+        current = [1]
+        for _ in range(1, n):
+            for _ in range(p):
+                current = [0] + current
+                if len(current) > n:
+                    c = current.pop()
+                    for j in range(n):
+                        current[j] = (current[j] - c * f[j]) % p
+                strip(current)
+            base.append(current)
+    else:
+        xp = gf_powmod([0, 1], p, f, p)
+        current = [1]
+        for _ in range(1, n):
+            current = gf_rem(gf_mul(current, xp, p), f, p)
+            base.append(current)
+    return base
+
+
+def _gf_frobenius_map(h: list[int], base: list[list[int]], p: int) -> list[int]:
+    """Вычисляет h^p mod f по таблице из _gf_frobenius_base (deg h < deg f)"""
+    result = [0] * len(base)
+    for i, c in enumerate(h):
+        if c:
+            for j, v in enumerate(base[i]):
+                result[j] += c * v
+    return gf_from_int(result, p)
+
+
+def gf_distinct_degree(f: list[int], p: int) -> list[tuple[list[int], int]]:
+    """
+    Разложение на произведения неприводимых множителей одинаковой степени.
+
+    :param f: приведённый бесквадратный многочлен над Z/pZ
+    :param p: модуль
+    :returns: список пар (произведение всех неприводимых множителей степени d, d)
+    """
+    if degree(f) <= 1:
+        return [(f, 1)] if degree(f) == 1 else []
+
+    base = _gf_frobenius_base(f, p)
+    h = [0, 1]
+    rest = f
+    result = []
+    i = 1
+    while 2 * i <= degree(rest):
+        h = _gf_frobenius_map(h, base, p)
+        g = gf_gcd(gf_sub(h, [0, 1], p), rest, p)
+        if degree(g) > 0:
+            result.append((g, i))
+            rest = gf_divmod(rest, g, p)[0]
+        i += 1
+    if degree(rest) > 0:
+        result.append((rest, degree(rest)))
+    return result
+
+
+def gf_equal_degree(f: list[int], d: int, p: int, rng: random.Random) -> list[list[int]]:
+    """
+    Разложение произведения неприводимых множителей степени d
+    (алгоритм Кантора — Цассенхауза, p нечётно).
+
+    :param f: приведённый многочлен, все неприводимые множители которого имеют степень d
+    :param d: степень множителей
+    :param p: нечётный простой модуль
+    :param rng: генератор случайных чисел
+    :returns: список неприводимых приведённых множителей
+    """
+    n = degree(f)
+    if n <= d:
+        return [f]
+
+    base = _gf_frobenius_base(f, p)
+    e = (p - 1) // 2
+    while True:
+        a = strip([rng.randrange(p) for _ in range(n)])
+        if degree(a) <= 0:
+            continue
+        g = gf_gcd(a, f, p)
+        if 0 < degree(g) < n:
+            break
+
+        # a^((p^d - 1) / 2) = (a * a^p * ... * a^(p^(d-1)))^((p - 1) / 2)
+        power = a
+        norm = a
+        for _ in range(1, d):
+            power = _gf_frobenius_map(power, base, p)
+            norm = gf_rem(gf_mul(norm, power, p), f, p)
+        b = gf_powmod(norm, e, f, p)
+        g = gf_gcd(gf_sub(b, [1], p), f, p)
+        if 0 < degree(g) < n:
+            break
+
+    other = gf_divmod(f, g, p)[0]
+    return gf_equal_degree(g, d, p, rng) + gf_equal_degree(other, d, p, rng)
+
+
+# Разложение на множители в Z[x]
+
+
+def _hensel_step(
+    m: int, f: list[int], g: list[int], h: list[int], s: list[int], t: list[int]
+) -> tuple[list[int], list[int], list[int], list[int]]:
+    """Шаг квадратичного подъёма Гензеля f = g*h (mod m) до модуля m^2"""
+    mm = m * m
+    e = trunc(sub(f, mul(g, h)), mm)
+    q, r = divmod_monic(mul(s, e), h)
+    q = trunc(q, mm)
+    r = trunc(r, mm)
+    u = add(mul(t, e), mul(q, g))
+    big_g = trunc(add(g, u), mm)
+    big_h = trunc(add(h, r), mm)
+
+    u = add(mul(s, big_g), mul(t, big_h))
+    b = trunc(sub(u, [1]), mm)
+    c, d = divmod_monic(mul(s, b), big_h)
+    c = trunc(c, mm)
+    d = trunc(d, mm)
+    u = add(mul(t, b), mul(c, big_g))
+    big_s = trunc(sub(s, d), mm)
+    big_t = trunc(sub(t, u), mm)
+    return big_g, big_h, big_s, big_t
+
+
+def hensel_lift(p: int, f: list[int], factors: list[list[int]], k: int) -> list[list[int]]:
+    """
+    Многофакторный подъём Гензеля разложения f по модулю p до модуля p^k.
+
+    :param p: простой модуль, не делящий старший коэффициент f
+    :param f: многочлен, бесквадратный по модулю p
+    :param factors: приведённые попарно взаимно простые множители f по модулю p
+    :param k: требуемая степень модуля
+    :returns: приведённые множители f по модулю p^k
+    """
+    r = len(factors)
+    lc = f[-1]
+    if r == 1:
+        m = p**k
+        return [trunc(scale(f, pow(lc, -1, m)), m)]
+
+    half = r // 2
+    g = gf_from_int([lc], p)
+    for fi in factors[:half]:
+        g = gf_mul(g, fi, p)
+    h = factors[half]
+    for fi in factors[half + 1 :]:
+        h = gf_mul(h, fi, p)
+    s, t, _ = gf_gcdex(g, h, p)
+
+    g, h, s, t = trunc(g, p), trunc(h, p), trunc(s, p), trunc(t, p)
+    m = p
+    for _ in range(max(k - 1, 0).bit_length()):
+        g, h, s, t = _hensel_step(m, f, g, h, s, t)
+        m *= m
+
+    return hensel_lift(p, g, factors[:half], k) + hensel_lift(p, h, factors[half:], k)
+
+
+def _choose_prime(f: list[int]) -> tuple[int, list[tuple[list[int], int]]]:
+    """
+    Выбор простого модуля, по которому f остаётся бесквадратным. Среди
+    нескольких подходящих модулей выбирается тот, по которому у f меньше
+    всего неприводимых множителей.
+    """
+    lc = f[-1]
+    best = None
+    tried = 0
+    for p in odd_primes():
+        if lc % p == 0:
+            continue
+        fp = gf_from_int(f, p)
+        if not gf_is_squarefree(fp, p):
+            continue
+        ddf = gf_distinct_degree(gf_monic(fp, p), p)
+        count = sum(degree(g) // d for g, d in ddf)
+        if best is None or count < best[0]:
+            best = (count, p, ddf)
+        tried += 1
+        if best[0] <= 2 or (tried >= 3 and best[0] < 10) or tried >= 7:
+            break
+    return best[1], best[2]
+
+
+def zassenhaus(f: list[int]) -> list[list[int]]:
+    """
+    Разложение бесквадратного примитивного многочлена на неприводимые
+    множители в Z[x] (алгоритм Цассенхауза).
+
+    :param f: бесквадратный примитивный многочлен положительной степени с
+        положительным старшим коэффициентом и ненулевым свободным членом
+    :returns: список неприводимых примитивных множителей
+    """
+    n = degree(f)
+    if n == 1:
+        return [f]
+
+    p, ddf = _choose_prime(f)
+    rng = random.Random(n * p)
+    modular = []
+    for g, d in ddf:
+        modular.extend(gf_equal_degree(g, d, p, rng))
+    if len(modular) == 1:
+        return [f]
+
+    # Оценка Миньотта на коэффициенты делителей
+    norm = max(abs(c) for c in f)
+    bound = (isqrt(n + 1) + 1) * 2**n * norm * f[-1]
+    k = 1
+    while p**k <= 2 * bound:
+        k += 1
+    pk = p**k
+
+    lifted = hensel_lift(p, f, modular, k)
+
+    factors = []
+    indices = list(range(len(lifted)))
+    s = 1
+    while 2 * s <= len(indices):
+        for subset in _subsets(indices, s):
+            lc = f[-1]
+            g = [lc]
+            for i in subset:
+                g = trunc(mul(g, lifted[i]), pk)
+            g = primitive(g)[1]
+            if f[0] % g[0]:
+                continue
+            q = exquo(f, g)
+            if q is None:
+                continue
+
+            factors.append(g)
+            f = q
+            chosen = set(subset)
+            indices = [i for i in indices if i not in chosen]
+            break
+        else:
+            s += 1
+
+    return factors + [f]
+
+
+def _subsets(items: list[int], size: int):
+    """Все подмножества заданного размера в лексикографическом порядке"""
+    n = len(items)
+    if size > n:
+        return
+    idx = list(range(size))
+    while True:
+        yield [items[i] for i in idx]
+        for i in range(size - 1, -1, -1):
+            if idx[i] != i + n - size:
+                break
+        else:
+            return
+        idx[i] += 1
+        for j in range(i + 1, size):
+            idx[j] = idx[j - 1] + 1
+
+
+def factor(f: list[int]) -> list[tuple[list[int], int]]:
+    """
+    Разложение примитивного многочлена на неприводимые множители в Z[x].
+
+    :param f: примитивный многочлен положительной степени с положительным
+        старшим коэффициентом
+    :returns: список пар (неприводимый примитивный множитель, кратность),
+        упорядоченный по возрастанию степени
+    """
+    result = []
+
+    zeros = 0
+    while f[zeros] == 0:
+        zeros += 1
+    if zeros:
+        result.append(([0, 1], zeros))
+        f = f[zeros:]
+    if degree(f) <= 0:
+        return result
+
+    parts = [(f, 1)] if is_squarefree(f) else squarefree_decomposition(f)
+
+    for g, multiplicity in parts:
+        for h in zassenhaus(g):
+            result.append((h, multiplicity))
+
+    result.sort(key=lambda item: (degree(item[0]), item[1]))
+    return result
+
+
+
+# Вещественные и рациональные корни
+
+
+def taylor_shift(f: list[int], a: int) -> list[int]:
+    """
+    Сдвиг аргумента многочлена: f(x + a).
+
+    Используется схема Горнера для сдвига (O(n^2) сложений и умножений на
+    a, при a = ±1 — только сложения). Методы «разделяй и властвуй» и
+    свёрточный метод асимптотически быстрее лишь при быстром умножении
+    длинных чисел, которого нет в интерпретаторе (умножение Карацубы),
+    поэтому на практике эта схема выигрывает у них при любых степенях.
+
+    :param f: многочлен
+    :param a: величина сдвига
+    :returns: многочлен f(x + a)
+    """
+    g = f[:]
+    n = len(g)
+    if a == 0 or n <= 1:
+        return g
+    if a == 1:
+        for k in range(n - 1):
+            for j in range(n - 2, k - 1, -1):
+                g[j] += g[j + 1]
+    elif a == -1:
+        for k in range(n - 1):
+            for j in range(n - 2, k - 1, -1):
+                g[j] -= g[j + 1]
+    else:
+        for k in range(n - 1):
+            for j in range(n - 2, k - 1, -1):
+                g[j] += a * g[j + 1]
+    return g
+
+
+def compose(f: list[int], g: list[int]) -> list[int]:
+    """
+    Композиция многочленов f(g(x)).
+
+    При небольшой степени результата используется схема Горнера, иначе —
+    метод «разделяй и властвуй»: f = f_0 + g^k f_1, где k — степень двойки,
+    а степени g^(2^i) вычисляются один раз. Произведения в этом случае
+    получаются сбалансированными и выполняются подстановкой Кронекера.
+
+    :param f: внешний многочлен
+    :param g: внутренний многочлен
+    :returns: f(g(x))
+    """
+    if not f:
+        return []
+    if degree(g) <= 0:
+        return strip([evaluate(f, g[0] if g else 0)])
+    if degree(f) * degree(g) < COMPOSE_THRESHOLD:
+        return _compose_horner(f, g)
+
+    powers = [g]
+    while 1 << len(powers) < len(f):
+        powers.append(mul(powers[-1], powers[-1]))
+    return _compose_split(f, powers, len(powers) - 1)
+
+
+def _compose_horner(f: list[int], g: list[int]) -> list[int]:
+    """Композиция по схеме Горнера"""
+    result = []
+    for c in reversed(f):
+        result = add(mul(result, g), [c])
+    return result
+
+
+def _compose_split(f: list[int], powers: list[list[int]], k: int) -> list[int]:
+    """Композиция f(g), где powers[i] = g^(2^i) и len(f) <= 2^(k+1)"""
+    if len(f) <= 16:
+        return _compose_horner(f, powers[0])
+    while 1 << k >= len(f):
+        k -= 1
+    m = 1 << k
+    low = _compose_split(f[:m], powers, k)
+    high = _compose_split(strip(f[m:]), powers, k)
+    return add(low, mul(high, powers[k]))
+
+
+def sign_variations(f: list[int]) -> int:
+    """
+    Число перемен знака в последовательности коэффициентов (нули
+    пропускаются).
+
+    :param f: многочлен
+    :returns: число перемен знака
+    """
+    count = 0
+    last = 0
+    for c in f:
+        if c:
+            if (c < 0) != (last < 0) and last:
+                count += 1
+            last = c
+    return count
+
+
+def sign_at(f: list[int], r: Fraction) -> int:
+    """
+    Знак значения многочлена в рациональной точке (без вычислений с дробями).
+
+    :param f: многочлен
+    :param r: точка
+    :returns: -1, 0 или 1
+    """
+    u, v = r.numerator, r.denominator
+    # Однородная схема Горнера: sum f_i u^i v^(n-i)
+    result = 0
+    power = 1
+    for c in reversed(f):
+        result = result * u + c * power
+        power *= v
+    return (result > 0) - (result < 0)
+
+
+def _positive_root_exponent(f: list[int]) -> int:
+    """Наименьшее e >= 0, для которого все положительные корни f меньше 2^e"""
+    n = degree(f)
+    lc_bits = abs(f[-1]).bit_length() - 1
+    e = 0
+    for i in range(n):
+        if f[i]:
+            t = -(-(abs(f[i]).bit_length() - lc_bits) // (n - i))
+            e = max(e, t + 1)
+    return e
+
+
+def _isolate_positive(f: list[int]) -> list[tuple[Fraction, Fraction]]:
+    """
+    Изоляция положительных корней бесквадратного многочлена методом
+    Декарта (Винсент — Коллинз — Акритас) с делением интервалов пополам.
+
+    :param f: бесквадратный многочлен с ненулевым свободным членом
+    :returns: интервалы, каждый из которых содержит ровно один корень;
+        вырожденный интервал (a, a) означает, что a — точный корень
+    """
+    e = _positive_root_exponent(f)
+    g = [c << (e * i) for i, c in enumerate(f)]
+    g = primitive(g)[1]
+
+    result = []
+    stack = [(0, 0, g)]
+    while stack:
+        c, k, h = stack.pop()
+        if h[0] == 0:
+            root = Fraction(c << e, 1 << k)
+            result.append((root, root))
+            h = h[1:]
+        if degree(h) <= 0:
+            continue
+
+        variations = sign_variations(taylor_shift(h[::-1], 1))
+        if variations == 0:
+            continue
+        if variations == 1:
+            result.append((Fraction(c << e, 1 << k), Fraction((c + 1) << e, 1 << k)))
+            continue
+
+        n = degree(h)
+        left = primitive([a << (n - i) for i, a in enumerate(h)])[1]
+        stack.append((2 * c + 1, k + 1, taylor_shift(left, 1)))
+        stack.append((2 * c, k + 1, left))
+    return result
+
+
+def real_root_intervals(f: list[int]) -> list[tuple[Fraction, Fraction]]:
+    """
+    Изоляция всех вещественных корней многочлена.
+
+    :param f: бесквадратный многочлен положительной степени
+    :returns: упорядоченные по возрастанию интервалы [a, b] с рациональными
+        концами, каждый из которых содержит ровно один корень (при a = b
+        корень равен a; иначе корень лежит строго внутри интервала)
+    """
+    result = []
+    if f[0] == 0:
+        result.append((Fraction(0), Fraction(0)))
+        f = f[1:]
+    if degree(f) <= 0:
+        return result
+
+    result.extend(_isolate_positive(f))
+    negated = [-c if i % 2 else c for i, c in enumerate(f)]
+    result.extend((-b, -a) for a, b in _isolate_positive(negated))
+    result.sort()
+    return result
+
+
+def rational_roots(f: list[int]) -> list[Fraction]:
+    """
+    Рациональные корни примитивного многочлена.
+
+    Корень u/v (несократимая дробь) многочлена g с целыми коэффициентами
+    удовлетворяет условиям v | lc(g) и u | g(0), поэтому lc(g) * u/v — целое
+    число, ограниченное по модулю. Корни бесквадратной части ищутся по
+    простому модулю p, поднимаются итерациями Ньютона до модуля, большего
+    удвоенной оценки, и восстанавливаются как дроби со знаменателем lc(g).
+    Кандидаты, не прошедшие проверку делимости, отбрасываются без
+    вычисления значения многочлена.
+
+    :param f: примитивный многочлен положительной степени
+    :returns: упорядоченный по возрастанию список различных рациональных корней
+    """
+    result = []
+    if f[0] == 0:
+        result.append(Fraction(0))
+        while f[0] == 0:
+            f = f[1:]
+    if degree(f) <= 0:
+        return result
+
+    g = squarefree_part(f)
+    lc = g[-1]
+    constant = abs(g[0])
+    negated = [-c if i % 2 else c for i, c in enumerate(g)]
+    if negated[-1] < 0:
+        negated = scale(negated, -1)
+    exponent = max(_positive_root_exponent(g), _positive_root_exponent(negated))
+    bound = lc << exponent
+
+    for p in odd_primes():
+        if lc % p and gf_is_squarefree(gf_from_int(g, p), p):
+            break
+
+    dg = derivative(g)
+    for r in range(p):
+        if evaluate(g, r) % p:
+            continue
+
+        m = p
+        while m <= 2 * bound:
+            m *= m
+            r = (r - evaluate(g, r) * pow(evaluate(dg, r), -1, m)) % m
+
+        c = lc * r % m
+        if c > m // 2:
+            c -= m
+        candidate = Fraction(c, lc)
+        if candidate.numerator == 0 or constant % candidate.numerator:
+            continue
+        if sign_at(g, candidate) == 0:
+            result.append(candidate)
+
+    result.sort()
+    return result
+
+
+# Результанты
+
+
+def subresultants(f: list[int], g: list[int]) -> tuple[list[list[int]], list[int]]:
+    """
+    Последовательность субрезультантов (алгоритм Брауна — Коллинза без
+    дробей). Коэффициенты остаются целыми, а их рост ограничен размером
+    соответствующих миноров матрицы Сильвестра.
+
+    :param f: многочлен
+    :param g: многочлен степени не выше deg f
+    :returns: пара (последовательность многочленов f, g, S_1, ..., главные
+        субрезультанты)
+    """
+    n = degree(f)
+    m = degree(g)
+    if not f:
+        return [], []
+    if not g:
+        return [f], [1]
+
+    chain = [f, g]
+    d = n - m
+    b = (-1) ** (d + 1)
+    h = scale(pseudo_remainder(f, g), b)
+    lc = g[-1]
+    c = lc**d
+    principal = [1, c]
+    c = -c
+    while h:
+        k = degree(h)
+        chain.append(h)
+        f, g, m, d = g, h, k, m - k
+        b = -lc * c**d
+        h = [a // b for a in pseudo_remainder(f, g)]
+        lc = g[-1]
+        if d > 1:
+            c = (-lc) ** d // c ** (d - 1)
+        else:
+            c = -lc
+        principal.append(-c)
+    return chain, principal
+
+
+def resultant_prs(f: list[int], g: list[int]) -> int:
+    """
+    Результант многочленов через последовательность субрезультантов.
+
+    :param f: многочлен
+    :param g: многочлен
+    :returns: результант res(f, g)
+    """
+    if not f or not g:
+        return 0
+    sign = 1
+    if degree(f) < degree(g):
+        f, g = g, f
+        if degree(f) * degree(g) % 2:
+            sign = -1
+    chain, principal = subresultants(f, g)
+    if degree(chain[-1]) > 0:
+        return 0
+    return sign * principal[-1]
+
+
+def gf_resultant(f: list[int], g: list[int], p: int) -> int:
+    """
+    Результант многочленов над Z/pZ (алгоритм Евклида).
+
+    :param f: многочлен над Z/pZ
+    :param g: многочлен над Z/pZ
+    :param p: простой модуль
+    :returns: результант по модулю p
+    """
+    if not f or not g:
+        return 0
+    n = degree(f)
+    m = degree(g)
+    result = 1
+    while m > 0:
+        r = gf_rem(f, g, p)
+        if not r:
+            return 0
+        k = degree(r)
+        # res(f, g) = (-1)^(nm) lc(g)^(n - k) res(g, f mod g)
+        if n * m % 2:
+            result = -result
+        result = result * pow(g[-1], n - k, p) % p
+        f, g, n, m = g, r, m, k
+    return result * pow(g[0], n, p) % p
+
+
+def resultant_modular(f: list[int], g: list[int]) -> int:
+    """
+    Результант многочленов по модулям нескольких больших простых чисел с
+    восстановлением по китайской теореме об остатках. Количество модулей
+    определяется оценкой Адамара.
+
+    :param f: многочлен
+    :param g: многочлен
+    :returns: результант res(f, g)
+    """
+    if not f or not g:
+        return 0
+    n = degree(f)
+    m = degree(g)
+    bound = (isqrt(sum(c * c for c in f)) + 1) ** m * (
+        isqrt(sum(c * c for c in g)) + 1
+    ) ** n
+
+    result = 0
+    modulus = 1
+    for p in large_primes():
+        if f[-1] % p == 0 or g[-1] % p == 0:
+            continue
+        r = gf_resultant(gf_from_int(f, p), gf_from_int(g, p), p)
+        result += modulus * ((r - result) * pow(modulus, -1, p) % p)
+        modulus *= p
+        if modulus > 2 * bound:
+            break
+
+    if result > modulus // 2:
+        result -= modulus
+    return result
+
+
+def resultant(f: list[int], g: list[int]) -> int:
+    """
+    Результант многочленов с выбором алгоритма по размеру входных данных:
+    для небольших многочленов — последовательность субрезультантов, для
+    многочленов большой степени или с большими коэффициентами — модульный
+    алгоритм.
+
+    :param f: многочлен
+    :param g: многочлен
+    :returns: результант res(f, g)
+    """
+    if not f or not g:
+        return 0
+    size = max(degree(f), degree(g)) * max(
+        max(abs(c) for c in f).bit_length(), max(abs(c) for c in g).bit_length(), 1
+    )
+    if size <= MODULAR_RESULTANT_THRESHOLD:
+        return resultant_prs(f, g)
+    return resultant_modular(f, g)
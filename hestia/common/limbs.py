@@ -0,0 +1,177 @@
+"""
+Поэлементные операции над массивами натуральных чисел с помощью NumPy.
+
+Массив чисел упаковывается в матрицу «лимбов»: строка матрицы — одно число,
+столбец — разряд по основанию 10^k, от младших к старшим. Операция
+выполняется над всеми строками сразу, а переносы и заёмы распространяются
+по столбцам, поэтому число операций NumPy зависит от длины чисел, а не от
+их количества. Большую часть времени занимает упаковка списков цифр в
+матрицы и распаковка, поэтому выигрыш зависит от операции: умножение в
+3–7 раз быстрее, чем через `int`, а сложение и вычитание — лишь в 1,3–2,4
+раза быстрее поэлементных вызовов и только для чисел от 20 цифр (см.
+`NaturalModule.add_many`).
+
+Числа передаются и возвращаются списками десятичных цифр от младших к
+старшим (как в `NaturalNumber.value`). NumPy — необязательная зависимость:
+если он не установлен, `available()` возвращает False, и вызывающий код
+должен использовать поэлементные вычисления.
+"""
+
+from math import gcd
+from typing import Any, Sequence
+
+from hestia.common.intarith import from_digits, to_digits
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Цифр в лимбе для сложения и вычитания (сумма двух лимбов
+# помещается в int64) и для умножения (сумма произведений лимбов помещается в
+# int64 при длине чисел до ~10^10 лимбов)
+ADD_LIMB_DIGITS = 9
+MUL_LIMB_DIGITS = 4
+# Наибольшее число цифр, при котором числа помещаются в int64 целиком
+INT64_DIGITS = 18
+
+Digits = Sequence[int]
+
+
+def available() -> bool:
+    """Установлен ли NumPy"""
+    return np is not None
+
+
+def pack(values: Sequence[Digits], k: int, width: int = 0) -> Any:
+    """
+    Упаковывает числа в матрицу лимбов по основанию 10^k.
+
+    :param values: числа в виде списков цифр от младших к старшим
+    :param k: число цифр в лимбе
+    :param width: наименьшее число цифр в строке (для выравнивания матриц)
+    :returns: матрица int64 размера (len(values), число лимбов)
+    """
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+    digits = max(int(lengths.max(initial=0)), width, 1)
+    columns = -(-digits // k)
+    matrix = np.zeros((len(values), columns * k), dtype=np.int64)
+
+    # Все цифры разом раскладываются по своим строкам и столбцам; цифры
+    # собираются через bytes, так как bytes(list) не перебирает список в Python
+    flat = np.frombuffer(b"".join(map(bytes, values)), dtype=np.uint8)
+    rows = np.repeat(np.arange(len(values)), lengths)
+    starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    matrix[rows, np.arange(len(flat)) - starts] = flat
+
+    powers = 10 ** np.arange(k, dtype=np.int64)
+    return matrix.reshape(len(values), columns, k) @ powers
+
+
+def unpack(limbs: Any, k: int) -> list[list[int]]:
+    """
+    Распаковывает матрицу лимбов в списки цифр без ведущих нулей.
+
+    :param limbs: матрица лимбов по основанию 10^k (значения в [0, 10^k))
+    :param k: число цифр в лимбе
+    :returns: числа в виде списков цифр от младших к старшим
+    """
+    n, columns = limbs.shape
+    powers = 10 ** np.arange(k, dtype=np.int64)
+    width = columns * k
+    digits = (limbs[:, :, None] // powers % 10).reshape(n, width).astype(np.uint8)
+
+    nonzero = digits != 0
+    lengths = np.where(
+        nonzero.any(axis=1), width - np.argmax(nonzero[:, ::-1], axis=1), 1
+    )
+    data = digits.tobytes()
+    return [
+        list(data[start : start + length])
+        for start, length in zip(range(0, n * width, width), lengths.tolist())
+    ]
+
+
+def _normalize(limbs: Any, base: int) -> Any:
+    """Распространяет переносы и заёмы от младших лимбов к старшим"""
+    for j in range(limbs.shape[1] - 1):
+        carry = limbs[:, j] // base
+        limbs[:, j] -= carry * base
+        limbs[:, j + 1] += carry
+    return limbs
+
+
+def _pack_pair(
+    a: Sequence[Digits], b: Sequence[Digits], k: int, extra: int = 0
+) -> tuple[Any, Any]:
+    """Упаковывает два массива в матрицы одинаковой ширины"""
+    if len(a) != len(b):
+        raise ValueError("Массивы должны иметь одинаковую длину")
+    width = max((len(v) for v in (*a, *b)), default=1) + extra * k
+    return pack(a, k, width), pack(b, k, width)
+
+
+def add(a: Sequence[Digits], b: Sequence[Digits]) -> list[list[int]]:
+    """
+    Поэлементная сумма a[i] + b[i].
+
+    :param a: первые слагаемые
+    :param b: вторые слагаемые
+    :returns: суммы
+    """
+    x, y = _pack_pair(a, b, ADD_LIMB_DIGITS, extra=1)
+    return unpack(_normalize(x + y, 10**ADD_LIMB_DIGITS), ADD_LIMB_DIGITS)
+
+
+def sub(a: Sequence[Digits], b: Sequence[Digits]) -> list[list[int]]:
+    """
+    Поэлементная разность a[i] - b[i] при a[i] >= b[i].
+
+    :param a: уменьшаемые
+    :param b: вычитаемые
+    :returns: разности
+    :raises ValueError: если хотя бы одна разность отрицательна
+    """
+    x, y = _pack_pair(a, b, ADD_LIMB_DIGITS)
+    limbs = _normalize(x - y, 10**ADD_LIMB_DIGITS)
+    if (limbs[:, -1] < 0).any():
+        raise ValueError("Первое число должно быть больше или равно второму")
+    return unpack(limbs, ADD_LIMB_DIGITS)
+
+
+def mul(a: Sequence[Digits], b: Sequence[Digits]) -> list[list[int]]:
+    """
+    Поэлементное произведение a[i] * b[i] (умножение «в столбик» всех пар
+    сразу).
+
+    :param a: первые множители
+    :param b: вторые множители
+    :returns: произведения
+    """
+    x, y = _pack_pair(a, b, MUL_LIMB_DIGITS)
+    n, columns = x.shape
+    product = np.zeros((n, 2 * columns), dtype=np.int64)
+    for i in range(columns):
+        product[:, i : i + columns] += x[:, i : i + 1] * y
+    return unpack(_normalize(product, 10**MUL_LIMB_DIGITS), MUL_LIMB_DIGITS)
+
+
+def gcd_pairs(a: Sequence[Digits], b: Sequence[Digits]) -> list[list[int]]:
+    """
+    Поэлементный НОД. Если все числа помещаются в int64, НОД вычисляется
+    `numpy.gcd` для всех пар сразу, иначе — `math.gcd` для каждой пары
+    (алгоритм Евклида не сводится к фиксированной последовательности
+    операций над столбцами).
+
+    :param a: первые числа
+    :param b: вторые числа
+    :returns: НОД каждой пары
+    """
+    if len(a) != len(b):
+        raise ValueError("Массивы должны иметь одинаковую длину")
+    if max((len(v) for v in (*a, *b)), default=1) <= INT64_DIGITS:
+        x, y = _pack_pair(a, b, INT64_DIGITS)
+        limbs = np.gcd(x[:, :1], y[:, :1])
+        return unpack(limbs, INT64_DIGITS)
+
+    return [to_digits(gcd(from_digits(u), from_digits(v))) for u, v in zip(a, b)]
@@ -0,0 +1,91 @@
+"""
+Ограничения времени и размера операндов одного вызова.
+
+Долгие циклы модулей (деление и НОД натуральных чисел и многочленов)
+содержат контрольные точки: в начале каждой итерации они проверяют
+ограничения текущего вызова и при превышении бросают
+`LimitExceededError`, прерывая вычисление. Ограничения задаются для блока
+кода контекстным менеджером `limited`:
+
+    with limited(Limits(time=5.0, size=10_000)):
+        group.invoke(Identifier.GCF_PP_P, a, b)
+
+Вне `limited` контрольная точка сводится к чтению контекстной переменной,
+поэтому без ограничений вычисления почти не замедляются.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, NamedTuple
+
+from .exceptions import LimitExceededError
+
+
+class Limits(NamedTuple):
+    """
+    Ограничения одного вызова: время в секундах и наибольший размер
+    промежуточных значений в десятичных цифрах (None — без ограничения).
+    """
+
+    time: float | None = None
+    size: int | None = None
+
+
+class Budget:
+    """
+    Ограничения выполняющегося вызова: момент, после которого вызов
+    прерывается, и наибольший размер.
+    """
+
+    __slots__ = ("limits", "deadline")
+
+    def __init__(self, limits: Limits) -> None:
+        self.limits = limits
+        self.deadline = (
+            time.monotonic() + limits.time if limits.time is not None else None
+        )
+
+    def check(self, size: int = 0) -> None:
+        """
+        Контрольная точка.
+
+        :param size: размер текущего промежуточного значения в цифрах
+        :raises LimitExceededError: если время истекло или размер превышен
+        """
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise LimitExceededError("time", self.limits.time)
+        if self.limits.size is not None and size > self.limits.size:
+            raise LimitExceededError("size", self.limits.size)
+
+
+_budget: ContextVar[Budget | None] = ContextVar("budget", default=None)
+
+
+def current_budget() -> Budget | None:
+    """
+    Ограничения текущего вызова. Циклы получают их один раз перед началом и
+    вызывают `Budget.check` на каждой итерации, только если ограничения
+    заданы.
+
+    :returns: ограничения или None, если вызов не ограничен
+    """
+    return _budget.get()
+
+
+@contextmanager
+def limited(limits: Limits | None) -> Iterator[None]:
+    """
+    Задаёт ограничения для вычислений внутри блока. Время отсчитывается от
+    входа в блок. Вложенный блок заменяет ограничения внешнего.
+
+    :param limits: ограничения (None или `Limits()` — без ограничений)
+    """
+    if limits is None or limits == Limits():
+        yield
+        return
+    token = _budget.set(Budget(limits))
+    try:
+        yield
+    finally:
+        _budget.reset(token)
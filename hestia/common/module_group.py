@@ -1,38 +1,98 @@
-from functools import reduce
-from typing import Any
+from typing import Callable
 
-from .exceptions import UnknownIdentifierError
-from .types import Module, Identifier
+from .registry import Function, RegistryModule
+from .types import Identifier
 
 
-class ModuleGroup(Module):
+class ModuleGroup(RegistryModule):
     """
     Композитный тип для модулей.
+
+    Реестры функций всех модулей объединяются в общий реестр один раз при
+    создании группы, поэтому вызов функции по идентификатору не зависит от
+    числа модулей.
     """
 
-    def __init__(self, *modules: Module) -> None:
+    def __init__(self, *modules: RegistryModule) -> None:
         self.__modules = modules
+        self._build_registry()
+
+    @property
+    def modules(self) -> tuple[RegistryModule, ...]:
+        """Модули группы"""
+        return self.__modules
 
-    def call(self, identifier: Identifier, args: list[str]) -> Any:
+    def functions(self) -> dict[Identifier, Function]:
         """
-        Вызывает метод, если он реализуется хотя бы одним модулем из группы.
+        Объединяет реестры функций всех модулей группы.
 
-        Если несколько модулей реализуют метод, вызывается метод того модуля,
-        который был указан первым в конструкторе.
+        Если несколько модулей реализуют функцию, используется функция того
+        модуля, который был указан первым в конструкторе.
 
-        :param identifier: Идентификатор метода
-        :param args: Аргументы метода
-        :returns: Результат вызова метода
-        :raises UnknownIdentifierError: если метод не реализован ни одним модулем
+        :returns: словарь «идентификатор → функция»
         """
+        registry: dict[Identifier, Function] = {}
         for module in self.__modules:
-            if identifier in module.methods():
-                return module.call(identifier, args)
-        raise UnknownIdentifierError(identifier)
+            for identifier, function in module.registry.items():
+                registry.setdefault(identifier, function)
+        return registry
+
+
+class LazyModuleGroup(RegistryModule):
+    """
+    Группа модулей, каждый из которых создаётся (и импортируется) при первом
+    вызове функции своего семейства. Семейство функции — префикс её номера
+    (`N` в `N-4`, `P` в `P-11`), поэтому вызов функции натуральных чисел не
+    загружает модули рациональных чисел и многочленов.
+
+    Полный реестр (`registry`, `methods`) загружает все модули.
+    """
+
+    def __init__(self, loaders: dict[str, Callable[[], RegistryModule]]) -> None:
+        """
+        :param loaders: словарь «семейство → функция, создающая модуль»; модуль
+            создаётся не более одного раза
+        """
+        self.__loaders = loaders
+        self.__loaded: dict[str, RegistryModule] = {}
 
-    def methods(self) -> set[Identifier]:
+    def module(self, family: str) -> RegistryModule | None:
         """
-        Возвращает множество всех методов, поддерживаемых всеми модулями из
-        группы.
+        Модуль семейства (создаётся при первом обращении).
+
+        :param family: семейство (`N`, `Z`, `Q`, `P`)
+        :returns: модуль или None, если семейство неизвестно
+        """
+        module = self.__loaded.get(family)
+        if module is None:
+            loader = self.__loaders.get(family)
+            if loader is None:
+                return None
+            module = self.__loaded[family] = loader()
+        return module
+
+    @property
+    def modules(self) -> tuple[RegistryModule, ...]:
+        """Модули группы (загружает все модули)"""
+        return tuple(self.module(family) for family in self.__loaders)
+
+    def function(self, identifier: Identifier) -> Function | None:
+        """
+        Описание функции; загружает только модуль её семейства.
+
+        :param identifier: идентификатор функции
+        :returns: функция или None, если ни один модуль её не реализует
+        """
+        module = self.module(identifier.value.partition("-")[0])
+        return module.registry.get(identifier) if module is not None else None
+
+    def functions(self) -> dict[Identifier, Function]:
+        """
+        Объединяет реестры функций всех модулей группы.
+
+        :returns: словарь «идентификатор → функция»
         """
-        return reduce(lambda acc, cur: acc | cur.methods(), self.__modules, set())
+        registry: dict[Identifier, Function] = {}
+        for module in self.modules:
+            registry.update(module.registry)
+        return registry
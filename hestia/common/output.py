@@ -0,0 +1,99 @@
+"""
+Потоковый вывод чисел и многочленов.
+
+Функции записывают значение в текстовый поток по частям: число — блоками
+десятичных цифр, многочлен — по одному члену. Поэтому вывод огромного
+значения не требует построения его полной строковой записи в памяти. Запись
+совпадает с результатом `str()` соответствующего типа.
+
+Функции обращаются только к полям значений (`value`, `sign`, `natural`,
+`numerator`, `denominator`, `coefficients`) и не зависят от модулей.
+"""
+
+from typing import Any, TextIO
+
+CHUNK_DIGITS = 1 << 16
+
+
+def _is_zero(n: Any) -> bool:
+    return len(n.value) == 1 and n.value[0] == 0
+
+
+def _is_one(n: Any) -> bool:
+    return len(n.value) == 1 and n.value[0] == 1
+
+
+def write_natural(f: TextIO, n: Any, chunk_digits: int = CHUNK_DIGITS) -> None:
+    """
+    Записывает натуральное число блоками по chunk_digits цифр.
+
+    :param f: текстовый поток
+    :param n: натуральное число
+    :param chunk_digits: число цифр в блоке
+    """
+    digits = n.value
+    for end in range(len(digits), 0, -chunk_digits):
+        start = max(0, end - chunk_digits)
+        f.write("".join(map(str, reversed(digits[start:end]))))
+
+
+def write_integer(f: TextIO, z: Any) -> None:
+    """
+    Записывает целое число.
+
+    :param f: текстовый поток
+    :param z: целое число
+    """
+    if z.sign == 1:
+        f.write("-")
+    write_natural(f, z.natural)
+
+
+def write_rational(f: TextIO, q: Any) -> None:
+    """
+    Записывает рациональное число (знаменатель, равный 1, не выводится).
+
+    :param f: текстовый поток
+    :param q: рациональное число
+    """
+    write_integer(f, q.numerator)
+    if not _is_one(q.denominator):
+        f.write("/")
+        write_natural(f, q.denominator)
+
+
+def write_polynomial(f: TextIO, p: Any) -> None:
+    """
+    Записывает многочлен по членам, от старшей степени к младшей.
+
+    :param f: текстовый поток
+    :param p: многочлен
+    """
+    first = True
+    for i in range(len(p.coefficients) - 1, -1, -1):
+        coef = p.coefficients[i]
+        numerator = coef.numerator
+        if _is_zero(numerator.natural):
+            continue
+
+        if first:
+            if numerator.sign == 1:
+                f.write("-")
+        else:
+            f.write(" - " if numerator.sign == 1 else " + ")
+        first = False
+
+        unit = _is_one(numerator.natural) and _is_one(coef.denominator)
+        if not unit or i == 0:
+            write_natural(f, numerator.natural)
+            if not _is_one(coef.denominator):
+                f.write("/")
+                write_natural(f, coef.denominator)
+
+        if i == 1:
+            f.write("x")
+        elif i > 1:
+            f.write(f"x^{i}")
+
+    if first:
+        f.write("0")
@@ -0,0 +1,218 @@
+"""
+Профилирование функций модулей: число вызовов, суммарное время и
+распределение размеров операндов для каждого метода модулей N/Z/Q/P,
+включая вложенные вызовы (например, `NaturalModule.gcd` внутри
+`RationalModule.reduce_fraction`).
+
+Профилирование включается явно: `Profile.instrument` заменяет методы
+экземпляра модуля обёртками, которые учитывают вызовы. Модули без обёрток
+работают как обычно, поэтому выключенное профилирование ничего не стоит.
+
+    profile = Profile()
+    group = build_module_group(profile=profile)
+    group.invoke(Identifier.NMR_P_P, p)
+    print(profile.report())
+"""
+
+import functools
+import time
+from collections import Counter
+from typing import Any, Callable
+
+from .registry import RegistryModule
+
+# Методы, которые не являются операциями модуля и не профилируются
+_SKIPPED_METHODS = frozenset({"functions", "call", "invoke", "methods"})
+
+
+def operand_size(v: Any) -> int:
+    """
+    Размер операнда в десятичных цифрах: для натуральных и целых чисел — число
+    цифр, для рациональных — сумма цифр числителя и знаменателя, для
+    многочленов — сумма размеров коэффициентов. Для остальных значений
+    (например, `int`-показателей степени) размер равен 0.
+
+    Как и `hestia.common.output`, функция обращается только к полям значений
+    и не импортирует модули.
+
+    :param v: операнд
+    :returns: размер
+    """
+    if isinstance(v, int):
+        return 0
+    if hasattr(v, "value"):
+        return len(v.value)
+    if hasattr(v, "natural"):
+        return len(v.natural.value)
+    if hasattr(v, "denominator"):
+        return len(v.numerator.natural.value) + len(v.denominator.value)
+    if hasattr(v, "coefficients"):
+        return sum(operand_size(c) for c in v.coefficients)
+    return 0
+
+
+def size_bucket(size: int) -> int:
+    """
+    Корзина гистограммы размеров: наименьшая степень двойки, не меньшая size
+    (0 для операндов без размера).
+
+    :param size: размер операнда
+    :returns: верхняя граница корзины
+    """
+    return 1 << (size - 1).bit_length() if size > 0 else 0
+
+
+def instrument(
+    module: RegistryModule,
+    wrap: Callable[[str, Callable[..., Any]], Callable[..., Any]],
+) -> None:
+    """
+    Заменяет методы экземпляра модуля обёртками. Вызовы между модулями идут
+    через атрибуты экземпляров (`self.natural_module.gcd(...)`), поэтому
+    обёртки видят и вложенные вызовы. Модуль нужно инструментировать до
+    создания группы модулей: реестр группы хранит методы, полученные при её
+    создании. Повторная инструментация оборачивает уже созданные обёртки.
+
+    :param module: модуль
+    :param wrap: функция, которая по имени метода (`NaturalModule.gcd`) и
+        самому методу возвращает обёртку
+    """
+    for cls in type(module).__mro__:
+        if cls is RegistryModule:
+            break
+        for name, attr in vars(cls).items():
+            if (
+                not callable(attr)
+                or isinstance(attr, type)
+                or name.startswith("__")
+                or name in _SKIPPED_METHODS
+            ):
+                continue
+            qualified = f"{type(module).__name__}.{name}"
+            setattr(module, name, wrap(qualified, getattr(module, name)))
+
+    # Реестр модуля строится заново — уже с обёрнутыми методами
+    module.__dict__.pop("_registry", None)
+    module.__dict__.pop("_methods", None)
+
+
+class OperationStats:
+    """
+    Статистика вызовов одного метода.
+
+    - `calls` — число вызовов;
+    - `total_time` — суммарное время с учётом вложенных вызовов, с
+      (рекурсивные вызовы не учитываются повторно);
+    - `own_time` — время без учёта вложенных профилируемых вызовов, с;
+    - `sizes` — гистограмма «корзина размера → число вызовов» по наибольшему
+      из операндов (см. `size_bucket`).
+    """
+
+    __slots__ = ("calls", "total_time", "own_time", "sizes", "_depth")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_time = 0.0
+        self.own_time = 0.0
+        self.sizes: Counter[int] = Counter()
+        self._depth = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Статистика в виде, пригодном для сохранения в JSON"""
+        return {
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "own_time": self.own_time,
+            "sizes": {str(k): v for k, v in sorted(self.sizes.items())},
+        }
+
+
+class Profile:
+    """
+    Накопитель статистики вызовов методов модулей.
+    """
+
+    def __init__(self) -> None:
+        self.stats: dict[str, OperationStats] = {}
+        # Время вложенных вызовов для каждого незавершённого вызова
+        self._children: list[float] = []
+
+    def instrument(self, module: RegistryModule) -> None:
+        """
+        Заменяет методы экземпляра модуля обёртками, которые учитывают вызовы
+        в этом профиле (см. `instrument`).
+
+        :param module: модуль
+        """
+        instrument(module, self._wrap)
+
+    def _wrap(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        stats = self.stats.setdefault(name, OperationStats())
+        children = self._children
+        clock = time.perf_counter
+
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            size = max(map(operand_size, args), default=0)
+            stats.calls += 1
+            stats.sizes[size_bucket(size)] += 1
+            stats._depth += 1
+            children.append(0.0)
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                nested = children.pop()
+                if children:
+                    children[-1] += elapsed
+                stats._depth -= 1
+                if stats._depth == 0:
+                    stats.total_time += elapsed
+                stats.own_time += elapsed - nested
+
+        return wrapper
+
+    def reset(self) -> None:
+        """Обнуляет накопленную статистику"""
+        for name in self.stats:
+            stats = self.stats[name]
+            stats.calls = 0
+            stats.total_time = stats.own_time = 0.0
+            stats.sizes.clear()
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """
+        Статистика вызванных методов в виде, пригодном для сохранения в JSON.
+
+        :returns: словарь «метод → статистика»
+        """
+        return {
+            name: stats.as_dict() for name, stats in self.stats.items() if stats.calls
+        }
+
+    def report(self, limit: int | None = None) -> str:
+        """
+        Текстовый отчёт: вызванные методы в порядке убывания суммарного
+        времени.
+
+        :param limit: наибольшее число строк отчёта (по умолчанию — все)
+        :returns: отчёт
+        """
+        called = sorted(
+            ((name, s) for name, s in self.stats.items() if s.calls),
+            key=lambda item: item[1].total_time,
+            reverse=True,
+        )[:limit]
+        width = max((len(name) for name, _ in called), default=0)
+        lines = [
+            f"{'Метод':<{width}} {'вызовы':>9} {'всего, мс':>11} "
+            f"{'своё, мс':>11}  размер операндов (цифр): вызовы"
+        ]
+        for name, s in called:
+            sizes = " ".join(f"≤{k}:{v}" for k, v in sorted(s.sizes.items()))
+            lines.append(
+                f"{name:<{width}} {s.calls:>9} {s.total_time * 1e3:>11.3f} "
+                f"{s.own_time * 1e3:>11.3f}  {sizes}"
+            )
+        return "\n".join(lines)
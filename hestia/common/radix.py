@@ -0,0 +1,62 @@
+"""
+Запись целых чисел в системах счисления с основанием 2^k.
+
+Поддерживаются двоичная (2), восьмеричная (8), шестнадцатеричная (16)
+системы и base64 (64) — кодирование байтов числа (big-endian) по RFC 4648.
+Преобразование между такими записями и `int` выполняется за линейное время,
+в отличие от десятичной записи.
+"""
+
+import base64
+import binascii
+
+RADIXES = (2, 8, 10, 16, 64)
+
+_FORMATS = {2: "b", 8: "o", 16: "x"}
+
+
+def format_int(n: int, radix: int) -> str:
+    """
+    Запись неотрицательного числа в системе счисления radix.
+
+    :param n: неотрицательное число
+    :param radix: основание (2, 8, 10, 16 или 64)
+    :returns: запись числа (без префикса системы счисления)
+    :raises ValueError: если основание не поддерживается
+    """
+    if radix == 64:
+        size = max(1, (n.bit_length() + 7) // 8)
+        return base64.b64encode(n.to_bytes(size, "big")).decode("ascii")
+    if radix == 10:
+        return str(n)
+    if radix not in _FORMATS:
+        raise ValueError(f"Неподдерживаемое основание системы счисления: {radix}")
+    return format(n, _FORMATS[radix])
+
+
+def parse_int(s: str, radix: int) -> int:
+    """
+    Неотрицательное число по его записи в системе счисления radix.
+
+    :param s: запись числа
+    :param radix: основание (2, 8, 10, 16 или 64)
+    :returns: число
+    :raises ValueError: если запись неверна или основание не поддерживается
+    """
+    if radix not in RADIXES:
+        raise ValueError(f"Неподдерживаемое основание системы счисления: {radix}")
+    s = s.strip()
+    if radix == 64:
+        try:
+            data = base64.b64decode(s, validate=True)
+        except binascii.Error:
+            raise ValueError("Неверная запись числа в base64")
+        if not data:
+            raise ValueError("Неверная запись числа в base64")
+        return int.from_bytes(data, "big")
+    if not s or s[0] in "+-":
+        raise ValueError(f"Неверная запись натурального числа в системе {radix}")
+    try:
+        return int(s, radix)
+    except ValueError:
+        raise ValueError(f"Неверная запись натурального числа в системе {radix}")
@@ -0,0 +1,164 @@
+"""
+Реестр функций модулей.
+
+Модуль описывает свои функции один раз — словарём «идентификатор →
+`Function`», где `Function` хранит связанный метод модуля и типы его
+аргументов. По этому словарю строятся `call` (вызов со строковыми
+аргументами), `invoke` (вызов с готовыми значениями, без разбора строк) и
+`methods`: вызов по идентификатору сводится к поиску в словаре (`function`), а
+сам реестр можно просматривать (число и типы аргументов каждой функции) из
+пакетного режима, сервера и т.п.
+"""
+
+from abc import abstractmethod
+from typing import Any, Callable
+
+from .exceptions import UnknownIdentifierError
+from .types import Identifier, Module
+from .utils import ensure_args
+
+
+class Function:
+    """
+    Описание функции модуля: метод и типы его аргументов.
+
+    Тип аргумента задаёт и проверку значения при прямом вызове (`invoke`), и
+    разбор строки при вызове по строковым аргументам (`__call__`): строка
+    преобразуется методом класса `from_str()` типа, а для типов без него
+    (например, `int`) — самим типом.
+    """
+
+    def __init__(self, method: Callable[..., Any], *types: type):
+        """
+        :param method: связанный метод модуля
+        :param types: типы аргументов метода (по одному на аргумент)
+        """
+        self.method = method
+        self.types = types
+        self.parsers: tuple[Callable[[str], Any], ...] = tuple(
+            getattr(t, "from_str", t) for t in types
+        )
+
+    @property
+    def arity(self) -> int:
+        """Число аргументов функции"""
+        return len(self.types)
+
+    def parse(self, identifier: Identifier, args: list[str]) -> list[Any]:
+        """
+        Проверяет число аргументов и преобразует их из строк.
+
+        :param identifier: идентификатор функции (для сообщения об ошибке)
+        :param args: аргументы в виде строк
+        :returns: преобразованные аргументы
+        :raises InvalidArgumentsError: если число аргументов неверно
+        """
+        ensure_args(identifier, args, len(self.parsers))
+        return [parse(arg) for parse, arg in zip(self.parsers, args)]
+
+    def __call__(self, identifier: Identifier, args: list[str]) -> Any:
+        """
+        Вызывает метод с аргументами, заданными строками.
+
+        :param identifier: идентификатор функции
+        :param args: аргументы в виде строк
+        :returns: результат метода
+        """
+        return self.method(*self.parse(identifier, args))
+
+    def invoke(self, identifier: Identifier, args: tuple[Any, ...]) -> Any:
+        """
+        Вызывает метод с готовыми значениями аргументов (без разбора строк).
+
+        :param identifier: идентификатор функции (для сообщения об ошибке)
+        :param args: значения аргументов
+        :returns: результат метода
+        :raises InvalidArgumentsError: если число аргументов неверно
+        :raises TypeError: если тип аргумента не совпадает с объявленным
+        """
+        ensure_args(identifier, args, len(self.types))
+        for i, (arg, t) in enumerate(zip(args, self.types), start=1):
+            if not isinstance(arg, t):
+                raise TypeError(
+                    f"{identifier.name}: аргумент {i} должен иметь тип "
+                    f"{t.__name__}, а не {type(arg).__name__}"
+                )
+        return self.method(*args)
+
+
+class RegistryModule(Module):
+    """
+    Модуль, функции которого описаны реестром (см. `functions`). Реестр
+    строится один раз при первом обращении.
+    """
+
+    @abstractmethod
+    def functions(self) -> dict[Identifier, Function]:
+        """
+        Описание функций модуля.
+
+        :returns: словарь «идентификатор → функция»
+        """
+        ...
+
+    @property
+    def registry(self) -> dict[Identifier, Function]:
+        """Реестр функций модуля (строится один раз)"""
+        if "_registry" not in self.__dict__:
+            self._build_registry()
+        return self._registry
+
+    def _build_registry(self) -> None:
+        """Строит реестр и множество идентификаторов функций"""
+        self._registry = self.functions()
+        self._methods = frozenset(self._registry)
+
+    def function(self, identifier: Identifier) -> Function | None:
+        """
+        Описание одной функции модуля.
+
+        :param identifier: идентификатор функции
+        :returns: функция или None, если модуль её не реализует
+        """
+        return self.registry.get(identifier)
+
+    def call(self, identifier: Identifier, args: list[str]) -> Any:
+        """
+        Вызывает функцию модуля по идентификатору.
+
+        :param identifier: идентификатор функции
+        :param args: аргументы функции в виде строк
+        :returns: результат функции
+        :raises UnknownIdentifierError: если модуль не реализует функцию
+        :raises InvalidArgumentsError: если число аргументов неверно
+        """
+        function = self.function(identifier)
+        if function is None:
+            raise UnknownIdentifierError(identifier)
+        return function(identifier, args)
+
+    def invoke(self, identifier: Identifier, *args: Any) -> Any:
+        """
+        Вызывает функцию модуля с уже созданными значениями аргументов, без
+        преобразования из строк. Например,
+        `group.invoke(Identifier.MUL_PP_P, a, b)` для многочленов a и b.
+
+        :param identifier: идентификатор функции
+        :param args: значения аргументов
+        :returns: результат функции
+        :raises UnknownIdentifierError: если модуль не реализует функцию
+        :raises InvalidArgumentsError: если число аргументов неверно
+        :raises TypeError: если тип аргумента не совпадает с объявленным
+        """
+        function = self.function(identifier)
+        if function is None:
+            raise UnknownIdentifierError(identifier)
+        return function.invoke(identifier, args)
+
+    def methods(self) -> frozenset[Identifier]:
+        """
+        Возвращает множество идентификаторов функций, реализуемых модулем.
+        """
+        if "_methods" not in self.__dict__:
+            self._build_registry()
+        return self._methods
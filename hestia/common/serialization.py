@@ -0,0 +1,336 @@
+"""
+Двоичный формат чисел и многочленов.
+
+Файл (или строка байтов) состоит из заголовка длиной 8 байт и массива
+64-битных беззнаковых слов в порядке little-endian:
+
+- заголовок: сигнатура `HSTA`, версия формата, тип значения (`N`, `Z`, `Q`
+  или `P`), флаги (бит 0 — массив слов сжат zlib) и зарезервированный байт;
+- натуральное число: число лимбов, затем лимбы от младших к старшим. Лимб
+  хранит 19 десятичных цифр (основание 10^19), поэтому преобразование из
+  внутреннего представления `NaturalNumber` (десятичные цифры) и обратно
+  выполняется за линейное время;
+- целое число: знак (0 или 1), затем натуральное число (модуль);
+- рациональное число: целое число (числитель), затем натуральное
+  (знаменатель);
+- многочлен: число коэффициентов n, таблица из n + 1 смещений записей
+  коэффициентов (в словах от начала области записей), затем записи
+  коэффициентов (рациональные числа) от младших степеней к старшим.
+
+Таблица смещений позволяет читать отдельные коэффициенты большого многочлена
+из файла, отображённого в память (`MappedFile`), не загружая и не копируя
+остальные.
+"""
+
+import mmap
+import sys
+import zlib
+from array import array
+from typing import BinaryIO, Union
+
+from hestia.integer import Integer
+from hestia.natural import NaturalNumber
+from hestia.polynomial import Polynomial
+from hestia.rational import RationalNumber
+
+Value = Union[NaturalNumber, Integer, RationalNumber, Polynomial]
+
+MAGIC = b"HSTA"
+FORMAT_VERSION = 1
+HEADER_SIZE = 8
+FLAG_ZLIB = 1
+
+LIMB_DIGITS = 19
+
+_TAGS: dict[type, bytes] = {
+    NaturalNumber: b"N",
+    Integer: b"Z",
+    RationalNumber: b"Q",
+    Polynomial: b"P",
+}
+
+
+def _natural_limbs(n: NaturalNumber) -> list[int]:
+    """Лимбы (по 19 десятичных цифр) натурального числа от младших к старшим"""
+    digits = "".join(map(str, reversed(n.value)))
+    return [
+        int(digits[max(0, end - LIMB_DIGITS) : end])
+        for end in range(len(digits), 0, -LIMB_DIGITS)
+    ]
+
+
+def _write_natural(words: list[int], n: NaturalNumber) -> None:
+    limbs = _natural_limbs(n)
+    words.append(len(limbs))
+    words.extend(limbs)
+
+
+def _write_integer(words: list[int], z: Integer) -> None:
+    words.append(z.sign)
+    _write_natural(words, z.natural)
+
+
+def _write_rational(words: list[int], q: RationalNumber) -> None:
+    _write_integer(words, q.numerator)
+    _write_natural(words, q.denominator)
+
+
+def _write_polynomial(words: list[int], p: Polynomial) -> None:
+    count = len(p.coefficients)
+    words.append(count)
+    table = len(words)
+    words.extend([0] * (count + 1))
+    start = len(words)
+    for i, coef in enumerate(p.coefficients):
+        words[table + i] = len(words) - start
+        _write_rational(words, coef)
+    words[table + count] = len(words) - start
+
+
+_WRITERS = {
+    b"N": _write_natural,
+    b"Z": _write_integer,
+    b"Q": _write_rational,
+    b"P": _write_polynomial,
+}
+
+
+class _Reader:
+    """Последовательное чтение значений из массива слов"""
+
+    def __init__(self, words, pos: int = 0) -> None:
+        self.words = words
+        self.pos = pos
+
+    def word(self) -> int:
+        if self.pos >= len(self.words):
+            raise ValueError("Данные повреждены: неожиданный конец")
+        w = self.words[self.pos]
+        self.pos += 1
+        return w
+
+    def natural(self) -> NaturalNumber:
+        count = self.word()
+        end = self.pos + count
+        if count == 0 or end > len(self.words):
+            raise ValueError("Данные повреждены: неверная длина числа")
+        limbs = self.words[self.pos : end]
+        self.pos = end
+        if max(limbs) >= 10**LIMB_DIGITS:
+            raise ValueError("Данные повреждены: неверный лимб")
+        digits = "".join(f"{limb:019d}" for limb in reversed(limbs))
+        return NaturalNumber.from_digits([int(d) for d in reversed(digits)])
+
+    def integer(self) -> Integer:
+        sign = self.word()
+        if sign not in (0, 1):
+            raise ValueError("Данные повреждены: неверный знак")
+        return Integer(sign=sign, natural=self.natural())
+
+    def rational(self) -> RationalNumber:
+        return RationalNumber(self.integer(), self.natural())
+
+    def polynomial(self) -> Polynomial:
+        count = self.word()
+        self.pos += count + 1
+        return Polynomial([self.rational() for _ in range(count)])
+
+    def value(self, tag: bytes) -> Value:
+        return {
+            b"N": self.natural,
+            b"Z": self.integer,
+            b"Q": self.rational,
+            b"P": self.polynomial,
+        }[tag]()
+
+
+def _header(tag: bytes, flags: int) -> bytes:
+    return MAGIC + bytes([FORMAT_VERSION]) + tag + bytes([flags, 0])
+
+
+def _parse_header(header: bytes) -> tuple[bytes, int]:
+    """
+    Проверяет заголовок.
+
+    :returns: тип значения и флаги
+    :raises ValueError: если заголовок неверен или версия не поддерживается
+    """
+    if len(header) < HEADER_SIZE or header[:4] != MAGIC:
+        raise ValueError("Неверный формат данных")
+    if header[4] != FORMAT_VERSION:
+        raise ValueError(f"Неподдерживаемая версия формата: {header[4]}")
+    tag = bytes(header[5:6])
+    if tag not in _WRITERS:
+        raise ValueError("Неизвестный тип значения")
+    return tag, header[6]
+
+
+def _words_from_bytes(data) -> array:
+    """Массив слов из байтов little-endian (с копированием)"""
+    if len(data) % 8:
+        raise ValueError("Данные повреждены: длина не кратна 8 байтам")
+    words = array("Q")
+    words.frombytes(data)
+    if sys.byteorder == "big":
+        words.byteswap()
+    return words
+
+
+def to_bytes(value: Value, compress: bool = False) -> bytes:
+    """
+    Сериализует число или многочлен в двоичный формат.
+
+    :param value: натуральное, целое, рациональное число или многочлен
+    :param compress: сжать данные zlib
+    :returns: байты
+    :raises TypeError: если тип значения не поддерживается
+    """
+    tag = _TAGS.get(type(value))
+    if tag is None:
+        raise TypeError(f"Тип {type(value).__name__} не поддерживается")
+
+    words: list[int] = []
+    _WRITERS[tag](words, value)
+    payload = array("Q", words)
+    if sys.byteorder == "big":
+        payload.byteswap()
+    data = payload.tobytes()
+
+    flags = 0
+    if compress:
+        data = zlib.compress(data)
+        flags |= FLAG_ZLIB
+    return _header(tag, flags) + data
+
+
+def from_bytes(data: bytes) -> Value:
+    """
+    Восстанавливает значение, сериализованное функцией `to_bytes`.
+
+    :param data: байты
+    :returns: натуральное, целое, рациональное число или многочлен
+    :raises ValueError: если данные повреждены или версия не поддерживается
+    """
+    tag, flags = _parse_header(data[:HEADER_SIZE])
+    payload = data[HEADER_SIZE:]
+    if flags & FLAG_ZLIB:
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error:
+            raise ValueError("Данные повреждены: ошибка распаковки")
+    return _Reader(_words_from_bytes(payload)).value(tag)
+
+
+def dump(value: Value, f: BinaryIO, compress: bool = False) -> None:
+    """
+    Записывает значение в двоичный файл.
+
+    :param value: значение
+    :param f: файл, открытый на запись в двоичном режиме
+    :param compress: сжать данные zlib
+    """
+    f.write(to_bytes(value, compress))
+
+
+def load(f: BinaryIO) -> Value:
+    """
+    Читает значение из двоичного файла.
+
+    :param f: файл, открытый на чтение в двоичном режиме
+    :returns: значение
+    """
+    return from_bytes(f.read())
+
+
+class MappedFile:
+    """
+    Файл в двоичном формате, отображённый в память.
+
+    Несжатые данные не копируются: массив слов читается прямо из отображения,
+    поэтому коэффициенты многочлена можно получать по одному (`coefficient`)
+    без чтения остальных. Сжатый файл распаковывается в память целиком.
+
+    Пример::
+
+        with MappedFile("poly.hst") as f:
+            lc = f.coefficient(f.degree)
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: путь к файлу
+        :raises ValueError: если формат файла неверен
+        """
+        self.__file = open(path, "rb")
+        self.__mmap = None
+        try:
+            self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.tag, flags = _parse_header(self.__mmap[:HEADER_SIZE])
+            payload = memoryview(self.__mmap)[HEADER_SIZE:]
+            if flags & FLAG_ZLIB or sys.byteorder == "big":
+                data = bytes(payload)
+                payload.release()
+                if flags & FLAG_ZLIB:
+                    data = zlib.decompress(data)
+                self.__words = _words_from_bytes(data)
+            else:
+                if len(payload) % 8:
+                    payload.release()
+                    raise ValueError("Данные повреждены: длина не кратна 8 байтам")
+                self.__words = payload.cast("Q")
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> "MappedFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Освобождает отображение и закрывает файл"""
+        words = self.__dict__.pop("_MappedFile__words", None)
+        if isinstance(words, memoryview):
+            words.release()
+        if self.__mmap is not None:
+            self.__mmap.close()
+            self.__mmap = None
+        self.__file.close()
+
+    def value(self) -> Value:
+        """
+        Значение, хранящееся в файле, целиком.
+
+        :returns: значение
+        """
+        return _Reader(self.__words).value(self.tag)
+
+    def __len__(self) -> int:
+        """Число коэффициентов многочлена"""
+        self._ensure_polynomial()
+        return self.__words[0]
+
+    @property
+    def degree(self) -> int:
+        """Степень многочлена"""
+        return len(self) - 1
+
+    def coefficient(self, i: int) -> RationalNumber:
+        """
+        Коэффициент многочлена при x^i (читается только его запись).
+
+        :param i: степень
+        :returns: коэффициент (ноль, если i больше степени)
+        """
+        count = len(self)
+        if i < 0:
+            raise IndexError("Степень не может быть отрицательной")
+        if i >= count:
+            return RationalNumber(Integer(0), NaturalNumber(1))
+        start = 1 + count + 1
+        return _Reader(self.__words, start + self.__words[1 + i]).rational()
+
+    def _ensure_polynomial(self) -> None:
+        if self.tag != b"P":
+            raise TypeError("Файл не содержит многочлен")
@@ -0,0 +1,184 @@
+"""
+Трассировка вызовов методов модулей: дерево вложенных вызовов, которое
+порождает один запрос (например, DIV_PP_P → `multiply_by_rational` →
+`RationalModule.multiplication` → `reduce_fraction` → `NaturalModule.gcd` →
+`modulus`), с размерами операндов и длительностями.
+
+Трассу можно сохранить в двух форматах:
+
+- Chrome trace event JSON (`write_chrome`) — открывается в
+  `chrome://tracing`, Perfetto или speedscope;
+- свёрнутые стеки (`write_folded`) — строки `a;b;c время`, которые
+  принимают flamegraph.pl, inferno и speedscope.
+
+Как и профилирование (`hestia.common.profiling`), трассировка включается
+явно и без неё модули не изменяются.
+
+    tracer = Tracer()
+    group = build_module_group(tracer=tracer)
+    group.invoke(Identifier.DIV_PP_P, a, b)
+    with open("trace.json", "w") as f:
+        tracer.write_chrome(f)
+"""
+
+import functools
+import time
+from collections import Counter
+from typing import Any, Callable, NamedTuple, TextIO
+
+from .profiling import instrument, operand_size
+from .registry import RegistryModule
+
+DEFAULT_MAX_EVENTS = 1_000_000
+TRACE_FORMATS = ("chrome", "folded")
+
+
+class TraceEvent(NamedTuple):
+    """
+    Завершённый вызов метода: имя, глубина вложенности, время начала от
+    создания трассировщика и длительность (нс), наибольший размер операнда
+    (в десятичных цифрах).
+    """
+
+    name: str
+    depth: int
+    start: int
+    duration: int
+    size: int
+
+
+class Tracer:
+    """
+    Запись дерева вызовов методов модулей.
+
+    Каждый вызов сохраняется как `TraceEvent` (не более max_events событий,
+    остальные только подсчитываются в `dropped`), а собственное время вызовов
+    дополнительно суммируется по стекам вызовов в `stacks`, поэтому свёрнутые
+    стеки точны при любом числе вызовов.
+    """
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        """
+        :param max_events: наибольшее число сохраняемых событий
+        """
+        self.max_events = max_events
+        self.events: list[TraceEvent] = []
+        self.dropped = 0
+        # Собственное время (нс) для каждого стека вызовов
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self._origin = time.perf_counter_ns()
+        self._stack: list[str] = []
+        # Время вложенных вызовов для каждого незавершённого вызова
+        self._children: list[int] = []
+
+    def instrument(self, module: RegistryModule) -> None:
+        """
+        Заменяет методы экземпляра модуля обёртками, которые записывают вызовы
+        в эту трассу (см. `hestia.common.profiling.instrument`).
+
+        :param module: модуль
+        """
+        instrument(module, self._wrap)
+
+    def _wrap(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        stack = self._stack
+        children = self._children
+        events = self.events
+        clock = time.perf_counter_ns
+
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            size = max(map(operand_size, args), default=0)
+            stack.append(name)
+            children.append(0)
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                nested = children.pop()
+                if children:
+                    children[-1] += elapsed
+                self.stacks[tuple(stack)] += elapsed - nested
+                stack.pop()
+                if len(events) < self.max_events:
+                    events.append(
+                        TraceEvent(
+                            name, len(stack), start - self._origin, elapsed, size
+                        )
+                    )
+                else:
+                    self.dropped += 1
+
+        return wrapper
+
+    def clear(self) -> None:
+        """Удаляет записанные вызовы"""
+        self.events.clear()
+        self.stacks.clear()
+        self.dropped = 0
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """
+        Трасса в формате Chrome trace event: события полной длительности
+        (`"ph": "X"`) со временем в микросекундах.
+
+        :returns: объект для сохранения в JSON
+        """
+        return {
+            "traceEvents": [
+                {
+                    "name": event.name,
+                    "cat": event.name.partition(".")[0],
+                    "ph": "X",
+                    "ts": event.start / 1e3,
+                    "dur": event.duration / 1e3,
+                    "pid": 1,
+                    "tid": 1,
+                    "args": {"size": event.size, "depth": event.depth},
+                }
+                for event in self.events
+            ],
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped": self.dropped},
+        }
+
+    def write_chrome(self, f: TextIO) -> None:
+        """
+        Записывает трассу в формате Chrome trace event JSON.
+
+        :param f: текстовый поток
+        """
+        import json
+
+        json.dump(self.chrome_trace(), f)
+
+    def write_folded(self, f: TextIO) -> None:
+        """
+        Записывает свёрнутые стеки: строки `внешний;...;внутренний время`, где
+        время — собственное время стека в микросекундах.
+
+        :param f: текстовый поток
+        """
+        for stack, own in sorted(self.stacks.items()):
+            microseconds = round(own / 1e3)
+            if microseconds > 0:
+                f.write(f"{';'.join(stack)} {microseconds}\n")
+
+
+def write_trace(tracer: Tracer, path: str, fmt: str = "chrome") -> None:
+    """
+    Сохраняет трассу в файл.
+
+    :param tracer: трассировщик
+    :param path: путь к файлу
+    :param fmt: формат из `TRACE_FORMATS`
+    :raises ValueError: если формат не поддерживается
+    """
+    if fmt not in TRACE_FORMATS:
+        raise ValueError(f"Неподдерживаемый формат трассы: {fmt}")
+    with open(path, "w", encoding="utf-8") as f:
+        if fmt == "chrome":
+            tracer.write_chrome(f)
+        else:
+            tracer.write_folded(f)
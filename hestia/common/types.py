@@ -23,6 +23,14 @@ class Identifier(str, Enum):
     MOD_NN_N = "N-12"
     GCF_NN_N = "N-13"
     LCM_NN_N = "N-14"
+    POW_Nk_N = "N-15"
+    POWM_NNN_N = "N-16"
+    SQRT_N_N = "N-17"
+    ROOT_Nk_N = "N-18"
+    PRIME_N_B = "N-19"
+    PRIMES_N_N = "N-20"
+    FACT_N_N = "N-21"
+    BINOM_NN_N = "N-22"
 
     ABS_Z_N = "Z-1"
     POZ_Z_D = "Z-2"
@@ -35,6 +43,7 @@ class Identifier(str, Enum):
     MUL_ZZ_Z = "Z-8"
     DIV_ZZ_Z = "Z-9"
     MOD_ZZ_Z = "Z-10"
+    POW_Zk_Z = "Z-11"
 
     RED_Q_Q = "Q-1"
     INT_Q_B = "Q-2"
@@ -44,6 +53,7 @@ class Identifier(str, Enum):
     SUB_QQ_Q = "Q-6"
     MUL_QQ_Q = "Q-7"
     DIV_QQ_Q = "Q-8"
+    POW_Qk_Q = "Q-9"
 
     ADD_PP_P = "P-1"
     SUB_PP_P = "P-2"
@@ -58,6 +68,15 @@ class Identifier(str, Enum):
     GCF_PP_P = "P-11"
     DER_P_P = "P-12"
     NMR_P_P = "P-13"
+    FCT_P_P = "P-14"
+    RRT_P_Q = "P-15"
+    ISO_P_I = "P-16"
+    RES_PP_Q = "P-17"
+    DSC_P_Q = "P-18"
+    SRS_PP_P = "P-19"
+    CMP_PP_P = "P-20"
+    SHF_PQ_P = "P-21"
+    POW_Pk_P = "P-22"
 
     @classmethod
     def from_str(cls, s: str) -> "Identifier":
@@ -73,11 +92,8 @@ class Identifier(str, Enum):
         except KeyError:
             pass
 
-        for member in Identifier:
-            if member.value == s:
-                return member
-
-        raise ValueError(f"'{s}' is not a valid Identifier")
+        # Поиск по номеру выполняется по словарю значений перечисления
+        return Identifier(s)
 
 
 class Module(metaclass=ABCMeta):
@@ -1,6 +1,10 @@
+from typing import Callable, TypeVar
+
 from .exceptions import InvalidArgumentsError
 from .types import Identifier
 
+T = TypeVar("T")
+
 
 def ensure_args(identifier: Identifier, args: list[str], expected_length: int):
     """
@@ -13,3 +17,66 @@ def ensure_args(identifier: Identifier, args: list[str], expected_length: int):
     """
     if len(args) != expected_length:
         raise InvalidArgumentsError(identifier, expected_length, len(args))
+
+
+def sliding_window_power(
+    base: T, exponent: int, multiply: Callable[[T, T], T], one: T
+) -> T:
+    """
+    Возведение в натуральную степень методом скользящего окна.
+
+    Предвычисляются нечётные степени base, base^3, ..., base^(2^w - 1), после
+    чего показатель просматривается от старших битов к младшим окнами не
+    длиннее w бит, начинающимися и заканчивающимися единицей. Требуется
+    около log2(exponent) возведений в квадрат и log2(exponent) / (w + 1)
+    умножений.
+
+    :param base: основание
+    :param exponent: неотрицательный показатель
+    :param multiply: функция умножения двух значений
+    :param one: единица (результат при нулевом показателе)
+    :returns: base в степени exponent
+    """
+    if exponent < 0:
+        raise ValueError("Показатель степени не может быть отрицательным")
+    if exponent == 0:
+        return one
+
+    bits = exponent.bit_length()
+    if bits <= 8:
+        width = 1
+    elif bits <= 64:
+        width = 3
+    elif bits <= 512:
+        width = 4
+    else:
+        width = 5
+
+    table = [base]
+    if width > 1:
+        square = multiply(base, base)
+        for _ in range((1 << (width - 1)) - 1):
+            table.append(multiply(table[-1], square))
+
+    result = None
+    i = bits - 1
+    while i >= 0:
+        if not (exponent >> i) & 1:
+            result = multiply(result, result)
+            i -= 1
+            continue
+
+        j = max(i - width + 1, 0)
+        while not (exponent >> j) & 1:
+            j += 1
+        window = (exponent >> j) & ((1 << (i - j + 1)) - 1)
+
+        if result is not None:
+            for _ in range(i - j + 1):
+                result = multiply(result, result)
+            result = multiply(result, table[window >> 1])
+        else:
+            result = table[window >> 1]
+        i = j - 1
+
+    return result
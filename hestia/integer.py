@@ -6,11 +6,8 @@
 - Гриценко Кирилл <kirill.grizenko53@gmail.com>
 """
 
-from typing import Any
-
-from hestia.common.exceptions import UnknownIdentifierError
-from hestia.common.types import Identifier, Module
-from hestia.common.utils import ensure_args
+from hestia.common.registry import Function, RegistryModule
+from hestia.common.types import Identifier
 from hestia.natural import NaturalNumber, NaturalModule
 
 
@@ -66,6 +63,12 @@ class Integer:
             return False
         return self.sign == other.sign and self.natural.value == other.natural.value
 
+    def __int__(self) -> int:
+        """Преобразование в целое число Python."""
+        if self.sign == 1:
+            return -int(self.natural)
+        return int(self.natural)
+
     @classmethod
     def from_str(cls, s: str) -> "Integer":
         """Создание целого числа из строки."""
@@ -82,6 +85,19 @@ class Integer:
         natural = NaturalNumber.from_str(digits_str)
         return cls(sign=sign, natural=natural)
 
+    def to_radix(self, radix: int) -> str:
+        """Запись числа в системе счисления radix (знак — префикс '-')."""
+        sign = "-" if self.sign == 1 else ""
+        return sign + self.natural.to_radix(radix)
+
+    @classmethod
+    def from_radix(cls, s: str, radix: int) -> "Integer":
+        """Создание целого числа из записи в системе счисления radix."""
+        s = s.strip()
+        sign = 1 if s.startswith("-") else 0
+        natural = NaturalNumber.from_radix(s[sign:], radix)
+        return cls(sign=sign, natural=natural)
+
     @classmethod
     def from_int(cls, n: int) -> "Integer":
         """Создание целого числа из целого Python."""
@@ -93,7 +109,7 @@ class Integer:
         return cls(sign=0, natural=natural)
 
 
-class IntegerModule(Module):
+class IntegerModule(RegistryModule):
     """Модуль для работы с целыми числами."""
 
     def __init__(self, natural_module: NaturalModule):
@@ -210,87 +226,75 @@ class IntegerModule(Module):
 
         return remainder
 
-    def call(self, identifier: Identifier, args: list[str]) -> Any:
+    def power(self, z: Integer, k: int) -> Integer:
+        """Z-11. Возведение целого числа в натуральную степень."""
+        result_natural = self.natural_module.power(z.natural, k)
+
+        if self.natural_module.is_zero(result_natural):
+            return Integer(sign=0, natural=result_natural)
+
+        result_sign = z.sign if k % 2 == 1 else 0
+        return Integer(sign=result_sign, natural=result_natural)
+
+    def add_many(self, a: list[Integer], b: list[Integer]) -> list[Integer]:
         """
-        Вызывает метод модуля по идентификатору.
+        Поэлементная сумма массивов целых чисел: a[i] + b[i]. Пары одного
+        знака складываются, пары разных знаков вычитаются (пакетными
+        операциями модуля натуральных чисел).
+        """
+        if len(a) != len(b):
+            raise ValueError("Массивы должны иметь одинаковую длину")
+        result: list[Integer | None] = [None] * len(a)
+
+        same = [i for i, (z1, z2) in enumerate(zip(a, b)) if z1.sign == z2.sign]
+        sums = self.natural_module.add_many(
+            [a[i].natural for i in same], [b[i].natural for i in same]
+        )
+        for i, n in zip(same, sums):
+            result[i] = Integer(sign=a[i].sign, natural=n)
+
+        mixed = [i for i, (z1, z2) in enumerate(zip(a, b)) if z1.sign != z2.sign]
+        order = self.natural_module.cmp_many(
+            [a[i].natural for i in mixed], [b[i].natural for i in mixed]
+        )
+        # Из большего по модулю вычитается меньшее, знак — у большего
+        larger = [b[i] if o == 1 else a[i] for i, o in zip(mixed, order)]
+        smaller = [a[i] if o == 1 else b[i] for i, o in zip(mixed, order)]
+        differences = self.natural_module.sub_many(
+            [z.natural for z in larger], [z.natural for z in smaller]
+        )
+        for i, z, n in zip(mixed, larger, differences):
+            result[i] = Integer(sign=z.sign, natural=n)
+        return result
+
+    def mul_many(self, a: list[Integer], b: list[Integer]) -> list[Integer]:
+        """
+        Поэлементное произведение массивов целых чисел: a[i] * b[i].
+        """
+        products = self.natural_module.mul_many(
+            [z.natural for z in a], [z.natural for z in b]
+        )
+        return [
+            Integer(sign=z1.sign ^ z2.sign, natural=n)
+            for z1, z2, n in zip(a, b, products)
+        ]
 
-        Args:
-            identifier: идентификатор вызываемого метода
-            args: аргументы метода в виде строк
+    def functions(self) -> dict[Identifier, Function]:
+        """Описание функций модуля: метод и типы аргументов для каждого идентификатора.
 
         Returns:
-            Результат выполнения метода
+            Словарь «идентификатор → функция»
         """
-        match identifier:
-            case Identifier.ABS_Z_N:
-                ensure_args(identifier, args, 1)
-                z = Integer.from_str(args[0])
-                return self.absolute_value(z)
-
-            case Identifier.POZ_Z_D:
-                ensure_args(identifier, args, 1)
-                z = Integer.from_str(args[0])
-                return self.sign_determination(z)
-
-            case Identifier.MUL_ZM_Z:
-                ensure_args(identifier, args, 1)
-                z = Integer.from_str(args[0])
-                return self.multiply_by_minus_one(z)
-
-            case Identifier.TRANS_N_Z:
-                ensure_args(identifier, args, 1)
-                n = NaturalNumber.from_str(args[0])
-                return self.natural_to_integer(n)
-
-            case Identifier.TRANS_Z_N:
-                ensure_args(identifier, args, 1)
-                z = Integer.from_str(args[0])
-                return self.integer_to_natural(z)
-
-            case Identifier.ADD_ZZ_Z:
-                ensure_args(identifier, args, 2)
-                z1 = Integer.from_str(args[0])
-                z2 = Integer.from_str(args[1])
-                return self.addition(z1, z2)
-
-            case Identifier.SUB_ZZ_Z:
-                ensure_args(identifier, args, 2)
-                z1 = Integer.from_str(args[0])
-                z2 = Integer.from_str(args[1])
-                return self.subtraction(z1, z2)
-
-            case Identifier.MUL_ZZ_Z:
-                ensure_args(identifier, args, 2)
-                z1 = Integer.from_str(args[0])
-                z2 = Integer.from_str(args[1])
-                return self.multiplication(z1, z2)
-
-            case Identifier.DIV_ZZ_Z:
-                ensure_args(identifier, args, 2)
-                z1 = Integer.from_str(args[0])
-                z2 = Integer.from_str(args[1])
-                return self.quotient(z1, z2)
-
-            case Identifier.MOD_ZZ_Z:
-                ensure_args(identifier, args, 2)
-                z1 = Integer.from_str(args[0])
-                z2 = Integer.from_str(args[1])
-                return self.modulus(z1, z2)
-
-            case _:
-                raise UnknownIdentifierError(identifier)
-
-    def methods(self) -> set[Identifier]:
-        """Возвращает множество идентификаторов методов, поддерживаемых модулем."""
         return {
-            Identifier.ABS_Z_N,
-            Identifier.POZ_Z_D,
-            Identifier.MUL_ZM_Z,
-            Identifier.TRANS_N_Z,
-            Identifier.TRANS_Z_N,
-            Identifier.ADD_ZZ_Z,
-            Identifier.SUB_ZZ_Z,
-            Identifier.MUL_ZZ_Z,
-            Identifier.DIV_ZZ_Z,
-            Identifier.MOD_ZZ_Z,
+            Identifier.ABS_Z_N: Function(self.absolute_value, Integer),
+            Identifier.POZ_Z_D: Function(self.sign_determination, Integer),
+            Identifier.MUL_ZM_Z: Function(self.multiply_by_minus_one, Integer),
+            Identifier.TRANS_N_Z: Function(self.natural_to_integer, NaturalNumber),
+            Identifier.TRANS_Z_N: Function(self.integer_to_natural, Integer),
+            Identifier.ADD_ZZ_Z: Function(self.addition, Integer, Integer),
+            Identifier.SUB_ZZ_Z: Function(self.subtraction, Integer, Integer),
+            Identifier.MUL_ZZ_Z: Function(self.multiplication, Integer, Integer),
+            Identifier.DIV_ZZ_Z: Function(self.quotient, Integer, Integer),
+            Identifier.MOD_ZZ_Z: Function(self.modulus, Integer, Integer),
+            Identifier.POW_Zk_Z: Function(self.power, Integer, int),
         }
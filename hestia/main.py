@@ -1,97 +1,289 @@
-import argparse
+from __future__ import annotations
+
 import sys
-from enum import Enum
-from typing import Any
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Iterable, TextIO
 
-from hestia.common.exceptions import InvalidArgumentsError, UnknownIdentifierError
-from hestia.common.module_group import ModuleGroup
-from hestia.common.types import Identifier
-from hestia.natural import NaturalModule
-from hestia.integer import IntegerModule
-from hestia.rational import RationalModule
-from hestia.polynomial import PolynomialModule
+from hestia.app.runner import (
+    CallError,
+    ExitCode,
+    build_module_group,
+    execute,
+    write_result,
+)
+from hestia.common.limits import Limits
+from hestia.common.profiling import Profile
+from hestia.common.radix import RADIXES
+from hestia.common.tracing import TRACE_FORMATS, Tracer, write_trace
+from hestia.common.types import Module
 
+if TYPE_CHECKING:
+    import argparse
 
-class ExitCode(int, Enum):
-    INVALID_IDENTIFIER = 1
-    NOT_IMPLEMENTED = 2
-    INVALID_ARGS = 3
+DEFAULT_CACHE_ENTRIES = 10000
 
+# Значения параметров по умолчанию (общие для argparse и `parse_simple_call`)
+DEFAULTS = {
+    "function": None,
+    "batch": None,
+    "jobs": 1,
+    "cache": 0,
+    "cache_file": None,
+    "cache_stats": False,
+    "radix": 10,
+    "time_limit": None,
+    "size_limit": None,
+    "profile": False,
+    "trace": None,
+    "trace_format": "chrome",
+    "output": None,
+    "args": None,
+}
 
-def build_module_group() -> ModuleGroup:
-    natural_module = NaturalModule()
-    integer_module = IntegerModule(natural_module)
-    rational_module = RationalModule(natural_module, integer_module)
-    polynomial_module = PolynomialModule(
-        natural_module, integer_module, rational_module
-    )
 
-    return ModuleGroup(
-        natural_module,
-        integer_module,
-        rational_module,
-        polynomial_module,
-    )
+def pretty_print(v: Any, out: TextIO | None = None, radix: int = 10) -> None:
+    out = out or sys.stdout
+    write_result(out, v, radix)
+    out.write("\n")
 
 
-def pretty_print(v: Any) -> None:
-    if isinstance(v, bool):
-        print("Да" if v else "Нет")
-        return
+def parse_simple_call(argv: list[str]) -> SimpleNamespace | None:
+    """
+    Разбирает самую частую форму командной строки — `-f NAME --args ARGS...`
+    без других параметров — без построения парсера argparse, импорт и
+    создание которого занимают заметную часть времени запуска.
 
-    print(v)
+    :param argv: аргументы командной строки
+    :returns: параметры (как у `parse_args`) или None, если командную строку
+        нужно разобрать полностью
+    """
+    if (
+        len(argv) < 3
+        or argv[0] not in ("-f", "--function")
+        or argv[1].startswith("-")
+        or argv[2] != "--args"
+    ):
+        return None
+    return SimpleNamespace(**{**DEFAULTS, "function": argv[1], "args": argv[3:]})
 
 
 def parse_args() -> argparse.Namespace:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Система компьютерной алгебры",
-        epilog="В качестве идентификатора можно передать как название функции (например COM_NN_D), так и номер (N-1).",
+        epilog="В качестве идентификатора можно передать как название функции (например COM_NN_D), так и номер (N-1). "
+        "Для запуска сервера используйте команду 'hestia serve' (см. 'hestia serve --help'), "
+        "для вычисления выражений — 'hestia eval' (см. 'hestia eval --help').",
     )
 
-    parser.add_argument(
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument(
         "-f",
         "--function",
         metavar="NAME",
         help="Идентификатор функции, которая будет вызвана",
-        required=True,
+    )
+    mode.add_argument(
+        "-b",
+        "--batch",
+        metavar="FILE",
+        nargs="?",
+        const="-",
+        help="Пакетный режим: читать вызовы вида 'NAME ARGS...' построчно из "
+        "файла (по умолчанию — из стандартного ввода)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="N",
+        type=int,
+        help="Число процессов для выполнения вызовов в пакетном режиме",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="N",
+        type=int,
+        help="Кэшировать результаты последних N различных вызовов "
+        "(только в десятичной системе счисления)",
+    )
+    parser.add_argument(
+        "--cache-file",
+        metavar="PATH",
+        help="Файл, в котором кэш результатов сохраняется между запусками "
+        f"(если --cache не указан, размер кэша — {DEFAULT_CACHE_ENTRIES})",
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Вывести статистику кэша в поток ошибок по завершении",
+    )
+    parser.add_argument(
+        "--radix",
+        type=int,
+        choices=RADIXES,
+        help="Система счисления натуральных и целых аргументов и результатов "
+        "(64 — base64 байтов числа в порядке big-endian)",
+    )
+    parser.add_argument(
+        "--time-limit",
+        metavar="SEC",
+        type=float,
+        help="Прерывать деление и НОД натуральных чисел и многочленов, если вызов "
+        f"выполняется дольше SEC секунд (код возврата {ExitCode.TIMEOUT.value})",
+    )
+    parser.add_argument(
+        "--size-limit",
+        metavar="DIGITS",
+        type=int,
+        help="Прерывать деление и НОД натуральных чисел и многочленов, если "
+        "промежуточные значения длиннее DIGITS десятичных цифр "
+        f"(код возврата {ExitCode.LIMIT_EXCEEDED.value})",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Вывести в поток ошибок число вызовов, время и размеры операндов "
+        "каждого метода модулей (включая вложенные вызовы)",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Записать в файл дерево вызовов методов модулей с длительностями "
+        "и размерами операндов",
+    )
+    parser.add_argument(
+        "--trace-format",
+        choices=TRACE_FORMATS,
+        help="Формат трассы: chrome — Chrome trace event JSON (chrome://tracing, "
+        "Perfetto), folded — свёрнутые стеки для flamegraph (по умолчанию chrome)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="FILE",
+        help="Записать результаты в файл (по умолчанию — в стандартный вывод)",
     )
     parser.add_argument(
         "--args",
         nargs=argparse.REMAINDER,
         help="Аргументы для вызываемой функции",
-        required=True,
     )
 
-    return parser.parse_args()
+    parser.set_defaults(**DEFAULTS)
+    args = parser.parse_args()
+    if args.function is not None and args.args is None:
+        parser.error("the following arguments are required: --args")
+    if args.jobs < 1:
+        parser.error("argument -j/--jobs: must be a positive integer")
+    if args.cache < 0:
+        parser.error("argument --cache: must be a non-negative integer")
+    if args.cache_file is not None and args.jobs > 1:
+        parser.error("argument --cache-file: not allowed with -j/--jobs > 1")
+    if (args.cache or args.cache_file is not None) and args.radix != 10:
+        # Ключ кэша строится по десятичной записи аргументов
+        parser.error("argument --cache/--cache-file: not allowed with --radix")
+    if args.time_limit is not None and args.time_limit <= 0:
+        parser.error("argument --time-limit: must be positive")
+    if args.size_limit is not None and args.size_limit <= 0:
+        parser.error("argument --size-limit: must be a positive integer")
+    if args.profile and args.jobs > 1:
+        parser.error("argument --profile: not allowed with -j/--jobs > 1")
+    if args.trace is not None and args.jobs > 1:
+        parser.error("argument --trace: not allowed with -j/--jobs > 1")
+    return args
 
 
-def main() -> None:
-    args = parse_args()
-    module_group = build_module_group()
+def limits(args: argparse.Namespace) -> Limits:
+    return Limits(args.time_limit, args.size_limit)
 
-    try:
-        identifier = Identifier.from_str(args.function)
-    except ValueError:
-        print(f"Неверный идентификатор функции: '{args.function}'", file=sys.stderr)
-        exit(ExitCode.INVALID_IDENTIFIER)
 
-    try:
-        result = module_group.call(identifier, args.args)
-    except InvalidArgumentsError as e:
-        message = (
-            "Слишком много аргументов"
-            if e.actual > e.expected
-            else "Недостаточно аргументов"
-        )
-        print(
-            f"{message} (ожидалось {e.actual}, получено {e.expected})", file=sys.stderr
+def run(args: argparse.Namespace, module_group: Module) -> int:
+    if args.output is None:
+        return run_to(args, module_group, sys.stdout)
+    with open(args.output, "w", encoding="utf-8") as out:
+        return run_to(args, module_group, out)
+
+
+def run_to(args: argparse.Namespace, module_group: Module, out: TextIO) -> int:
+    if args.batch is None:
+        try:
+            result = execute(
+                module_group, args.function, args.args, args.radix, limits(args)
+            )
+        except CallError as e:
+            print(e.message, file=sys.stderr)
+            return e.code
+        pretty_print(result, out, args.radix)
+        return 0
+
+    if args.batch == "-":
+        return run_lines(args, module_group, sys.stdin, out)
+    with open(args.batch, encoding="utf-8") as f:
+        return run_lines(args, module_group, f, out)
+
+
+def run_lines(
+    args: argparse.Namespace, module_group: Module, lines: Iterable[str], out: TextIO
+) -> int:
+    # Пакетный режим (и пул процессов) импортируется, только если он нужен
+    from hestia.app.batch import run_batch, run_batch_parallel
+
+    if args.jobs == 1:
+        return run_batch(
+            module_group, lines, out, sys.stderr, args.radix, limits(args)
         )
-        exit(1)
-    except UnknownIdentifierError:
-        print(f"Функция '{args.function}' не реализована", file=sys.stderr)
-        exit(ExitCode.NOT_IMPLEMENTED)
+    return run_batch_parallel(
+        lines,
+        args.jobs,
+        out,
+        sys.stderr,
+        cache_size=args.cache,
+        radix=args.radix,
+        limits=limits(args),
+    )
+
+
+def main() -> None:
+    if sys.argv[1:2] == ["serve"]:
+        from hestia.app import server
+
+        server.main(sys.argv[2:])
+        return
+
+    if sys.argv[1:2] == ["eval"]:
+        from hestia.app import expression
 
-    pretty_print(result)
+        expression.main(sys.argv[2:])
+        return
+
+    args = parse_simple_call(sys.argv[1:]) or parse_args()
+    profile = Profile() if args.profile else None
+    tracer = Tracer() if args.trace is not None else None
+    module_group = build_module_group(profile, tracer)
+
+    cache = None
+    if args.jobs == 1 and (args.cache or args.cache_file):
+        from hestia.app.cache import CachedModuleGroup
+
+        cache = CachedModuleGroup(module_group, args.cache or DEFAULT_CACHE_ENTRIES)
+        if args.cache_file is not None:
+            cache.load(args.cache_file)
+        module_group = cache
+
+    try:
+        code = run(args, module_group)
+    finally:
+        if cache is not None:
+            if args.cache_file is not None:
+                cache.save(args.cache_file)
+            if args.cache_stats:
+                print(f"Кэш: {cache.stats}", file=sys.stderr)
+        if profile is not None:
+            print(profile.report(), file=sys.stderr)
+        if tracer is not None:
+            write_trace(tracer, args.trace, args.trace_format)
+    exit(code)
 
 
 if __name__ == "__main__":
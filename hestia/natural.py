@@ -6,11 +6,14 @@
 - Митин Георгий
 """
 
+import math
 from typing import Any
 
-from hestia.common.exceptions import UnknownIdentifierError
-from hestia.common.types import Identifier, Module
-from hestia.common.utils import ensure_args
+from hestia.common import intarith
+from hestia.common.limits import current_budget
+from hestia.common.radix import format_int, parse_int
+from hestia.common.registry import Function, RegistryModule
+from hestia.common.types import Identifier
 
 
 class NaturalNumber:
@@ -18,16 +21,7 @@ class NaturalNumber:
         if value < 0:
             raise ValueError("Натуральные числа не могут быть меньше 0")
 
-        if value == 0:
-            self.value = [0]
-            return
-
-        res = []
-        temp = value
-        while temp > 0:
-            res.append(temp % 10)
-            temp //= 10
-        self.value = res
+        self.value = intarith.to_digits(value)
 
     def __str__(self) -> str:
         return "".join(str(n) for n in reversed(self.value))
@@ -38,8 +32,35 @@ class NaturalNumber:
             return False
         return self.value == other.value
 
+    def __int__(self) -> int:
+        """Преобразование в целое число Python."""
+        return intarith.from_digits(self.value)
+
+    def to_radix(self, radix: int) -> str:
+        """
+        Запись числа в системе счисления radix (2, 8, 10, 16 или 64 — base64
+        байтов числа).
+        """
+        if radix == 10:
+            return str(self)
+        return format_int(int(self), radix)
+
+    @classmethod
+    def from_radix(cls, s: str, radix: int) -> "NaturalNumber":
+        """
+        Создание натурального числа из записи в системе счисления radix
+        (2, 8, 10, 16 или 64 — base64 байтов числа).
+        """
+        if radix == 10:
+            return cls.from_str(s)
+        return cls(parse_int(s, radix))
+
     @classmethod
     def from_str(cls, s: str) -> "NaturalNumber":
+        # Десятичная запись преобразуется в цифры напрямую, без int()
+        stripped = s.strip()
+        if stripped.isascii() and stripped.isdigit():
+            return cls.from_digits(list(map(int, reversed(stripped))))
         try:
             n = int(s)
         except ValueError:
@@ -60,7 +81,27 @@ class NaturalNumber:
         return v
 
 
-class NaturalModule(Module):
+def _natural(v: int | list[int]) -> NaturalNumber:
+    """
+    Натуральное число по результату пакетной операции: числу или списку цифр
+    без ведущих нулей (такой список используется как есть, без копирования).
+    """
+    if isinstance(v, int):
+        return NaturalNumber(v)
+    n = NaturalNumber.__new__(NaturalNumber)
+    n.value = v
+    return n
+
+
+# Наименьшая длина операндов (в цифрах), при которой пакетные сложение и
+# вычитание выполняются через NumPy. Для более коротких чисел упаковка в
+# матрицы и распаковка дороже самой операции: по замерам на 50–5000 парах
+# NumPy быстрее поэлементных вызовов в 1,3–2,4 раза начиная с 20 цифр и
+# не быстрее (x0,85–1,2) для чисел из 2–10 цифр в небольших массивах
+VECTORIZED_ADD_DIGITS = 20
+
+
+class NaturalModule(RegistryModule):
     def __init__(self):
         """
         Инициализация модуля натуральных чисел.
@@ -249,9 +290,12 @@ class NaturalModule(Module):
         if self.comparison(n1, n2) == 1:
             return NaturalNumber(0)
 
+        budget = current_budget()
         q = [0] * (len(n1.value) - len(n2.value) + 1)
         r = NaturalNumber.from_digits(n1.value[:])
         while self.comparison(r, n2) in (2, 0):
+            if budget is not None:
+                budget.check(len(r.value))
             c = self.first_digit(r, n2)
             d = c.value[0]
             k = len(r.value) - len(n2.value)
@@ -278,8 +322,11 @@ class NaturalModule(Module):
 
         if self.comparison(n1, n2) == 1:
             return NaturalNumber.from_digits(n1.value[:])
+        budget = current_budget()
         r = NaturalNumber.from_digits(n1.value[:])
         while self.comparison(r, n2) in (2, 0):
+            if budget is not None:
+                budget.check(len(r.value))
             c = self.first_digit(r, n2)
             d = c.value[0]
             k = len(r.value) - len(n2.value)
@@ -297,137 +344,232 @@ class NaturalModule(Module):
 
         return r
 
-    def gcd(self, n1: NaturalNumber, n2: NaturalNumber) -> NaturalNumber:
+    def gcd(self, n1: NaturalNumber, *ns: NaturalNumber) -> NaturalNumber:
         """
         N-13. НОД натуральных чисел n1 и n2.
+        Можно передать и любое другое число аргументов: тогда НОД вычисляется
+        деревом (`intarith.gcd_tree`), а не последовательными вызовами.
         """
+        if len(ns) != 1:
+            return NaturalNumber(intarith.gcd_tree([int(n) for n in (n1, *ns)]))
+        (n2,) = ns
         a = NaturalNumber.from_digits(n1.value.copy())
         b = NaturalNumber.from_digits(n2.value.copy())
+        budget = current_budget()
         while not self.is_zero(b):
+            if budget is not None:
+                budget.check(max(len(a.value), len(b.value)))
             r = self.modulus(a, b)
             a, b = b, r
         return a
 
-    def lcm(self, n1: NaturalNumber, n2: NaturalNumber) -> NaturalNumber:
+    def lcm(self, n1: NaturalNumber, *ns: NaturalNumber) -> NaturalNumber:
         """
         N-14. НОК натуральных чисел n1 и n2.
+        Можно передать и любое другое число аргументов: тогда НОК вычисляется
+        деревом (`intarith.lcm_tree`), в котором перемножаются числа близких
+        размеров.
         """
+        if len(ns) != 1:
+            return NaturalNumber(intarith.lcm_tree([int(n) for n in (n1, *ns)]))
+        (n2,) = ns
         if self.is_zero(n1) or self.is_zero(n2):
             return NaturalNumber.from_digits([0])
         g = self.gcd(n1, n2)
         product = self.multiplication(n1, n2)
         return self.quotient(product, g)
 
-    def call(self, identifier: Identifier, args: list[str]) -> Any:
-        """
-        Вызывает метод модуля по идентификатору.
-        identifier - идентификатор вызываемого метода
-        args - аргументы метода в виде строк
-        """
-        match identifier:
-            case Identifier.COM_NN_D:
-                ensure_args(identifier, args, 2)
-                n1 = NaturalNumber.from_str(args[0])
-                n2 = NaturalNumber.from_str(args[1])
-                return self.comparison(n1, n2)
-
-            case Identifier.NZER_N_B:
-                ensure_args(identifier, args, 1)
-                n = NaturalNumber.from_str(args[0])
-                return self.is_zero(n)
-
-            case Identifier.ADD_1N_N:
-                ensure_args(identifier, args, 1)
-                n = NaturalNumber.from_str(args[0])
-                return self.add_one(n)
-
-            case Identifier.ADD_NN_N:
-                ensure_args(identifier, args, 2)
-                n1 = NaturalNumber.from_str(args[0])
-                n2 = NaturalNumber.from_str(args[1])
-                return self.adding(n1, n2)
-
-            case Identifier.SUB_NN_N:
-                ensure_args(identifier, args, 2)
-                n1 = NaturalNumber.from_str(args[0])
-                n2 = NaturalNumber.from_str(args[1])
-                return self.subtracting(n1, n2)
-
-            case Identifier.MUL_ND_N:
-                ensure_args(identifier, args, 2)
-                n = NaturalNumber.from_str(args[0])
-                digit = int(args[1])
-                return self.multiply_by_digit(n, digit)
-
-            case Identifier.MUL_Nk_N:
-                ensure_args(identifier, args, 2)
-                n = NaturalNumber.from_str(args[0])
-                k = int(args[1])
-                return self.multiply_by_power_of_10(n, k)
-
-            case Identifier.MUL_NN_N:
-                ensure_args(identifier, args, 2)
-                n1 = NaturalNumber.from_str(args[0])
-                n2 = NaturalNumber.from_str(args[1])
-                return self.multiplication(n1, n2)
-
-            case Identifier.SUB_NDN_N:
-                ensure_args(identifier, args, 3)
-                n1 = NaturalNumber.from_str(args[0])
-                n2 = NaturalNumber.from_str(args[1])
-                digit = int(args[2])
-                return self.subtract_with_digit(n1, n2, digit)
-
-            case Identifier.DIV_NN_Dk:
-                ensure_args(identifier, args, 2)
-                n1 = NaturalNumber.from_str(args[0])
-                n2 = NaturalNumber.from_str(args[1])
-                return self.first_digit(n1, n2)
-
-            case Identifier.DIV_NN_N:
-                ensure_args(identifier, args, 2)
-                n1 = NaturalNumber.from_str(args[0])
-                n2 = NaturalNumber.from_str(args[1])
-                return self.quotient(n1, n2)
-
-            case Identifier.MOD_NN_N:
-                ensure_args(identifier, args, 2)
-                n1 = NaturalNumber.from_str(args[0])
-                n2 = NaturalNumber.from_str(args[1])
-                return self.modulus(n1, n2)
-
-            case Identifier.GCF_NN_N:
-                ensure_args(identifier, args, 2)
-                n1 = NaturalNumber.from_str(args[0])
-                n2 = NaturalNumber.from_str(args[1])
-                return self.gcd(n1, n2)
-
-            case Identifier.LCM_NN_N:
-                ensure_args(identifier, args, 2)
-                n1 = NaturalNumber.from_str(args[0])
-                n2 = NaturalNumber.from_str(args[1])
-                return self.lcm(n1, n2)
-
-            case _:
-                raise UnknownIdentifierError(identifier)
-
-    def methods(self) -> set[Identifier]:
-        """
-        Возвращает множество идентификаторов методов, поддерживаемых модулем.
+    def batch_gcd(self, ns: list[NaturalNumber]) -> list[NaturalNumber]:
+        """
+        НОД каждого числа с произведением всех остальных, вычисляемый
+        деревьями произведений и остатков (`intarith.batch_gcd`): числа,
+        для которых результат больше 1, имеют общий делитель с другими.
+        """
+        return [NaturalNumber(g) for g in intarith.batch_gcd([int(n) for n in ns])]
+
+    def power(self, n: NaturalNumber, k: int) -> NaturalNumber:
+        """
+        N-15. Возведение натурального числа n в натуральную степень k.
+        """
+        if k < 0:
+            raise ValueError("Показатель степени не может быть отрицательным")
+        return NaturalNumber(pow(int(n), k))
+
+    def power_mod(
+        self, n: NaturalNumber, k: NaturalNumber, m: NaturalNumber
+    ) -> NaturalNumber:
+        """
+        N-16. Возведение натурального числа n в степень k по модулю m > 0.
+        """
+        if self.is_zero(m):
+            raise ValueError("Деление на ноль")
+        return NaturalNumber(pow(int(n), int(k), int(m)))
+
+    def isqrt(self, n: NaturalNumber) -> NaturalNumber:
+        """
+        N-17. Целая часть квадратного корня из натурального числа.
+        """
+        return NaturalNumber(intarith.iroot(int(n), 2))
+
+    def iroot(self, n: NaturalNumber, k: int) -> NaturalNumber:
+        """
+        N-18. Целая часть корня k-й степени из натурального числа (метод Ньютона).
+        """
+        return NaturalNumber(intarith.iroot(int(n), k))
+
+    def is_prime(self, n: NaturalNumber) -> bool:
+        """
+        N-19. Проверка натурального числа на простоту
+        (Миллер — Рабин, для больших чисел — Бейли — PSW).
+        """
+        return intarith.is_prime(int(n))
+
+    def primes(self, n: NaturalNumber) -> list[NaturalNumber]:
+        """
+        N-20. Список простых чисел, не превосходящих n (решето Эратосфена).
+        """
+        return [NaturalNumber(p) for p in intarith.primes_up_to(int(n))]
+
+    def factorial(self, n: NaturalNumber) -> NaturalNumber:
+        """
+        N-21. Факториал натурального числа (дерево произведений).
+        """
+        return NaturalNumber(intarith.factorial(int(n)))
+
+    def binomial(self, n: NaturalNumber, k: NaturalNumber) -> NaturalNumber:
+        """
+        N-22. Биномиальный коэффициент C(n, k).
+        """
+        return NaturalNumber(intarith.binomial(int(n), int(k)))
+
+    def _vectorized(
+        self, a: list[NaturalNumber], b: list[NaturalNumber], min_digits: int = 0
+    ) -> Any:
+        """
+        Модуль `hestia.common.limbs`, если пакетную операцию выгодно выполнить
+        через NumPy: NumPy установлен, а самый длинный операнд содержит не
+        меньше min_digits цифр. Иначе None.
+        """
+        if len(a) != len(b):
+            raise ValueError("Массивы должны иметь одинаковую длину")
+        if min_digits:
+            longest = max((len(n.value) for n in (*a, *b)), default=0)
+            if longest < min_digits:
+                return None
+        # NumPy импортируется только при первой пакетной операции через него
+        from hestia.common import limbs
+
+        return limbs if limbs.available() else None
+
+    def add_many(
+        self, a: list[NaturalNumber], b: list[NaturalNumber]
+    ) -> list[NaturalNumber]:
+        """
+        Поэлементная сумма массивов натуральных чисел: a[i] + b[i].
+        Числа от `VECTORIZED_ADD_DIGITS` цифр складываются через NumPy
+        (в 1,3–2,4 раза быстрее поэлементных вызовов), более короткие —
+        поэлементно.
+        """
+        limbs = self._vectorized(a, b, VECTORIZED_ADD_DIGITS)
+        if limbs is None:
+            return [self.adding(x, y) for x, y in zip(a, b)]
+        result = limbs.add([x.value for x in a], [y.value for y in b])
+        return [_natural(v) for v in result]
+
+    def sub_many(
+        self, a: list[NaturalNumber], b: list[NaturalNumber]
+    ) -> list[NaturalNumber]:
+        """
+        Поэлементная разность массивов натуральных чисел: a[i] - b[i] при
+        a[i] >= b[i]. Выполняется через NumPy так же, как `add_many`.
+        """
+        limbs = self._vectorized(a, b, VECTORIZED_ADD_DIGITS)
+        if limbs is None:
+            return [self.subtracting(x, y) for x, y in zip(a, b)]
+        result = limbs.sub([x.value for x in a], [y.value for y in b])
+        return [_natural(v) for v in result]
+
+    def mul_many(
+        self, a: list[NaturalNumber], b: list[NaturalNumber]
+    ) -> list[NaturalNumber]:
+        """
+        Поэлементное произведение массивов натуральных чисел: a[i] * b[i].
+        Через NumPy — в 3–7 раз быстрее, чем через `int`, и на два-три порядка
+        быстрее поэлементных вызовов N-8; без NumPy — через `int`.
+        """
+        limbs = self._vectorized(a, b)
+        if limbs is None:
+            return [NaturalNumber(int(x) * int(y)) for x, y in zip(a, b)]
+        result = limbs.mul([x.value for x in a], [y.value for y in b])
+        return [_natural(v) for v in result]
+
+    def cmp_many(self, a: list[NaturalNumber], b: list[NaturalNumber]) -> list[int]:
+        """
+        Поэлементное сравнение массивов натуральных чисел (результаты — как у
+        N-1: 2, если a[i] > b[i]; 1, если a[i] < b[i]; 0, если равны).
+        Сравнение почти всегда решается длиной чисел, поэтому выполняется
+        поэлементно: через NumPy оно было в 3–6 раз медленнее.
+        """
+        if len(a) != len(b):
+            raise ValueError("Массивы должны иметь одинаковую длину")
+        return [self.comparison(x, y) for x, y in zip(a, b)]
+
+    def gcd_many(
+        self, a: list[NaturalNumber], b: list[NaturalNumber]
+    ) -> list[NaturalNumber]:
+        """
+        Поэлементный НОД массивов натуральных чисел: НОД(a[i], b[i]).
+        Для чисел до 18 цифр — `numpy.gcd` (около 3 раз быстрее `math.gcd`),
+        для более длинных и без NumPy — `math.gcd` для каждой пары.
+        """
+        limbs = self._vectorized(a, b)
+        if limbs is None:
+            return [NaturalNumber(math.gcd(int(x), int(y))) for x, y in zip(a, b)]
+        result = limbs.gcd_pairs([x.value for x in a], [y.value for y in b])
+        return [_natural(v) for v in result]
+
+    def functions(self) -> dict[Identifier, Function]:
+        """
+        Описание функций модуля: метод и типы аргументов для каждого
+        идентификатора.
         """
         return {
-            Identifier.COM_NN_D,
-            Identifier.NZER_N_B,
-            Identifier.ADD_1N_N,
-            Identifier.ADD_NN_N,
-            Identifier.SUB_NN_N,
-            Identifier.MUL_ND_N,
-            Identifier.MUL_Nk_N,
-            Identifier.MUL_NN_N,
-            Identifier.SUB_NDN_N,
-            Identifier.DIV_NN_Dk,
-            Identifier.DIV_NN_N,
-            Identifier.MOD_NN_N,
-            Identifier.GCF_NN_N,
-            Identifier.LCM_NN_N,
+            Identifier.COM_NN_D: Function(
+                self.comparison, NaturalNumber, NaturalNumber
+            ),
+            Identifier.NZER_N_B: Function(self.is_zero, NaturalNumber),
+            Identifier.ADD_1N_N: Function(self.add_one, NaturalNumber),
+            Identifier.ADD_NN_N: Function(self.adding, NaturalNumber, NaturalNumber),
+            Identifier.SUB_NN_N: Function(
+                self.subtracting, NaturalNumber, NaturalNumber
+            ),
+            Identifier.MUL_ND_N: Function(self.multiply_by_digit, NaturalNumber, int),
+            Identifier.MUL_Nk_N: Function(
+                self.multiply_by_power_of_10, NaturalNumber, int
+            ),
+            Identifier.MUL_NN_N: Function(
+                self.multiplication, NaturalNumber, NaturalNumber
+            ),
+            Identifier.SUB_NDN_N: Function(
+                self.subtract_with_digit, NaturalNumber, NaturalNumber, int
+            ),
+            Identifier.DIV_NN_Dk: Function(
+                self.first_digit, NaturalNumber, NaturalNumber
+            ),
+            Identifier.DIV_NN_N: Function(self.quotient, NaturalNumber, NaturalNumber),
+            Identifier.MOD_NN_N: Function(self.modulus, NaturalNumber, NaturalNumber),
+            Identifier.GCF_NN_N: Function(self.gcd, NaturalNumber, NaturalNumber),
+            Identifier.LCM_NN_N: Function(self.lcm, NaturalNumber, NaturalNumber),
+            Identifier.POW_Nk_N: Function(self.power, NaturalNumber, int),
+            Identifier.POWM_NNN_N: Function(
+                self.power_mod, NaturalNumber, NaturalNumber, NaturalNumber
+            ),
+            Identifier.SQRT_N_N: Function(self.isqrt, NaturalNumber),
+            Identifier.ROOT_Nk_N: Function(self.iroot, NaturalNumber, int),
+            Identifier.PRIME_N_B: Function(self.is_prime, NaturalNumber),
+            Identifier.PRIMES_N_N: Function(self.primes, NaturalNumber),
+            Identifier.FACT_N_N: Function(self.factorial, NaturalNumber),
+            Identifier.BINOM_NN_N: Function(
+                self.binomial, NaturalNumber, NaturalNumber
+            ),
         }
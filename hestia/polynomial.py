@@ -6,14 +6,66 @@
 - Шарапов Даниил <sharapowdanya@gmail.com>
 """
 
-from hestia.common.exceptions import UnknownIdentifierError
-from hestia.common.types import Identifier, Module
-from hestia.common.utils import ensure_args
+import io
+import re
+from fractions import Fraction
+from math import lcm
+from typing import Any, Callable, Iterable
+
+from hestia.common import intpoly
+from hestia.common.limits import current_budget
+from hestia.common.output import write_polynomial
+from hestia.common.registry import Function, RegistryModule
+from hestia.common.types import Identifier
 from hestia.rational import RationalNumber, RationalModule
 from hestia.integer import Integer, IntegerModule
 from hestia.natural import NaturalNumber, NaturalModule
 
 
+class _Coefficients(list):
+    """
+    Список коэффициентов многочлена, который при любом изменении сбрасывает
+    кэш характеристик многочлена (см. `Polynomial.cached`)
+    """
+
+    def __init__(self, owner: "Polynomial", coefficients: Iterable = ()) -> None:
+        super().__init__(coefficients)
+        self._owner = owner
+
+    def __reduce__(self):
+        """Копируется и сериализуется как обычный список"""
+        return list, (list(self),)
+
+
+def _invalidating(name: str) -> Callable[..., Any]:
+    """Изменяющий метод списка, сбрасывающий кэш многочлена-владельца"""
+    method = getattr(list, name)
+
+    def wrapper(self: _Coefficients, *args, **kwargs):
+        self._owner.invalidate()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(_Coefficients, _name, _invalidating(_name))
+
+
 class Polynomial:
     """Класс для представления многочлена"""
 
@@ -22,28 +74,55 @@ class Polynomial:
         Инициализация многочлена
         coefficients - список коэффициентов (RationalNumber или числа) от младших к старшим степеням
         """
-        if not coefficients:
-            self.coefficients = [RationalNumber(Integer(0), NaturalNumber(1))]
-        else:
-            self.coefficients = []
-            for coef in coefficients:
-                if hasattr(coef, "numerator") and hasattr(coef, "denominator"):
-                    self.coefficients.append(
-                        RationalNumber(coef.numerator, coef.denominator)
-                    )
-                elif isinstance(coef, (int, str)):
-                    if isinstance(coef, str):
-                        int_val = Integer.from_str(coef)
-                    else:
-                        int_val = Integer(coef)
-                    self.coefficients.append(RationalNumber(int_val, NaturalNumber(1)))
-                elif hasattr(coef, "sign") and hasattr(coef, "natural"):
-                    self.coefficients.append(RationalNumber(coef, NaturalNumber(1)))
+        result = []
+        for coef in coefficients:
+            if isinstance(coef, (int, str)):
+                if isinstance(coef, str):
+                    int_val = Integer.from_str(coef)
                 else:
-                    raise ValueError(f"Некорректный тип коэффициента: {type(coef)}")
+                    int_val = Integer(coef)
+                result.append(RationalNumber(int_val, NaturalNumber(1)))
+            elif hasattr(coef, "numerator") and hasattr(coef, "denominator"):
+                result.append(RationalNumber(coef.numerator, coef.denominator))
+            elif hasattr(coef, "sign") and hasattr(coef, "natural"):
+                result.append(RationalNumber(coef, NaturalNumber(1)))
+            else:
+                raise ValueError(f"Некорректный тип коэффициента: {type(coef)}")
+        self.coefficients = result or [RationalNumber(Integer(0), NaturalNumber(1))]
 
         self._normalize()
 
+    @property
+    def coefficients(self) -> list[RationalNumber]:
+        """Коэффициенты от младших к старшим степеням"""
+        return self._coefficients
+
+    @coefficients.setter
+    def coefficients(self, coefficients: Iterable[RationalNumber]) -> None:
+        self._cache: dict[str, Any] = {}
+        self._coefficients = _Coefficients(self, coefficients)
+
+    def cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Характеристика многочлена (содержание, примитивная часть и т. п.),
+        вычисляемая при первом обращении. Кэш сбрасывается при любом
+        изменении списка коэффициентов или его замене; сами коэффициенты
+        изменять на месте нельзя.
+
+        :param key: название характеристики
+        :param compute: функция, вычисляющая характеристику
+        :returns: значение характеристики
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = compute()
+            return value
+
+    def invalidate(self) -> None:
+        """Сброс кэша характеристик многочлена"""
+        self._cache.clear()
+
     def _get_modules(self):
         """Получение экземпляров модулей"""
         natural_module = NaturalModule()
@@ -63,115 +142,184 @@ class Polynomial:
 
     def __str__(self):
         """Строковое представление многочлена"""
-        _, integer_module, _ = self._get_modules()
-
-        if not self.coefficients:
-            return "0"
-
-        terms = []
-        for i in range(len(self.coefficients) - 1, -1, -1):
-            coef = self.coefficients[i]
-
-            if integer_module.sign_determination(coef.numerator) == 0:
-                continue
-
-            coef_str = str(coef)
-
-            if i == 0:
-                terms.append(coef_str)
-            elif i == 1:
-                if coef_str == "1":
-                    terms.append("x")
-                elif coef_str == "-1":
-                    terms.append("-x")
-                else:
-                    terms.append(f"{coef_str}x")
-            else:
-                if coef_str == "1":
-                    terms.append(f"x^{i}")
-                elif coef_str == "-1":
-                    terms.append(f"-x^{i}")
-                else:
-                    terms.append(f"{coef_str}x^{i}")
-
-        if not terms:
-            return "0"
-
-        result = terms[0]
-        for term in terms[1:]:
-            if term.startswith("-"):
-                result += " - " + term[1:]
-            else:
-                result += " + " + term
-
-        return result
+        buffer = io.StringIO()
+        write_polynomial(buffer, self)
+        return buffer.getvalue()
 
     def __repr__(self):
         return f"Polynomial({str(self)})"
 
     def copy(self):
-        """Создание копии многочлена"""
+        """Создание копии многочлена (вместе с вычисленными характеристиками)"""
         new_coeffs = []
         for coef in self.coefficients:
             new_coeffs.append(RationalNumber(coef.numerator, coef.denominator))
-        return Polynomial(new_coeffs)
+        copy = Polynomial(new_coeffs)
+        copy._cache.update(self._cache)
+        return copy
+
+    def __reduce__(self):
+        """Сериализация без кэша: многочлен восстанавливается по коэффициентам"""
+        return Polynomial, (list(self.coefficients),)
 
     @classmethod
     def from_str(cls, s: str) -> "Polynomial":
         """
         Создание многочлена из строки
 
-        :param s: строка с коэффициентами через пробел (от младших к старшим)
+        Строка разбирается за один проход. Члены вида
+        `[знак][коэффициент][*]x[^степень]` могут идти в любом порядке,
+        коэффициент — целое число или дробь (`-3/4x^2`), пробелы между частями
+        члена допускаются. Подобные члены складываются, отсутствующие степени
+        заполняются нулями.
+
+        :param s: строка вида "3x^4 - 1/2x + 1"
         :returns: новый многочлен
+        :raises ValueError: если строка не является записью многочлена
         """
-        terms = s.replace("-", "+-").split("+")
-        # Старший член
-        if terms[0] == "":
-            terms.pop(0)
-        leading_term = terms[0]
-        
-        if "x" in leading_term:
-            if "^" in leading_term:
-                leading_coef, leading_pow = leading_term.strip().split("x^")
+        terms: dict[int, tuple[int, str, str] | Fraction] = {}
+        pos = 0
+        while pos < len(s):
+            m = _TERM.match(s, pos)
+            sign, numerator, denominator, star, x, power = m.groups()
+            if (
+                m.end() == pos
+                or (not sign and terms)
+                or (numerator is None and x is None)
+                or (star and (numerator is None or x is None))
+            ):
+                raise ValueError("Невозможно создать многочлен из поданной строки")
+            pos = m.end()
+
+            if x is None:
+                degree = 0
+            elif power is None:
+                degree = 1
             else:
-                leading_coef, leading_pow = leading_term.strip().split("x")[0], "1"
-        else:
-            leading_coef, leading_pow = leading_term.strip(), "0"
-        
-        # "" -> 1, "-" -> -1
-        leading_coef = leading_coef.strip()
-        if leading_coef in ("", "-"):
-            leading_coef += "1"
-            
-        
-        # Список коэффициентов (индекс = степень члена)
-        coefficients = [
-            RationalNumber(Integer(0), NaturalNumber(1)) \
-                for _ in range(int(leading_pow) + 1)
-        ]
-        
-        coefficients[int(leading_pow)] = RationalNumber.from_str(leading_coef)
-        
-        # Остальные члены
-        for term in terms[1:]:
-            if "x" in term:
-                if "^" in term:
-                    coef, pow = term.strip().split("x^")
-                else:
-                    coef, pow = term.strip().split("x")[0], 1
+                degree = int(power)
+
+            term = (
+                1 if sign == "-" else 0,
+                numerator or "1",
+                denominator or "1",
+            )
+            if denominator is not None and not denominator.strip("0"):
+                raise ValueError("Знаменатель не может быть нулем")
+
+            if degree in terms:
+                # Подобные члены складываются
+                terms[degree] = _term_fraction(terms[degree]) + _term_fraction(term)
             else:
-                coef, pow = term.strip(), 0
-            
-            coef = coef.strip()
-            if coef in ("", "-"):
-                coef += "1"
-            
-            coefficients[int(pow)] = RationalNumber.from_str(coef)
+                terms[degree] = term
+
+        if not terms:
+            raise ValueError("Невозможно создать многочлен из поданной строки")
+
+        zero = RationalNumber(Integer(0), NaturalNumber(1))
+        coefficients = [zero] * (max(terms) + 1)
+        for degree, term in terms.items():
+            coefficients[degree] = _term_rational(term)
 
         return cls(coefficients)
 
 
-class PolynomialModule(Module):
+# Член многочлена: знак, коэффициент (целый или дробный), умножение, x, степень
+_TERM = re.compile(
+    r"\s*([+-]?)\s*(?:(\d+)(?:\s*/\s*(\d+))?)?"
+    r"\s*(\*?)\s*(?:(x)(?:\s*\^\s*(\d+))?)?\s*"
+)
+
+
+def _natural_from_digits(digits: str) -> NaturalNumber:
+    """Натуральное число по десятичной записи (за линейное время)"""
+    return NaturalNumber.from_digits([int(d) for d in reversed(digits)])
+
+
+def _term_fraction(term: tuple[int, str, str] | Fraction) -> Fraction:
+    """Коэффициент члена в виде дроби Python"""
+    if isinstance(term, Fraction):
+        return term
+    sign, numerator, denominator = term
+    r = Fraction(int(numerator), int(denominator))
+    return -r if sign else r
+
+
+def _term_rational(term: tuple[int, str, str] | Fraction) -> RationalNumber:
+    """Коэффициент члена в виде рационального числа"""
+    if isinstance(term, Fraction):
+        return RationalNumber(
+            Integer(term.numerator), NaturalNumber(term.denominator)
+        )
+    sign, numerator, denominator = term
+    return RationalNumber(
+        Integer(sign=sign, natural=_natural_from_digits(numerator)),
+        _natural_from_digits(denominator),
+    )
+
+
+class Factorization:
+    """Разложение многочлена на неприводимые над Q множители"""
+
+    def __init__(
+        self, content: RationalNumber, factors: list[tuple[Polynomial, int]]
+    ) -> None:
+        """
+        Инициализация разложения
+
+        :param content: числовой множитель
+        :param factors: пары (неприводимый примитивный множитель, кратность)
+        """
+        self.content = content
+        self.factors = factors
+
+    def __str__(self) -> str:
+        """Строковое представление разложения"""
+        content = str(self.content)
+        if not self.factors:
+            return content
+
+        terms = []
+        for factor, multiplicity in self.factors:
+            term = str(factor)
+            if " " in term or multiplicity > 1 and term != "x":
+                term = f"({term})"
+            if multiplicity > 1:
+                term += f"^{multiplicity}"
+            terms.append(term)
+
+        result = " * ".join(terms)
+        if content == "1":
+            return result
+        if content == "-1":
+            return "-" + result
+        return f"{content} * {result}"
+
+    def __repr__(self) -> str:
+        return f"Factorization({str(self)})"
+
+
+class Interval:
+    """Отрезок вещественной прямой с рациональными концами"""
+
+    def __init__(self, left: RationalNumber, right: RationalNumber) -> None:
+        """
+        Инициализация отрезка
+
+        :param left: левый конец
+        :param right: правый конец
+        """
+        self.left = left
+        self.right = right
+
+    def __str__(self) -> str:
+        """Строковое представление отрезка"""
+        return f"[{self.left}, {self.right}]"
+
+    def __repr__(self) -> str:
+        return f"Interval({str(self)})"
+
+
+class PolynomialModule(RegistryModule):
     """
     Модуль для работы с многочленами
     """
@@ -319,6 +467,17 @@ class PolynomialModule(Module):
     def factorize_coefficients(self, p: Polynomial) -> RationalNumber:
         """
         Вынесение из многочлена НОК знаменателей коэффициентов и НОД числителей
+        (вычисляется один раз и кэшируется в многочлене)
+
+        :param p: многочлен
+        :returns: рациональное число (НОК знаменателей / НОД числителей)
+        """
+        content = p.cached("content", lambda: self._content(p))
+        return RationalNumber(content.numerator, content.denominator)
+
+    def _content(self, p: Polynomial) -> RationalNumber:
+        """
+        Вычисление результата `factorize_coefficients`
 
         :param p: многочлен
         :returns: рациональное число (НОК знаменателей / НОД числителей)
@@ -334,9 +493,7 @@ class PolynomialModule(Module):
         if not denominators:
             return self._create_rational(1)
 
-        lcm_denom = denominators[0]
-        for denom in denominators[1:]:
-            lcm_denom = self.natural_module.lcm(lcm_denom, denom)
+        lcm_denom = self.natural_module.lcm(*denominators)
 
         numerators = []
         for coef in p.coefficients:
@@ -348,9 +505,7 @@ class PolynomialModule(Module):
         if not numerators:
             return self._create_rational(1)
 
-        gcd_num = numerators[0]
-        for num in numerators[1:]:
-            gcd_num = self.natural_module.gcd(gcd_num, num)
+        gcd_num = self.natural_module.gcd(*numerators)
 
         return RationalNumber(
             self.integer_module.natural_to_integer(gcd_num), lcm_denom
@@ -386,10 +541,7 @@ class PolynomialModule(Module):
         :param b: делитель
         :returns: частное
         """
-        if all(
-            self.integer_module.sign_determination(coef.numerator) == 0
-            for coef in b.coefficients
-        ):
+        if self._is_zero(b):
             raise ValueError("Деление на нулевой полином")
 
         deg_a = self.degree(a)
@@ -403,12 +555,17 @@ class PolynomialModule(Module):
             self._create_rational(0) for _ in range(deg_a - deg_b + 1)
         ]
 
-        while self.degree(remainder) >= deg_b:
+        lead_div = self.leading_coefficient(b)
+        budget = current_budget()
+        # Нулевой остаток имеет степень 0, поэтому при делении на константу
+        # цикл нужно прерывать явно
+        while self.degree(remainder) >= deg_b and not self._is_zero(remainder):
+            if budget is not None:
+                budget.check(self._size(remainder))
             current_deg_rem = self.degree(remainder)
             current_deg_div = deg_b
 
             lead_rem = self.leading_coefficient(remainder)
-            lead_div = self.leading_coefficient(b)
 
             coef = self.rational_module.division(lead_rem, lead_div)
             shift = current_deg_rem - current_deg_div
@@ -430,10 +587,7 @@ class PolynomialModule(Module):
         :param b: делитель
         :returns: остаток от деления
         """
-        if all(
-            self.integer_module.sign_determination(coef.numerator) == 0
-            for coef in b.coefficients
-        ):
+        if self._is_zero(b):
             raise ValueError("Деление на нулевой полином")
 
         deg_a = self.degree(a)
@@ -458,11 +612,11 @@ class PolynomialModule(Module):
         """
         a_copy = a.copy()
         b_copy = b.copy()
+        budget = current_budget()
 
-        while self.degree(b_copy) >= 0 and not all(
-            self.integer_module.sign_determination(coef.numerator) == 0
-            for coef in b_copy.coefficients
-        ):
+        while not self._is_zero(b_copy):
+            if budget is not None:
+                budget.check(max(self._size(a_copy), self._size(b_copy)))
             temp = self.modulus(a_copy, b_copy)
             a_copy = b_copy
             b_copy = temp
@@ -512,109 +666,373 @@ class PolynomialModule(Module):
 
         return result
 
-    def call(self, identifier: Identifier, args: list[str]) -> object:
-        """
-        Вызов метода по идентификатору
-
-        :param identifier: идентификатор метода
-        :param args: аргументы метода
-        :returns: результат выполнения метода
-        """
-        match identifier:
-            case Identifier.ADD_PP_P:
-                ensure_args(identifier, args, 2)
-                a = Polynomial.from_str(args[0])
-                b = Polynomial.from_str(args[1])
-                return self.addition(a, b)
-
-            case Identifier.SUB_PP_P:
-                ensure_args(identifier, args, 2)
-                a = Polynomial.from_str(args[0])
-                b = Polynomial.from_str(args[1])
-                return self.subtraction(a, b)
-
-            case Identifier.MUL_PQ_P:
-                ensure_args(identifier, args, 2)
-                p = Polynomial.from_str(args[0])
-                q = RationalNumber.from_str(args[1])
-                return self.multiply_by_rational(p, q)
-
-            case Identifier.MUL_Pxk_P:
-                ensure_args(identifier, args, 2)
-                p = Polynomial.from_str(args[0])
-                k = int(args[1])
-                return self.multiply_by_x_power(p, k)
-
-            case Identifier.LED_P_Q:
-                ensure_args(identifier, args, 1)
-                p = Polynomial.from_str(args[0])
-                return self.leading_coefficient(p)
-
-            case Identifier.DEG_P_N:
-                ensure_args(identifier, args, 1)
-                p = Polynomial.from_str(args[0])
-                return self.degree(p)
-
-            case Identifier.FAC_P_Q:
-                ensure_args(identifier, args, 1)
-                p = Polynomial.from_str(args[0])
-                return self.factorize_coefficients(p)
-
-            case Identifier.MUL_PP_P:
-                ensure_args(identifier, args, 2)
-                a = Polynomial.from_str(args[0])
-                b = Polynomial.from_str(args[1])
-                return self.multiplication(a, b)
-
-            case Identifier.DIV_PP_P:
-                ensure_args(identifier, args, 2)
-                a = Polynomial.from_str(args[0])
-                b = Polynomial.from_str(args[1])
-                return self.division(a, b)
-
-            case Identifier.MOD_PP_P:
-                ensure_args(identifier, args, 2)
-                a = Polynomial.from_str(args[0])
-                b = Polynomial.from_str(args[1])
-                return self.modulus(a, b)
-
-            case Identifier.GCF_PP_P:
-                ensure_args(identifier, args, 2)
-                a = Polynomial.from_str(args[0])
-                b = Polynomial.from_str(args[1])
-                return self.gcd(a, b)
-
-            case Identifier.DER_P_P:
-                ensure_args(identifier, args, 1)
-                p = Polynomial.from_str(args[0])
-                return self.derivative(p)
-
-            case Identifier.NMR_P_P:
-                ensure_args(identifier, args, 1)
-                p = Polynomial.from_str(args[0])
-                return self.remove_multiples(p)
-
-            case _:
-                raise UnknownIdentifierError(identifier)
-
-    def methods(self) -> set[Identifier]:
-        """
-        Получение множества идентификаторов методов
-
-        :returns: множество идентификаторов методов модуля
+    def _to_integer_coefficients(
+        self, p: Polynomial
+    ) -> tuple[RationalNumber, list[int]]:
+        """
+        Представление многочлена в виде c * f, где c — рациональное число, а
+        f — примитивный многочлен с целыми коэффициентами и положительным
+        старшим коэффициентом (вычисляется один раз и кэшируется в многочлене)
+
+        :param p: ненулевой многочлен
+        :returns: пара (c, коэффициенты f от младших к старшим)
+        """
+        c, coefficients = p.cached("primitive", lambda: self._primitive(p))
+        return RationalNumber(c.numerator, c.denominator), list(coefficients)
+
+    def _primitive(self, p: Polynomial) -> tuple[RationalNumber, list[int]]:
+        """
+        Вычисление результата `_to_integer_coefficients`
+
+        :param p: ненулевой многочлен
+        :returns: пара (c, коэффициенты f от младших к старшим)
+        """
+        factor = self.factorize_coefficients(p)
+        numerator = int(factor.numerator)
+        denominator = int(factor.denominator)
+
+        coefficients = [
+            int(coef.numerator) * (denominator // int(coef.denominator)) // numerator
+            for coef in p.coefficients
+        ]
+        c, coefficients = intpoly.primitive(intpoly.strip(coefficients))
+
+        numerator *= c
+        sign = 1 if numerator < 0 else 0
+        return (
+            self.rational_module.reduce_fraction(
+                RationalNumber(
+                    Integer(sign=sign, natural=NaturalNumber(abs(numerator))),
+                    NaturalNumber(denominator),
+                )
+            ),
+            coefficients,
+        )
+
+    def primitive_part(self, p: Polynomial) -> Polynomial:
+        """
+        Примитивная часть многочлена: многочлен с целыми взаимно простыми
+        коэффициентами и положительным старшим коэффициентом, равный p с
+        точностью до числового множителя
+
+        :param p: ненулевой многочлен
+        :returns: примитивная часть
+        """
+        _, coefficients = self._to_integer_coefficients(p)
+        return Polynomial(coefficients)
+
+    def _from_fraction(self, r: Fraction) -> RationalNumber:
+        """
+        Преобразование дроби Python в рациональное число
+
+        :param r: дробь
+        :returns: рациональное число
+        """
+        return RationalNumber(Integer(r.numerator), NaturalNumber(r.denominator))
+
+    def _to_scaled_integers(self, p: Polynomial) -> tuple[list[int], int]:
+        """
+        Представление многочлена в виде F / d, где F имеет целые коэффициенты
+
+        :param p: многочлен
+        :returns: пара (коэффициенты F, натуральное d)
+        """
+        fractions = [
+            Fraction(int(coef.numerator), int(coef.denominator))
+            for coef in p.coefficients
+        ]
+        d = lcm(*(r.denominator for r in fractions))
+        return intpoly.strip([int(r * d) for r in fractions]), d
+
+    def _from_scaled_integers(self, coefficients: list[int], d: int) -> Polynomial:
+        """
+        Многочлен F / d по целым коэффициентам F
+
+        :param coefficients: коэффициенты F от младших к старшим
+        :param d: натуральный знаменатель
+        :returns: многочлен
+        """
+        return Polynomial(
+            [self._from_fraction(Fraction(c, d)) for c in coefficients]
+            or [self._create_rational(0)]
+        )
+
+    def factorization(self, p: Polynomial) -> Factorization:
+        """
+        Разложение многочлена на неприводимые над Q множители
+
+        Многочлен приводится к примитивному с целыми коэффициентами,
+        раскладывается на бесквадратные множители, каждый из которых
+        раскладывается по простому модулю (алгоритм Кантора — Цассенхауза),
+        после чего разложение поднимается по Гензелю и множители собираются
+        в делители над Z.
+
+        :param p: многочлен
+        :returns: разложение на неприводимые множители
+        """
+        if self.degree(p) <= 0:
+            return Factorization(self.leading_coefficient(p), [])
+
+        content, coefficients = self._to_integer_coefficients(p)
+        factors = [
+            (Polynomial(factor), multiplicity)
+            for factor, multiplicity in intpoly.factor(coefficients)
+        ]
+        return Factorization(content, factors)
+
+    def rational_roots(self, p: Polynomial) -> list[RationalNumber]:
+        """
+        Рациональные корни многочлена
+
+        Многочлен приводится к примитивному с целыми коэффициентами (см.
+        `factorize_coefficients`), после чего корни ищутся у его бесквадратной
+        части. Знаменатель корня должен делить старший коэффициент, а числитель
+        — свободный член, что позволяет отбросить большинство кандидатов без
+        вычисления значения многочлена.
+
+        :param p: ненулевой многочлен
+        :returns: различные рациональные корни в порядке возрастания
+        """
+        if self.degree(p) == 0:
+            if self.integer_module.sign_determination(p.coefficients[0].numerator) == 0:
+                raise ValueError("Корнем нулевого многочлена является любое число")
+            return []
+
+        _, coefficients = self._to_integer_coefficients(p)
+        return [self._from_fraction(r) for r in intpoly.rational_roots(coefficients)]
+
+    def real_root_intervals(self, p: Polynomial) -> list[Interval]:
+        """
+        Изоляция вещественных корней многочлена
+
+        Для бесквадратной части многочлена применяется метод Декарта
+        (Винсент — Коллинз — Акритас): интервал делится пополам, пока правило
+        знаков Декарта, применённое к многочлену после сдвига Тейлора, не
+        покажет 0 или 1 корень.
+
+        :param p: ненулевой многочлен
+        :returns: отрезки с рациональными концами в порядке возрастания, каждый
+            из которых содержит ровно один различный корень; если концы отрезка
+            совпадают, корень равен этому значению, иначе лежит строго внутри
+        """
+        if self.degree(p) == 0:
+            if self.integer_module.sign_determination(p.coefficients[0].numerator) == 0:
+                raise ValueError("Корнем нулевого многочлена является любое число")
+            return []
+
+        _, coefficients = self._to_integer_coefficients(p)
+        squarefree = intpoly.squarefree_part(coefficients)
+        return [
+            Interval(self._from_fraction(a), self._from_fraction(b))
+            for a, b in intpoly.real_root_intervals(squarefree)
+        ]
+
+    def _content_fraction(self, p: Polynomial) -> tuple[Fraction, list[int]]:
+        """
+        То же, что `_to_integer_coefficients`, но числовой множитель
+        возвращается в виде дроби Python
+
+        :param p: ненулевой многочлен
+        :returns: пара (числовой множитель, коэффициенты примитивной части)
+        """
+        content, coefficients = self._to_integer_coefficients(p)
+        return Fraction(int(content.numerator), int(content.denominator)), coefficients
+
+    def _size(self, p: Polynomial) -> int:
+        """
+        Размер многочлена в десятичных цифрах (сумма цифр числителей и
+        знаменателей коэффициентов) для проверки ограничений вызова
+
+        :param p: многочлен
+        :returns: размер
+        """
+        return sum(
+            len(c.numerator.natural.value) + len(c.denominator.value)
+            for c in p.coefficients
+        )
+
+    def _is_zero(self, p: Polynomial) -> bool:
+        """
+        Проверка многочлена на равенство нулю
+
+        :param p: многочлен
+        :returns: True, если многочлен нулевой
+        """
+        return self.degree(p) == 0 and (
+            self.integer_module.sign_determination(p.coefficients[0].numerator) == 0
+        )
+
+    def resultant(self, a: Polynomial, b: Polynomial) -> RationalNumber:
+        """
+        Результант многочленов
+
+        Многочлены приводятся к примитивным с целыми коэффициентами:
+        res(c·A, d·B) = c^deg(B) · d^deg(A) · res(A, B). Результант
+        примитивных частей вычисляется через последовательность
+        субрезультантов, а при большой степени или больших коэффициентах —
+        по модулям нескольких простых чисел с восстановлением по китайской
+        теореме об остатках.
+
+        :param a: первый многочлен
+        :param b: второй многочлен
+        :returns: результант
+        """
+        if self._is_zero(a) or self._is_zero(b):
+            return self._create_rational(0)
+
+        content_a, f = self._content_fraction(a)
+        content_b, g = self._content_fraction(b)
+        value = (
+            content_a ** intpoly.degree(g)
+            * content_b ** intpoly.degree(f)
+            * intpoly.resultant(f, g)
+        )
+        return self._from_fraction(value)
+
+    def discriminant(self, p: Polynomial) -> RationalNumber:
+        """
+        Дискриминант многочлена: (-1)^(n(n-1)/2) · res(p, p') / lc(p)
+
+        :param p: многочлен степени не меньше 1
+        :returns: дискриминант
+        """
+        n = self.degree(p)
+        if n < 1:
+            raise ValueError("Дискриминант определён для многочленов степени не меньше 1")
+
+        content, f = self._content_fraction(p)
+        value = intpoly.resultant(f, intpoly.derivative(f)) // f[-1]
+        if n * (n - 1) // 2 % 2:
+            value = -value
+        return self._from_fraction(content ** (2 * n - 2) * value)
+
+    def subresultants(self, a: Polynomial, b: Polynomial) -> list[Polynomial]:
+        """
+        Последовательность субрезультантов многочленов
+
+        Первые два элемента — сами многочлены (в порядке убывания степени),
+        далее — субрезультанты S_j, вычисленные без дробей. Последний
+        ненулевой элемент пропорционален НОД многочленов.
+
+        :param a: первый многочлен
+        :param b: второй многочлен
+        :returns: последовательность многочленов
+        """
+        if self.degree(a) < self.degree(b):
+            a, b = b, a
+        if self._is_zero(b):
+            return [a.copy()] if not self._is_zero(a) else []
+
+        content_a, f = self._content_fraction(a)
+        content_b, g = self._content_fraction(b)
+        n = intpoly.degree(f)
+        m = intpoly.degree(g)
+        chain, _ = intpoly.subresultants(f, g)
+
+        # S_j однороден степени m - j по коэффициентам a и n - j по коэффициентам b
+        result = [a.copy(), b.copy()]
+        for previous, current in zip(chain[1:], chain[2:]):
+            j = intpoly.degree(previous) - 1
+            factor = content_a ** (m - j) * content_b ** (n - j)
+            result.append(
+                Polynomial([self._from_fraction(factor * c) for c in current])
+            )
+        return result
+
+    def composition(self, a: Polynomial, b: Polynomial) -> Polynomial:
+        """
+        Композиция многочленов a(b(x))
+
+        Если b = B / d, где B имеет целые коэффициенты, то
+        a(b) = d^(-n) · sum(a_i d^(n-i) B^i), n = deg a, поэтому вычисления
+        сводятся к композиции многочленов с целыми коэффициентами (см.
+        `intpoly.compose`).
+
+        :param a: внешний многочлен
+        :param b: внутренний многочлен
+        :returns: многочлен a(b(x))
+        """
+        n = self.degree(a)
+        inner, d = self._to_scaled_integers(b)
+        outer = [
+            Fraction(int(coef.numerator), int(coef.denominator)) * d ** (n - i)
+            for i, coef in enumerate(a.coefficients)
+        ]
+        denominator = lcm(*(r.denominator for r in outer))
+        outer = intpoly.strip([int(r * denominator) for r in outer])
+
+        return self._from_scaled_integers(
+            intpoly.compose(outer, inner), denominator * d**n
+        )
+
+    def taylor_shift(self, p: Polynomial, q: RationalNumber) -> Polynomial:
+        """
+        Сдвиг аргумента многочлена p(x + q)
+
+        При q = r / s многочлен h(y) = s^n · p(y / s) имеет целые
+        коэффициенты (после домножения на общий знаменатель), и
+        p(x + q) = s^(-n) · h(s·x + r), поэтому достаточно целочисленного
+        сдвига h на r.
+
+        :param p: многочлен
+        :param q: величина сдвига
+        :returns: многочлен p(x + q)
+        """
+        coefficients, d = self._to_scaled_integers(p)
+        r = int(q.numerator)
+        s = int(q.denominator)
+        n = intpoly.degree(coefficients)
+
+        h = [c * s ** (n - i) for i, c in enumerate(coefficients)]
+        h = intpoly.taylor_shift(h, r)
+        h = [c * s**i for i, c in enumerate(h)]
+        return self._from_scaled_integers(h, d * s ** max(n, 0))
+
+    def power(self, p: Polynomial, k: int) -> Polynomial:
+        """
+        Возведение многочлена в натуральную степень k
+
+        При p = F / d, где F имеет целые коэффициенты, p^k = F^k / d^k, и
+        степень вычисляется над целыми коэффициентами (см. `intpoly.power`).
+
+        :param p: многочлен
+        :param k: показатель степени
+        :returns: многочлен p^k
+        """
+        coefficients, d = self._to_scaled_integers(p)
+        return self._from_scaled_integers(intpoly.power(coefficients, k), d**k)
+
+    def functions(self) -> dict[Identifier, Function]:
+        """
+        Описание функций модуля
+
+        :returns: словарь «идентификатор → метод и типы аргументов»
         """
         return {
-            Identifier.ADD_PP_P,
-            Identifier.SUB_PP_P,
-            Identifier.MUL_PQ_P,
-            Identifier.MUL_Pxk_P,
-            Identifier.LED_P_Q,
-            Identifier.DEG_P_N,
-            Identifier.FAC_P_Q,
-            Identifier.MUL_PP_P,
-            Identifier.DIV_PP_P,
-            Identifier.MOD_PP_P,
-            Identifier.GCF_PP_P,
-            Identifier.DER_P_P,
-            Identifier.NMR_P_P,
+            Identifier.ADD_PP_P: Function(self.addition, Polynomial, Polynomial),
+            Identifier.SUB_PP_P: Function(self.subtraction, Polynomial, Polynomial),
+            Identifier.MUL_PQ_P: Function(
+                self.multiply_by_rational, Polynomial, RationalNumber
+            ),
+            Identifier.MUL_Pxk_P: Function(self.multiply_by_x_power, Polynomial, int),
+            Identifier.LED_P_Q: Function(self.leading_coefficient, Polynomial),
+            Identifier.DEG_P_N: Function(self.degree, Polynomial),
+            Identifier.FAC_P_Q: Function(self.factorize_coefficients, Polynomial),
+            Identifier.MUL_PP_P: Function(self.multiplication, Polynomial, Polynomial),
+            Identifier.DIV_PP_P: Function(self.division, Polynomial, Polynomial),
+            Identifier.MOD_PP_P: Function(self.modulus, Polynomial, Polynomial),
+            Identifier.GCF_PP_P: Function(self.gcd, Polynomial, Polynomial),
+            Identifier.DER_P_P: Function(self.derivative, Polynomial),
+            Identifier.NMR_P_P: Function(self.remove_multiples, Polynomial),
+            Identifier.FCT_P_P: Function(self.factorization, Polynomial),
+            Identifier.RRT_P_Q: Function(self.rational_roots, Polynomial),
+            Identifier.ISO_P_I: Function(self.real_root_intervals, Polynomial),
+            Identifier.RES_PP_Q: Function(self.resultant, Polynomial, Polynomial),
+            Identifier.DSC_P_Q: Function(self.discriminant, Polynomial),
+            Identifier.SRS_PP_P: Function(self.subresultants, Polynomial, Polynomial),
+            Identifier.CMP_PP_P: Function(self.composition, Polynomial, Polynomial),
+            Identifier.SHF_PQ_P: Function(
+                self.taylor_shift, Polynomial, RationalNumber
+            ),
+            Identifier.POW_Pk_P: Function(self.power, Polynomial, int),
         }
@@ -7,11 +7,8 @@
 - Шарапов Даниил <sharapowdanya@gmail.com>
 """
 
-from typing import Any
-
-from hestia.common.exceptions import UnknownIdentifierError
-from hestia.common.types import Identifier, Module
-from hestia.common.utils import ensure_args
+from hestia.common.registry import Function, RegistryModule
+from hestia.common.types import Identifier
 from hestia.natural import NaturalNumber, NaturalModule
 from hestia.integer import Integer, IntegerModule
 
@@ -75,7 +72,7 @@ class RationalNumber:
         return str(self) == str(other)
 
 
-class RationalModule(Module):
+class RationalModule(RegistryModule):
     def __init__(self, natural_module: NaturalModule, integer_module: IntegerModule):
         """
         Инициализация модуля рациональных чисел.
@@ -201,7 +198,7 @@ class RationalModule(Module):
         )
 
         denominator = self.natural_module.multiplication(
-            q1.denominator, self.integer_module.integer_to_natural(q2.numerator)
+            q1.denominator, self.integer_module.absolute_value(q2.numerator)
         )
 
         if self.integer_module.sign_determination(q2.numerator) == 1:
@@ -209,63 +206,55 @@ class RationalModule(Module):
 
         return self.reduce_fraction(RationalNumber(numerator, denominator))
 
-    def call(self, identifier: Identifier, args: list[str]) -> Any:
-        match identifier:
-            case Identifier.RED_Q_Q:
-                ensure_args(identifier, args, 1)
-                q = RationalNumber.from_str(args[0])
-                return self.reduce_fraction(q)
-
-            case Identifier.INT_Q_B:
-                ensure_args(identifier, args, 1)
-                q = RationalNumber.from_str(args[0])
-                return self.rational_to_integer_check(q)
-
-            case Identifier.TRANS_Z_Q:
-                ensure_args(identifier, args, 1)
-                z = Integer.from_str(args[0])
-                return self.integer_to_rational(z)
-
-            case Identifier.TRANS_Q_Z:
-                ensure_args(identifier, args, 1)
-                q = RationalNumber.from_str(args[0])
-                return self.rational_to_integer(q)
-
-            case Identifier.ADD_QQ_Q:
-                ensure_args(identifier, args, 2)
-                q1 = RationalNumber.from_str(args[0])
-                q2 = RationalNumber.from_str(args[1])
-                return self.addition(q1, q2)
-
-            case Identifier.SUB_QQ_Q:
-                ensure_args(identifier, args, 2)
-                q1 = RationalNumber.from_str(args[0])
-                q2 = RationalNumber.from_str(args[1])
-                return self.subtraction(q1, q2)
-
-            case Identifier.MUL_QQ_Q:
-                ensure_args(identifier, args, 2)
-                q1 = RationalNumber.from_str(args[0])
-                q2 = RationalNumber.from_str(args[1])
-                return self.multiplication(q1, q2)
-
-            case Identifier.DIV_QQ_Q:
-                ensure_args(identifier, args, 2)
-                q1 = RationalNumber.from_str(args[0])
-                q2 = RationalNumber.from_str(args[1])
-                return self.division(q1, q2)
-
-            case _:
-                raise UnknownIdentifierError(identifier)
-
-    def methods(self) -> set[Identifier]:
+    def power(self, q: RationalNumber, k: int) -> RationalNumber:
+        """
+        Q-9. Возведение дроби в целую степень k.
+        Дробь сокращается один раз, после чего числитель и знаменатель
+        возводятся в степень независимо: степени взаимно простых чисел
+        взаимно просты, поэтому промежуточные сокращения не нужны.
+        """
+        q = self.reduce_fraction(q)
+
+        if k < 0:
+            if self.integer_module.sign_determination(q.numerator) == 0:
+                raise ZeroDivisionError("Деление на ноль недопустимо!")
+
+            numerator = self.integer_module.natural_to_integer(q.denominator)
+            if self.integer_module.sign_determination(q.numerator) == 1:
+                numerator = self.integer_module.multiply_by_minus_one(numerator)
+
+            denominator = self.integer_module.absolute_value(q.numerator)
+            q = RationalNumber(numerator, denominator)
+            k = -k
+
+        numerator = self.integer_module.power(q.numerator, k)
+        denominator = self.natural_module.power(q.denominator, k)
+
+        return RationalNumber(numerator, denominator)
+
+    def functions(self) -> dict[Identifier, Function]:
+        """
+        Описание функций модуля: метод и типы аргументов для каждого
+        идентификатора.
+        """
         return {
-            Identifier.RED_Q_Q,
-            Identifier.INT_Q_B,
-            Identifier.TRANS_Z_Q,
-            Identifier.TRANS_Q_Z,
-            Identifier.ADD_QQ_Q,
-            Identifier.SUB_QQ_Q,
-            Identifier.MUL_QQ_Q,
-            Identifier.DIV_QQ_Q,
+            Identifier.RED_Q_Q: Function(self.reduce_fraction, RationalNumber),
+            Identifier.INT_Q_B: Function(
+                self.rational_to_integer_check, RationalNumber
+            ),
+            Identifier.TRANS_Z_Q: Function(self.integer_to_rational, Integer),
+            Identifier.TRANS_Q_Z: Function(self.rational_to_integer, RationalNumber),
+            Identifier.ADD_QQ_Q: Function(
+                self.addition, RationalNumber, RationalNumber
+            ),
+            Identifier.SUB_QQ_Q: Function(
+                self.subtraction, RationalNumber, RationalNumber
+            ),
+            Identifier.MUL_QQ_Q: Function(
+                self.multiplication, RationalNumber, RationalNumber
+            ),
+            Identifier.DIV_QQ_Q: Function(
+                self.division, RationalNumber, RationalNumber
+            ),
+            Identifier.POW_Qk_Q: Function(self.power, RationalNumber, int),
         }
@@ -0,0 +1,52 @@
+"""
+Тесты пакетного режима (`hestia.app.batch`).
+"""
+
+import io
+import multiprocessing
+import os
+import unittest
+from unittest import mock
+
+from hestia.app import batch
+
+process_line = batch.process_line
+
+
+def _crashing_process_line(module_group, number, line, radix=10, limits=None):
+    """Аварийно завершает процесс на строке `CRASH`"""
+    if line.strip() == "CRASH":
+        os._exit(1)
+    return process_line(module_group, number, line, radix, limits)
+
+
+@unittest.skipUnless(
+    multiprocessing.get_start_method() == "fork",
+    "подмена функции передаётся процессам пула только при fork",
+)
+class RunBatchParallelTest(unittest.TestCase):
+    def run_batch(self, lines, **kwargs):
+        out, err = io.StringIO(), io.StringIO()
+        with mock.patch.object(batch, "process_line", _crashing_process_line):
+            status = batch.run_batch_parallel(lines, 2, out, err, **kwargs)
+        return status, out.getvalue().splitlines(), err.getvalue().splitlines()
+
+    def test_crash_outside_head_chunk(self):
+        lines = [f"N-4 {i} 1" for i in range(1, 13)]
+        lines[6] = "CRASH"
+        status, out, err = self.run_batch(lines, chunk_size=4)
+        expected = [str(i + 1) for i in range(1, 13)]
+        expected[6] = ""
+        self.assertEqual(out, expected)
+        self.assertEqual(err, ["7: Процесс-обработчик аварийно завершился"])
+        self.assertEqual(status, batch.ExitCode.INTERNAL_ERROR)
+
+    def test_crash_in_head_chunk(self):
+        lines = ["N-4 1 1", "CRASH", "N-4 2 1", "N-4 3 1", "N-4 4 1"]
+        status, out, err = self.run_batch(lines, chunk_size=2)
+        self.assertEqual(out, ["2", "", "3", "4", "5"])
+        self.assertEqual(err, ["2: Процесс-обработчик аварийно завершился"])
+
+
+if __name__ == "__main__":
+    unittest.main()
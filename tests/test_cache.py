@@ -0,0 +1,52 @@
+"""
+Тесты кэша результатов вызовов (`hestia.app.cache`).
+"""
+
+import unittest
+
+from hestia.app.cache import CachedModuleGroup, canonical_arg
+from hestia.app.runner import build_module_group, execute, format_result
+
+
+class CanonicalArgTest(unittest.TestCase):
+    def test_integers(self):
+        self.assertEqual(canonical_arg("007"), "7")
+        self.assertEqual(canonical_arg("-007"), "-7")
+        self.assertEqual(canonical_arg("-0"), "0")
+
+    def test_fractions_are_not_reduced(self):
+        self.assertEqual(canonical_arg("2/4"), "2/4")
+        self.assertEqual(canonical_arg("-02/004"), "-2/4")
+        self.assertEqual(canonical_arg("-0/05"), "0/5")
+        self.assertNotEqual(canonical_arg("1/2"), canonical_arg("2/4"))
+
+
+class CachedModuleGroupTest(unittest.TestCase):
+    def test_unreduced_fractions_are_cached_separately(self):
+        # Многочлены хранят коэффициенты несокращёнными, поэтому `1/2` и
+        # `2/4` дают разные результаты и не должны попадать в одну запись
+        calls = [
+            ("P-5", ["1/2"]),
+            ("P-5", ["2/4"]),
+            ("P-4", ["1/2", "0"]),
+            ("P-4", ["2/4", "0"]),
+        ]
+        group = build_module_group()
+        cache = CachedModuleGroup(build_module_group(), 10)
+        for function, args in calls:
+            with self.subTest(function=function, args=args):
+                self.assertEqual(
+                    format_result(execute(cache, function, args)),
+                    format_result(execute(group, function, args)),
+                )
+        self.assertEqual(cache.stats.hits, 0)
+
+    def test_equivalent_integers_share_entry(self):
+        cache = CachedModuleGroup(build_module_group(), 10)
+        execute(cache, "N-4", ["007", "2"])
+        self.assertEqual(format_result(execute(cache, "N-4", ["7", "2"])), "9")
+        self.assertEqual(cache.stats.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Тесты возведения в степень (N-15, N-16, Z-11, Q-9).
+"""
+
+import sys
+import time
+import unittest
+
+from hestia.app.runner import CallError, build_module_group, execute, format_result
+
+
+class PowerTest(unittest.TestCase):
+    def setUp(self):
+        self.group = build_module_group()
+        # Ожидаемые значения переводятся в строку встроенным str
+        self.addCleanup(sys.set_int_max_str_digits, sys.get_int_max_str_digits())
+        sys.set_int_max_str_digits(0)
+
+    def call(self, function, *args):
+        return format_result(execute(self.group, function, list(args)))
+
+    def test_large_exponent(self):
+        start = time.perf_counter()
+        self.assertEqual(self.call("POW_Nk_N", "3", "20000"), str(3**20000))
+        self.assertEqual(self.call("POW_Zk_Z", "-3", "20001"), str((-3) ** 20001))
+        self.assertEqual(
+            self.call("POW_Qk_Q", "-2/3", "5001"), f"-{2**5001}/{3**5001}"
+        )
+        self.assertLess(time.perf_counter() - start, 2)
+
+    def test_large_modular_exponent(self):
+        m = 10**99 + 289
+        k = 2**300 - 1
+        start = time.perf_counter()
+        self.assertEqual(
+            self.call("POWM_NNN_N", "7", str(k), str(m)), str(pow(7, k, m))
+        )
+        self.assertLess(time.perf_counter() - start, 1)
+
+    def test_edge_cases(self):
+        self.assertEqual(self.call("POW_Nk_N", "0", "0"), "1")
+        self.assertEqual(self.call("POWM_NNN_N", "5", "0", "1"), "0")
+        with self.assertRaises(CallError):
+            self.call("POWM_NNN_N", "5", "2", "0")
+
+
+if __name__ == "__main__":
+    unittest.main()
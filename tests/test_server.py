@@ -0,0 +1,87 @@
+"""
+Тесты серверного режима (`hestia.app.server`).
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from hestia.app.runner import ExitCode
+from hestia.app.server import LINE_LIMIT, Server
+
+
+async def _exchange(server, requests):
+    """Запускает сервер на Unix-сокете и возвращает ответы на запросы"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "hestia.sock")
+        serving = asyncio.create_task(server.serve(None, None, path))
+        while not os.path.exists(path):
+            await asyncio.sleep(0.01)
+        reader, writer = await asyncio.open_unix_connection(path, limit=LINE_LIMIT)
+        for request in requests:
+            writer.write(request.encode() + b"\n")
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in requests]
+        writer.close()
+        serving.cancel()
+        await asyncio.gather(serving, return_exceptions=True)
+    return sorted(responses, key=lambda r: str(r["id"]))
+
+
+class ServerTest(unittest.TestCase):
+    def exchange(self, requests, timeout=None, jobs=1):
+        return asyncio.run(_exchange(Server(jobs, timeout, 16), requests))
+
+    def test_result(self):
+        responses = self.exchange(['{"id": 1, "function": "N-4", "args": ["2", "3"]}'])
+        self.assertEqual(responses, [{"id": 1, "result": "5"}])
+
+    def test_error_keeps_id(self):
+        responses = self.exchange(
+            [
+                '{"id": 6, "function": "N-4", "args": [1, 2]}',
+                '{"id": 7, "args": ["1"]}',
+                '{"id": 8, "function": "N-4", "args": ["1"]}',
+            ]
+        )
+        self.assertEqual([r["id"] for r in responses], [6, 7, 8])
+        self.assertEqual(
+            [r["error"]["code"] for r in responses],
+            [ExitCode.INVALID_ARGS, ExitCode.INVALID_IDENTIFIER, ExitCode.INVALID_ARGS],
+        )
+
+    def test_malformed_request_has_no_id(self):
+        responses = self.exchange(["[6]"])
+        self.assertIsNone(responses[0]["id"])
+        self.assertEqual(responses[0]["error"]["code"], ExitCode.INVALID_ARGS)
+
+    def test_queue_time_is_not_limited(self):
+        # Каждый вызов укладывается во время, но последние ждут свободного
+        # процесса дольше `timeout`
+        requests = [
+            f'{{"id": {i}, "function": "N-21", "args": ["100000"]}}' for i in range(4)
+        ]
+        requests.append('{"id": 4, "function": "N-4", "args": ["1", "1"]}')
+        responses = self.exchange(requests, timeout=1.5)
+        self.assertEqual([r.get("error") for r in responses], [None] * 5)
+        self.assertEqual(responses[4]["result"], "2")
+
+    def test_overrun_recycles_pool(self):
+        start = time.perf_counter()
+        responses = self.exchange(
+            [
+                '{"id": 1, "function": "N-21", "args": ["1000000"]}',
+                '{"id": 2, "function": "N-4", "args": ["1", "1"]}',
+            ],
+            timeout=0.2,
+        )
+        self.assertEqual(responses[0]["error"]["code"], ExitCode.TIMEOUT)
+        self.assertEqual(responses[1], {"id": 2, "result": "2"})
+        self.assertLess(time.perf_counter() - start, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()